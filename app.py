@@ -1,3 +1,7 @@
+import importlib
+import sys
+import threading
+
 import streamlit as st
 
 # -------------------------------------------------
@@ -10,15 +14,55 @@ st.set_page_config(
 
 
 # -------------------------------------------------
-# IMPORT TAB MODULES
+# IMPORTS
+# -------------------------------------------------
+# Tab modules are imported on first use (see SECTIONS), so a cold process
+# only pays for the section it is asked to show.
+from core import assets, images, profiler, records, watcher
+
+# -------------------------------------------------
+# ASSET CHECK (ONCE PER PROCESS)
+# -------------------------------------------------
+LOGOS = [
+    "assets/logos/upd_logo.png",
+    "assets/logos/institution_logo.png",
+    "assets/logos/lab_logo.png",
+]
+
+def report_broken_assets():
+    try:
+        references = [("app.py", logo) for logo in LOGOS] + list(records.image_references())
+    except FileNotFoundError:
+        references = [("app.py", logo) for logo in LOGOS]
+    assets.report_broken(references)
+
+# In the background: collecting the references parses three workbooks,
+# which a cold process should not pay for before its first paint.
+@st.cache_resource(show_spinner=False)
+def check_assets():
+    thread = threading.Thread(target=report_broken_assets, name="asset-check", daemon=True)
+    thread.start()
+    return thread
+
+check_assets()
+
+# -------------------------------------------------
+# LIVE RELOAD
 # -------------------------------------------------
-from tabs.about import render as about_tab
-from tabs.people import render as people_tab
-from tabs.publications import render as publications_tab
-from tabs.contact import render as contact_tab
-from tabs.tools import render as tools_tab
-from tabs.research import render as research_tab
-from tabs.active_research import render as active_projects_tab
+# One watcher per process re-parses changed workbooks and drops the caches
+# built from them; each open session polls for the change and reruns.
+@st.cache_resource(show_spinner=False)
+def start_watcher():
+    return watcher.start()
+
+start_watcher()
+
+@st.fragment(run_every=watcher.CHECK_INTERVAL)
+def refresh_on_change():
+    seen = st.session_state.setdefault("data_generation", watcher.generation)
+    if seen != watcher.generation:
+        st.session_state["data_generation"] = watcher.generation
+        st.rerun()
 
 # -------------------------------------------------
 # SIDEBAR — AFFILIATIONS
@@ -27,16 +71,12 @@ with st.sidebar:
 
 
     # ---- LOGOS IN ONE ROW ----
-    col1, col2, col3 = st.columns(3)
+    cols = st.columns(len(LOGOS))
 
-    with col1:
-        st.image("assets/logos/upd_logo.png", width=55)
-
-    with col2:
-        st.image("assets/logos/institution_logo.png", width=55)
-
-    with col3:
-        st.image("assets/logos/lab_logo.png", width=55)
+    for col, logo in zip(cols, LOGOS):
+        if assets.exists(logo):
+            with col:
+                st.image(images.variant(logo, 55), width=55)
 
     st.markdown(
         """
@@ -76,39 +116,91 @@ st.markdown(
 )
 
 # -------------------------------------------------
-# TABS
+# SECTIONS
 # -------------------------------------------------
-tabs = st.tabs([
-    "Home",
-    "Research Areas",
-    "Publications",
-    "Active Research",
-    "People",
-    "Tools",
-    "Contact",
-])
-
-# -------------------------------------------------
-# TAB CONTENT
-# -------------------------------------------------
-with tabs[0]:
-    about_tab()
+# Only the selected section's render() runs on a rerun. The selection is
+# mirrored in the URL (?section=publications) so sections can be linked.
+SECTIONS = {
+    "home": ("Home", "tabs.about"),
+    "research": ("Research Areas", "tabs.research"),
+    "publications": ("Publications", "tabs.publications"),
+    "active-research": ("Active Research", "tabs.active_research"),
+    "people": ("People", "tabs.people"),
+    "analytics": ("Analytics", "tabs.analytics"),
+    "tools": ("Tools", "tabs.tools"),
+    "contact": ("Contact", "tabs.contact"),
+}
+DEFAULT_SECTION = "home"
+
+def section_renderer(module_name):
+    # Always through import_module: it waits on the import lock for a
+    # module another session is still importing, which sys.modules does
+    # not. sys.modules only decides whether the import is worth profiling.
+    load = importlib.import_module
+    if module_name not in sys.modules:
+        load = profiler.profiled(f"import:{module_name}")(load)
+    return load(module_name).render
+
+if "section_nav" not in st.session_state:
+    requested = st.query_params.get("section", DEFAULT_SECTION)
+    st.session_state["section_nav"] = (
+        requested if requested in SECTIONS else DEFAULT_SECTION
+    )
 
-with tabs[4]:
-    people_tab()
+# ---- TAB-STYLE NAVIGATION BAR ----
+st.markdown(
+    """
+    <style>
+    .st-key-section_bar div[role="radiogroup"] {
+        gap: 0;
+        flex-wrap: wrap;
+        border-bottom: 1px solid rgba(49, 51, 63, 0.2);
+    }
+
+    .st-key-section_bar label[data-baseweb="radio"] {
+        margin: 0;
+        padding: 0.45rem 0.9rem 0.55rem;
+        border-bottom: 2px solid transparent;
+        cursor: pointer;
+    }
+
+    .st-key-section_bar label[data-baseweb="radio"] > div:first-child {
+        display: none;
+    }
+
+    .st-key-section_bar label[data-baseweb="radio"]:has(input:checked) {
+        border-bottom-color: #ff4b4b;
+        color: #ff4b4b;
+    }
+    </style>
+    """,
+    unsafe_allow_html=True
+)
 
-with tabs[2]:
-    publications_tab()
+with st.container(key="section_bar"):
+    section = st.radio(
+        "Section",
+        list(SECTIONS),
+        format_func=lambda key: SECTIONS[key][0],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="section_nav",
+    )
 
-with tabs[6]:
-    contact_tab()
+if st.query_params.get("section") != section:
+    st.query_params["section"] = section
 
-with tabs[5]:
-    tools_tab()
+# ?person= opens a profile on the People section only.
+if section != "people" and "person" in st.query_params:
+    del st.query_params["person"]
 
-with tabs[1]:
-    research_tab()
+# -------------------------------------------------
+# SECTION CONTENT
+# -------------------------------------------------
+render_section = section_renderer(SECTIONS[section][1])
+profiler.profiled(f"tab:{section}")(render_section)()
 
-with tabs[3]:
-    active_projects_tab()
+if watcher.ENABLED:
+    refresh_on_change()
 
+profiler.render_panel()
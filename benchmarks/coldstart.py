@@ -0,0 +1,144 @@
+"""Cold-start breakdown: imports and first paint of a fresh process.
+
+Each run starts a new interpreter (python -X importtime) that renders one
+section of app.py through streamlit's AppTest, once parsing the workbooks
+and once with a prebuilt snapshot (python -m core.snapshot), and reports:
+
+    streamlit/pandas/openpyxl/PIL   import time of the package's own modules,
+    core                            "-" if it was never imported
+    tabs                            import of the shown section's tab module,
+                                    including what it pulls in
+    paint                           AppTest.run() of the first render
+    parsed                          workbooks parsed with pandas/openpyxl
+    total                           interpreter start to finished paint
+
+    python -m benchmarks.coldstart
+    python -m benchmarks.coldstart --data bench_data/10k --sections home publications
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGES = ["streamlit", "pandas", "openpyxl", "PIL", "core"]
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+\d+ \| *(\S+)$")
+
+
+# -------------------------------------------------
+# CHILD PROCESS
+# -------------------------------------------------
+def child(section):
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=600)
+    at.query_params["section"] = section
+    paint = time.perf_counter()
+    at.run()
+    end = time.perf_counter()
+
+    from core import catalog, profiler
+
+    print(json.dumps({
+        "paint": round((end - paint) * 1000),
+        "harness": round((paint - start) * 1000),
+        "tabs": sum(e["ms"] for e in profiler.entries if e["name"].startswith("import:")),
+        "parsed": catalog.stats["parse"],
+        "errors": [str(e.value) for e in at.exception],
+    }))
+
+
+# -------------------------------------------------
+# MEASUREMENT
+# -------------------------------------------------
+def _imports(stderr):
+    """ms spent in each package's own modules, from -X importtime output.
+    Self times are summed because modules loaded by importlib (tab modules,
+    pandas' openpyxl reader) get no cumulative line of their own."""
+    own = {}
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            top = match.group(2).split(".")[0]
+            if top in PACKAGES:
+                own[top] = own.get(top, 0) + int(match.group(1)) / 1000
+    return own
+
+
+def run(section, data_dir, snapshot):
+    env = dict(
+        os.environ,
+        NANOTECH_DATA_DIR=str(data_dir),
+        NANOTECH_SNAPSHOT=str(snapshot),
+        NANOTECH_WATCH="0",
+        # For the tab module import timings; the log is thrown away.
+        NANOTECH_PROFILE="1",
+        NANOTECH_PROFILE_LOG=os.devnull,
+    )
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "benchmarks.coldstart", "--child", section],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    total = (time.perf_counter() - start) * 1000
+    lines = [l for l in proc.stdout.splitlines() if l.startswith("{")]
+    if proc.returncode or not lines:
+        raise RuntimeError(f"{section}: child failed\n{proc.stderr[-2000:]}")
+
+    result = json.loads(lines[-1])
+    result.update(_imports(proc.stderr))
+    result["total"] = round(total)
+    return result
+
+
+def _cell(value):
+    if value is None:
+        return "-"
+    return str(round(value)) if isinstance(value, float) else str(value)
+
+
+def main(argv=None):
+    if argv is None and len(sys.argv) > 2 and sys.argv[1] == "--child":
+        return child(sys.argv[2])
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", type=Path, default=ROOT / "data")
+    parser.add_argument("--sections", nargs="+", default=["home", "publications", "people"])
+    parser.add_argument("--json", type=Path, help="also write the report here")
+    args = parser.parse_args(argv)
+
+    data_dir = args.data.resolve()
+    report = []
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = Path(tmp) / "snapshot.pickle"
+        subprocess.run(
+            [sys.executable, "-m", "core.snapshot", "--out", str(snapshot)],
+            cwd=ROOT, env=dict(os.environ, NANOTECH_DATA_DIR=str(data_dir)),
+            check=True, capture_output=True,
+        )
+        for section in args.sections:
+            for mode, path in (("workbooks", Path(tmp) / "none.pickle"), ("snapshot", snapshot)):
+                result = run(section, data_dir, path)
+                report.append({"section": section, "mode": mode, **result})
+
+    columns = ["section", "mode"] + PACKAGES + ["tabs", "paint", "parsed", "total"]
+    print("  ".join(f"{c:>10}" for c in columns))
+    for row in report:
+        print("  ".join(f"{_cell(row.get(c)):>10}" for c in columns))
+        for error in row["errors"]:
+            print(f"    error: {error}")
+    print("\nms; paint and total include the imports made while rendering")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+    return 1 if any(row["errors"] for row in report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""Headless multi-session load test for app.py.
+
+Drives the real app in-process with Streamlit's AppTest: every simulated
+visitor is its own session running one of the SCRIPTS below, and all
+sessions share the process (and therefore the catalog and caches), as
+they would on a single server instance.
+
+    python -m benchmarks.load_test --sessions 16 --rounds 3
+    python -m benchmarks.load_test --data-dir bench_data/10k
+
+Exits with status 1 when a percentile or peak RSS exceeds the limits in
+benchmarks/thresholds.json.
+"""
+import argparse
+import json
+import logging
+import os
+import resource
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_THRESHOLDS = Path(__file__).resolve().parent / "thresholds.json"
+
+
+# -------------------------------------------------
+# VISITOR SCRIPTS
+# -------------------------------------------------
+# Each step is (tab, action). The action receives the AppTest and returns
+# it after queueing a rerun; the rerun is timed and attributed to `tab`.
+def _open(section):
+    return lambda at: at.radio(key="section_nav").set_value(section)
+
+
+def _search(key, text):
+    return lambda at: at.text_input(key=key).input(text)
+
+
+def _toggle_first_tag(key):
+    def action(at):
+        widget = at.multiselect(key=key)
+        return widget.set_value(list(widget.options[:1]))
+    return action
+
+
+def _by_label(elements, label):
+    return next(e for e in elements if e.label == label)
+
+
+def _submit_contact(at):
+    _by_label(at.text_input, "Name").input("Load Test")
+    _by_label(at.text_input, "Email").input("load@test.invalid")
+    _by_label(at.text_area, "Message").input("Benchmark message")
+    return _by_label(at.button, "Send Message").click()
+
+
+SCRIPTS = {
+    "reader": [
+        ("publications", _open("publications")),
+        ("publications", _search("pub_search", "nucl")),
+        ("publications", _search("pub_search", "nucleation cryst")),
+        ("publications", _toggle_first_tag("pub_tag_filter")),
+        ("people", _open("people")),
+    ],
+    "researcher": [
+        ("active-research", _open("active-research")),
+        ("active-research", _search("active_search", "cryst")),
+        ("active-research", _toggle_first_tag("active_tag_filter")),
+        ("analytics", _open("analytics")),
+        ("research", _open("research")),
+    ],
+    "contact": [
+        ("contact", _open("contact")),
+        ("contact", _submit_contact),
+    ],
+}
+
+
+# -------------------------------------------------
+# RUNNER
+# -------------------------------------------------
+def _share_test_globals():
+    """AppTest is written for one run at a time: each run installs a mock
+    Runtime singleton and patches the global.appTest option, and undoes
+    both when it ends, under every other session still running in the
+    process. Set the option for good and keep the latest mock reachable."""
+    from streamlit import config
+    from streamlit.runtime import Runtime
+
+    config.set_option("global.appTest", True)
+
+    latest = []
+
+    def instance(cls):
+        if cls._instance is not None:
+            latest[:] = [cls._instance]
+            return cls._instance
+        if not latest:
+            raise RuntimeError("Runtime hasn't been created!")
+        return latest[0]
+
+    def exists(cls):
+        return cls._instance is not None or bool(latest)
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(exists)
+
+    # Each run also gets a fresh ScriptCache and recompiles app.py, and
+    # compiling on several threads at once trips CPython's AST recursion
+    # check (SystemError). Compile once, under a lock, for every session.
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+
+    compiled = {}
+    compile_lock = threading.Lock()
+    get_bytecode = ScriptCache.get_bytecode
+
+    def shared_bytecode(self, script_path):
+        with compile_lock:
+            if script_path not in compiled:
+                compiled[script_path] = get_bytecode(self, script_path)
+            return compiled[script_path]
+
+    ScriptCache.get_bytecode = shared_bytecode
+
+
+def _check(at, script_name, tab):
+    if at.exception:
+        raise RuntimeError(f"{script_name} ({tab}): {at.exception[0].value}")
+
+
+def _run_session(script_name, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    samples = []
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=timeout)
+
+    start = time.perf_counter()
+    at.run()
+    samples.append(("home", (time.perf_counter() - start) * 1000))
+    _check(at, script_name, "home")
+
+    for tab, action in SCRIPTS[script_name]:
+        pending = action(at)
+        start = time.perf_counter()
+        pending.run()
+        samples.append((tab, (time.perf_counter() - start) * 1000))
+        # The next navigation clears it, so check after every rerun.
+        _check(at, script_name, tab)
+
+    return samples
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def peak_rss_mb():
+    # ru_maxrss is in KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(sessions, rounds, timeout):
+    names = list(SCRIPTS)
+    jobs = [names[i % len(names)] for i in range(sessions * rounds)]
+    per_tab = {}
+    lock = threading.Lock()
+
+    def work(script_name):
+        samples = _run_session(script_name, timeout)
+        with lock:
+            for tab, ms in samples:
+                per_tab.setdefault(tab, []).append(ms)
+
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        for future in [pool.submit(work, name) for name in jobs]:
+            future.result()
+
+    return {
+        tab: {
+            "n": len(times),
+            "p50": round(percentile(times, 50), 1),
+            "p95": round(percentile(times, 95), 1),
+            "p99": round(percentile(times, 99), 1),
+        }
+        for tab, times in sorted(per_tab.items())
+    }
+
+
+def check(report, rss, thresholds):
+    failures = []
+    for tab, stats in report.items():
+        limits = thresholds.get("tabs", {}).get(tab, thresholds.get("default", {}))
+        for key, limit in limits.items():
+            if stats[key] > limit:
+                failures.append(f"{tab} {key} {stats[key]} ms > {limit} ms")
+    limit = thresholds.get("peak_rss_mb")
+    if limit and rss > limit:
+        failures.append(f"peak RSS {rss:.0f} MB > {limit} MB")
+    return failures
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=8, help="concurrent sessions")
+    parser.add_argument("--rounds", type=int, default=2, help="script repetitions per session slot")
+    parser.add_argument("--timeout", type=float, default=60, help="per-rerun timeout (s)")
+    parser.add_argument("--thresholds", type=Path, default=DEFAULT_THRESHOLDS)
+    parser.add_argument("--data-dir", help="workbook directory (default: data/)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    sys.path.insert(0, str(ROOT))
+    if args.data_dir:
+        os.environ["NANOTECH_DATA_DIR"] = str(Path(args.data_dir).resolve())
+    logging.disable(logging.WARNING)
+    _share_test_globals()
+
+    started = time.perf_counter()
+    report = run(args.sessions, args.rounds, args.timeout)
+    rss = peak_rss_mb()
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        print(json.dumps({"tabs": report, "peak_rss_mb": round(rss, 1)}, indent=2))
+    else:
+        print(f"{'tab':<18}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+        for tab, stats in report.items():
+            print(f"{tab:<18}{stats['n']:>6}{stats['p50']:>10}{stats['p95']:>10}{stats['p99']:>10}")
+        print(f"\npeak RSS {rss:.0f} MB, {args.sessions} sessions, {elapsed:.1f} s")
+
+    thresholds = json.loads(args.thresholds.read_text()) if args.thresholds.exists() else {}
+    failures = check(report, rss, thresholds)
+    for failure in failures:
+        print(f"REGRESSION: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""Scaling microbenchmarks for the data hot paths.
+
+Times each stage a tab goes through, against the synthetic workbooks
+written by benchmarks.synthetic, so the growth from 100 to 100k rows is
+visible per stage:
+
+    read      pandas parse of all four workbooks (cold catalog)
+    records   DataFrame -> record tuples for all four workbooks
+    index     BM25F search index build (publications)
+    facets    tag bitmap index build (publications)
+    search    one cold query against the index
+    filter    tag select + live facet counts
+    group     publications grouped by year
+    people    people split into the People tab sections
+    metrics   Home tab statistics (one pass per workbook)
+    links     author -> person linking for publications and projects
+    trends    Analytics pivots for publications and projects
+
+    python -m benchmarks.synthetic --sizes 100 10k
+    python -m benchmarks.microbench --sizes 100 10k
+
+Exits with status 1 when a median exceeds the "micro" limits in
+benchmarks/thresholds.json.
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from itertools import groupby
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_THRESHOLDS = Path(__file__).resolve().parent / "thresholds.json"
+DEFAULT_DATA = ROOT / "bench_data"
+
+QUERIES = ["nucl", "crystallization", "graphene oxide", "santos adsorption", "zzz"]
+STAGES = ["read", "records", "index", "facets", "search", "filter", "group", "people", "metrics", "links", "trends"]
+
+
+# -------------------------------------------------
+# STAGES
+# -------------------------------------------------
+def _timed(samples, stage, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    samples.setdefault(stage, []).append((time.perf_counter() - start) * 1000)
+    return result
+
+
+def _load_all(catalog):
+    for name in catalog.WORKBOOKS:
+        catalog.load(name)
+
+
+def _records_all(records):
+    return (
+        records.publications(),
+        records.projects(),
+        records.people(),
+        records.research_tracks(),
+    )
+
+
+def _search_all(index):
+    for query in QUERIES:
+        index.search(query)
+
+
+def _filter(tag_index):
+    top = sorted(tag_index.values, key=lambda v: -tag_index.masks[v].bit_count())[:2]
+    for mode in ("any", "all"):
+        mask = tag_index.select(top, mode)
+        tag_index.counts(mask)
+
+
+def _group_by_year(pubs):
+    return {year: list(items) for year, items in groupby(pubs, key=lambda p: p.year)}
+
+
+def _metrics_all(metrics):
+    return (metrics.people_metrics(), metrics.publication_metrics(), metrics.project_metrics())
+
+
+def _trends_all(metrics):
+    return (metrics.publication_trends(), metrics.project_trends())
+
+
+def run_size(data_dir, repeat):
+    from core import authors, catalog, facets, metrics, records, search
+    from tabs import people as people_tab
+
+    catalog.DATA_DIR = Path(data_dir)
+    # Time the builds themselves, not a prebuilt snapshot.
+    catalog.USE_SNAPSHOT = False
+    samples = {}
+
+    for _ in range(repeat):
+        catalog.invalidate()
+        _timed(samples, "read", _load_all, catalog)
+        pubs, _, people, _ = _timed(samples, "records", _records_all, records)
+
+        # Built directly rather than through catalog.derived so every
+        # repetition (and every query) starts cold.
+        index = _timed(samples, "index", search.SearchIndex, pubs, search.PUBLICATION_FIELDS)
+        tag_index = _timed(samples, "facets", facets.FacetIndex, pubs)
+        _timed(samples, "search", _search_all, index)
+        samples["search"][-1] /= len(QUERIES)
+        _timed(samples, "filter", _filter, tag_index)
+        _timed(samples, "group", _group_by_year, pubs)
+        _timed(samples, "people", people_tab.group_people, people)
+        _timed(samples, "metrics", _metrics_all, metrics)
+        _timed(samples, "links", authors.links)
+        _timed(samples, "trends", _trends_all, metrics)
+
+    rows = len(pubs)
+    return rows, {
+        stage: round(statistics.median(samples[stage]), 2) for stage in STAGES
+    }
+
+
+def check(report, thresholds):
+    failures = []
+    limits = thresholds.get("micro", {})
+    for size, (_, stages) in report.items():
+        for stage, limit in limits.get(size, {}).items():
+            if stages.get(stage, 0) > limit:
+                failures.append(f"{size} {stage} {stages[stage]} ms > {limit} ms")
+    return failures
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", default=["100", "10k", "100k"],
+                        help="subdirectories of --data (as written by benchmarks.synthetic)")
+    parser.add_argument("--data", type=Path, default=DEFAULT_DATA)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--thresholds", type=Path, default=DEFAULT_THRESHOLDS)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    data = args.data.resolve()
+    os.chdir(ROOT)
+    sys.path.insert(0, str(ROOT))
+    logging.disable(logging.WARNING)
+
+    report = {}
+    for size in args.sizes:
+        if not (data / size).is_dir():
+            print(f"skipping {size}: {data / size} not found "
+                  f"(python -m benchmarks.synthetic --sizes {size})", file=sys.stderr)
+            continue
+        report[size] = run_size(data / size, args.repeat)
+
+    if args.json:
+        print(json.dumps(
+            {size: {"rows": rows, "ms": stages} for size, (rows, stages) in report.items()},
+            indent=2,
+        ))
+    else:
+        print(f"{'size':<8}{'rows':>8}" + "".join(f"{s:>10}" for s in STAGES))
+        for size, (rows, stages) in report.items():
+            print(f"{size:<8}{rows:>8}" + "".join(f"{stages[s]:>10}" for s in STAGES))
+        print("\nmedian ms per stage; search is per query")
+
+    thresholds = json.loads(args.thresholds.read_text()) if args.thresholds.exists() else {}
+    failures = check(report, thresholds)
+    for failure in failures:
+        print(f"REGRESSION: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""Synthetic workbook generator for scaling benchmarks.
+
+Writes publications.xlsx, people.xlsx, active_research.xlsx and
+research_tracks.xlsx with the same columns as data/, filled with
+realistic-looking text: Zipf-distributed keywords, multi-author lists
+that reuse a pool of names, abstracts, image references (some valid,
+some missing, most empty).
+
+    python -m benchmarks.synthetic                   # 100, 10k, 100k rows
+    python -m benchmarks.synthetic --sizes 500 --out bench_data
+"""
+import argparse
+import random
+import time
+from pathlib import Path
+
+import pandas as pd
+
+SIZES = {"100": 100, "10k": 10_000, "100k": 100_000}
+DEFAULT_OUT = Path("bench_data")
+
+# -------------------------------------------------
+# VOCABULARY
+# -------------------------------------------------
+TOPICS = [
+    "nucleation", "crystallization", "polymorph", "cocrystal", "graphene oxide",
+    "nanocomposite", "adsorption", "heavy metals", "torrefaction", "bioenergy",
+    "spherical crystallization", "induction time", "glycine", "acetaminophen",
+    "antisolvent", "supersaturation", "membrane", "hydrogel", "chitosan",
+    "response surface", "water treatment", "API recovery", "marine actives",
+    "extraction", "agglomeration", "flowability", "compressibility",
+    "nanoconfinement", "particle size", "kinetics", "solubility", "filtration",
+    "biomass", "pyrolysis", "catalysis", "photocatalysis", "sustainability",
+    "process optimization", "pharmaceutical engineering", "microfluidics",
+]
+WORDS = (
+    "study analysis effect method results approach material solution process "
+    "surface structure performance model experimental sample temperature rate "
+    "concentration phase growth removal synthesis characterization stability "
+    "behavior mechanism application design data significant increase reduced "
+    "improved observed obtained investigated demonstrated proposed optimal"
+).split()
+GIVEN = [
+    "Isaac", "Jem", "Maria", "John", "Ana", "Mark", "Grace", "Paolo", "Lea",
+    "Miguel", "Sofia", "Carlo", "Bea", "Rafael", "Nina", "Allan", "Bryan",
+    "Gerard", "Debora", "Enrico", "Noalle", "Michael", "Hang", "Pasan",
+]
+FAMILY = [
+    "Dela Cruz", "Perez", "Santos", "Reyes", "Garcia", "Mendoza", "Bautista",
+    "Ordoña", "Alamani", "Myerson", "Capellades", "Nadres", "Rodrigues",
+    "Ward", "Nguyen", "Tan", "Lim", "Villanueva", "Castillo", "Aquino",
+]
+JOURNALS = [
+    "Crystal Growth & Design", "ACS Applied Polymer Materials",
+    "Royal Society of Chemistry", "Chemical Engineering Journal",
+    "Journal of Crystal Growth", "Separation and Purification Technology",
+    "Industrial & Engineering Chemistry Research", "Powder Technology",
+    "Philippine Journal of Science", "Bioresource Technology",
+]
+IMAGES = ["bagasse_H2.png", "missing_figure.png"]
+
+
+def _name(rng):
+    initial = rng.choice("ABCDEFGJLMRS")
+    return f"{rng.choice(GIVEN)} {initial} {rng.choice(FAMILY)}"
+
+
+def _keywords(rng, k):
+    # Zipf-like: early topics are far more common.
+    weights = [1 / (i + 1) for i in range(len(TOPICS))]
+    return "; ".join(dict.fromkeys(rng.choices(TOPICS, weights=weights, k=k)))
+
+
+def _sentence(rng, n):
+    words = rng.choices(WORDS + TOPICS, k=n)
+    return " ".join(words).capitalize() + "."
+
+
+def _abstract(rng):
+    return " ".join(_sentence(rng, rng.randint(10, 22)) for _ in range(rng.randint(3, 7)))
+
+
+def _image(rng):
+    roll = rng.random()
+    if roll < 0.05:
+        return rng.choice(IMAGES)
+    return None
+
+
+# -------------------------------------------------
+# TABLES
+# -------------------------------------------------
+def publications(n, rng):
+    rows = []
+    for i in range(n):
+        year = rng.randint(1995, 2025)
+        rows.append({
+            "id": f"pub_{year}_{i:06d}",
+            "year": year,
+            "title": _sentence(rng, rng.randint(6, 16)).rstrip("."),
+            "authors": ", ".join(_name(rng) for _ in range(rng.randint(1, 8))),
+            "keywords": _keywords(rng, rng.randint(2, 5)),
+            "abstract": _abstract(rng),
+            "image": _image(rng),
+            "link": f"https://doi.org/10.{rng.randint(1000, 9999)}/synthetic.{i}",
+            "contact": f"{rng.choice(GIVEN).lower()}@up.edu.ph",
+            "featured": rng.random() < 0.1,
+            "journal": rng.choice(JOURNALS),
+        })
+    return pd.DataFrame(rows)
+
+
+def people(n, rng):
+    roles = [
+        ("Faculty", "Professor", "Current"),
+        ("Student", "MS", "Current"),
+        ("Student", "PhD", "Current"),
+        ("Student", "Undergraduate", "Current"),
+        ("Student", "MS", "Graduated"),
+        ("Student", "Undergraduate", "Graduated"),
+    ]
+    rows = []
+    for i in range(n):
+        role, level, status = rng.choices(roles, weights=[1, 3, 1, 4, 4, 8])[0]
+        rows.append({
+            "id": f"person_{i:06d}",
+            "name": _name(rng),
+            "role": role,
+            "level": level,
+            "status": status,
+            "image": _image(rng),
+            "bio": _sentence(rng, 20) if rng.random() < 0.3 else None,
+            "research": _keywords(rng, rng.randint(1, 3)),
+            "email": f"person{i}@up.edu.ph",
+            "links": f"scholar.google.com/citations?user={i}" if rng.random() < 0.2 else None,
+        })
+    return pd.DataFrame(rows)
+
+
+def active_research(n, rng):
+    rows = []
+    for i in range(n):
+        rows.append({
+            "id": f"ar_{i:06d}",
+            "year": rng.randint(2018, 2026),
+            "title": _sentence(rng, rng.randint(4, 10)).rstrip("."),
+            "researchers": ", ".join(_name(rng) for _ in range(rng.randint(1, 4))),
+            "keywords": _keywords(rng, rng.randint(1, 4)),
+            "description": _abstract(rng),
+            "status": rng.choice(["Ongoing", "Planning", "Data collection", "Writing"]),
+            "link": None,
+            "contact": None,
+            "featured": rng.random() < 0.05,
+        })
+    return pd.DataFrame(rows)
+
+
+def research_tracks(n, rng):
+    icons = [
+        "assets/icons/pharmaceutical_crystallization.png",
+        "assets/icons/api_waste_recovery.png",
+        "assets/icons/marine_actives_extraction.png",
+    ]
+    return pd.DataFrame([
+        {
+            "title": rng.choice(TOPICS).title(),
+            "image_path": rng.choice(icons),
+            "description": _sentence(rng, 25),
+        }
+        for _ in range(n)
+    ])
+
+
+TABLES = {
+    "publications": publications,
+    "people": people,
+    "active_research": active_research,
+    "research_tracks": research_tracks,
+}
+
+
+def generate(out_dir, rows, seed=0):
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for name, build in TABLES.items():
+        rng = random.Random(f"{seed}-{name}-{rows}")
+        build(rows, rng).to_excel(out_dir / f"{name}.xlsx", index=False)
+    return out_dir
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", default=list(SIZES),
+                        help="row counts or labels (100, 10k, 100k)")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for size in args.sizes:
+        rows = SIZES.get(size) or int(size)
+        start = time.perf_counter()
+        out_dir = generate(args.out / size, rows, args.seed)
+        print(f"{rows:>7} rows -> {out_dir} ({time.perf_counter() - start:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# -------------------------------------------------
+# SETTINGS
+# -------------------------------------------------
+ASSETS_DIR = Path("assets")
+IMAGE_EXTENSIONS = [".png", ".jpg", ".jpeg"]
+# Directory mtimes are re-checked at most this often (seconds). Adding,
+# removing or renaming a file changes its directory's mtime.
+REFRESH_INTERVAL = 2.0
+
+
+class Manifest:
+    __slots__ = ("files", "names", "dirs", "version", "layout", "checked")
+
+    def __init__(self, files, names, dirs):
+        self.files = files
+        self.names = names
+        self.dirs = dirs
+        self.checked = time.monotonic()
+        listing = "\n".join(f"{p}:{m}:{s}" for p, (m, s) in sorted(files.items()))
+        self.version = hashlib.sha1(listing.encode()).hexdigest()[:12]
+        # Paths only: unchanged by a touch, a checkout or a copy that
+        # resets mtimes.
+        self.layout = hashlib.sha1("\n".join(sorted(files)).encode()).hexdigest()[:12]
+
+
+_current = None
+_lock = threading.Lock()
+
+
+# -------------------------------------------------
+# SCANNING
+# -------------------------------------------------
+def _scan(root):
+    files = {}
+    names = {}
+    dirs = {}
+
+    def walk(directory):
+        try:
+            dirs[directory] = os.stat(directory).st_mtime_ns
+            entries = list(os.scandir(directory))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                walk(entry.path)
+            elif entry.is_file():
+                st_ = entry.stat()
+                path = entry.path.replace(os.sep, "/")
+                files[path] = (st_.st_mtime_ns, st_.st_size)
+
+    walk(str(root))
+
+    # Logical names: (folder, stem) -> file, preferring IMAGE_EXTENSIONS order.
+    rank = {ext: i for i, ext in enumerate(IMAGE_EXTENSIONS)}
+    for path in sorted(files, key=lambda p: rank.get(os.path.splitext(p)[1].lower(), 99)):
+        folder, name = os.path.split(path)
+        key = (os.path.relpath(folder, root).replace(os.sep, "/"), os.path.splitext(name)[0])
+        names.setdefault(key, path)
+
+    return Manifest(files, names, dirs)
+
+
+def _changed(manifest):
+    for directory, mtime in manifest.dirs.items():
+        try:
+            if os.stat(directory).st_mtime_ns != mtime:
+                return True
+        except OSError:
+            return True
+    return False
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+def manifest():
+    global _current
+    current = _current
+    if current is not None and time.monotonic() - current.checked < REFRESH_INTERVAL:
+        return current
+
+    with _lock:
+        current = _current
+        if current is None or _changed(current):
+            current = _current = _scan(ASSETS_DIR)
+        else:
+            current.checked = time.monotonic()
+        return current
+
+
+def refresh():
+    """Rescan immediately, e.g. after files were modified in place."""
+    global _current
+    with _lock:
+        _current = _scan(ASSETS_DIR)
+        return _current
+
+
+def version():
+    return manifest().version
+
+
+def layout():
+    """Version of the set of asset paths, for values that only depend on
+    which files exist (resolved image paths), not on their contents."""
+    return manifest().layout
+
+
+def exists(path):
+    return str(path).replace(os.sep, "/") in manifest().files
+
+
+def stat(path):
+    """(mtime_ns, size) of an asset, or None if it is not in the manifest."""
+    return manifest().files.get(str(path).replace(os.sep, "/"))
+
+
+def resolve(folder, name, fallback=None):
+    """Map a logical name such as "delacruz" or "delacruz.jpg" in
+    assets/<folder>/ to the file on disk, whatever its extension."""
+    if not name:
+        return fallback
+    stem = os.path.splitext(str(name))[0]
+    return manifest().names.get((folder, stem), fallback)
+
+
+def missing(references):
+    """Return the (source, path) pairs whose path is not in the manifest."""
+    files = manifest().files
+    return [(source, path) for source, path in references if path not in files]
+
+
+def report_broken(references):
+    broken = missing(references)
+    for source, path in broken:
+        logger.warning("Broken asset reference in %s: %s", source, path)
+    return broken
@@ -0,0 +1,250 @@
+import re
+from collections import namedtuple
+
+from core import assets, catalog, records, search
+
+# -------------------------------------------------
+# NAME PARTS
+# -------------------------------------------------
+# given: folded given-name tokens, initials as one letter ("isaac",
+# "jerome", "c"); surname: folded surname tokens ("dela", "cruz").
+Name = namedtuple("Name", ["given", "surname"])
+# index: (surname, initial) -> {given: (person id, ...)}; publications and
+# projects: person id -> records (newest first, as in records.*()).
+Links = namedtuple("Links", ["index", "publications", "projects"])
+
+TITLES = {"dr", "prof", "engr", "mr", "mrs", "ms", "atty", "sir"}
+SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "phd", "md"}
+IGNORED = TITLES | SUFFIXES
+# Lowercase surname prefixes: "Dela Cruz", "de los Santos", "van der Berg".
+PARTICLES = {
+    "de", "dela", "del", "della", "delos", "los", "las", "la", "le", "da",
+    "das", "do", "dos", "di", "du", "van", "von", "der", "den", "ter", "san",
+    "santa", "st", "bin", "binti", "al", "el",
+}
+
+ET_AL_RE = re.compile(r"\bet\.?\s*al\b\.?", re.I)
+AND_RE = re.compile(r"\s+(?:and|&)\s+", re.I)
+WORD_RE = re.compile(r"[^\W\d_]+")
+# "Perez JV", "Dela Cruz IJC": surname followed by bare capital initials.
+INITIALS_RE = re.compile(r"^[A-Z]{1,3}$")
+
+
+# -------------------------------------------------
+# PARSING
+# -------------------------------------------------
+def _tokens(text):
+    return [t for t in WORD_RE.findall(search.fold(text)) if t not in IGNORED]
+
+
+def _surname_start(tokens):
+    """Index where the surname starts: the last token plus any particles
+    before it. A name made only of particles and a surname ("Dela Cruz",
+    as in "Dela Cruz et al.") is all surname."""
+    start = len(tokens) - 1
+    while start > 0 and tokens[start - 1] in PARTICLES:
+        start -= 1
+    return start
+
+
+def split(text):
+    """Author names from a free-text list: "A B, C D", "A B; C D",
+    "A B and C D", with "et al." dropped. A single "Surname, Given" is
+    kept whole."""
+    text = AND_RE.sub(", ", ET_AL_RE.sub("", text or "")).strip(" ,;")
+    if ";" in text:
+        names = text.split(";")
+    else:
+        names = text.split(",")
+        if len(names) == 2:
+            head = _tokens(names[0])
+            if head and all(t in PARTICLES for t in head[:-1]):
+                names = [text]
+    return [n.strip() for n in names if n.strip()]
+
+
+def parse(name):
+    """Name for one author string, in any of "Given Surname",
+    "Surname, Given" or "Surname INITIALS" order."""
+    name = ET_AL_RE.sub("", name)
+    surname, comma, given = name.partition(",")
+    if comma:
+        return Name(tuple(_tokens(given)), tuple(_tokens(surname)))
+
+    raw = name.split()
+    if len(raw) >= 2 and INITIALS_RE.match(raw[-1]):
+        return Name(tuple(raw[-1].lower()), tuple(_tokens(" ".join(raw[:-1]))))
+
+    # "IJC Dela Cruz": run-together initials before the surname.
+    raw = [" ".join(w) if INITIALS_RE.match(w) else w for w in raw[:-1]] + raw[-1:]
+    tokens = _tokens(" ".join(raw))
+    if len(tokens) < 2:
+        return Name((), tuple(tokens))
+    start = _surname_start(tokens)
+    return Name(tuple(tokens[:start]), tuple(tokens[start:]))
+
+
+def _folded(word):
+    return "".join(WORD_RE.findall(search.fold(word)))
+
+
+def inverted(name):
+    """One author string as "Surname, Given" in its original spelling
+    ("Isaac Jerome C. Dela Cruz" -> "Dela Cruz, Isaac Jerome C."), with a
+    suffix as "Surname, Jr., Given", the order BibTeX expects. Names
+    already in that order are returned as they are."""
+    name = " ".join(ET_AL_RE.sub("", name).split()).strip(" ,")
+    if "," in name:
+        return name
+    words = name.split()
+    if len(words) >= 2 and INITIALS_RE.match(words[-1]):
+        return f"{' '.join(words[:-1])}, {words[-1]}"
+
+    while words and _folded(words[0]) in TITLES:
+        words = words[1:]
+    suffixes = []
+    while len(words) > 1 and _folded(words[-1]) in SUFFIXES:
+        suffixes.insert(0, words.pop())
+    if len(words) < 2:
+        return name
+    start = _surname_start([_folded(w) for w in words])
+    parts = [" ".join(words[start:])] + suffixes
+    if start:
+        parts.append(" ".join(words[:start]))
+    return ", ".join(parts)
+
+
+def keys(name):
+    """Blocking keys: the surname with particles and spacing folded in (so
+    "Dela Cruz", "de la Cruz" and "Delacruz" meet), paired with the first
+    initial. Only names in the same block are ever compared."""
+    initial = name.given[0][0] if name.given else ""
+    surnames = ["".join(name.surname)]
+    if len(name.surname) > 1:
+        # Also reachable without particles, for "I. J. Cruz".
+        surnames.append(name.surname[-1])
+    return [(surname, initial) for surname in surnames]
+
+
+def _token_match(a, b):
+    if len(a) == 1 or len(b) == 1:
+        return a[0] == b[0]
+    return a == b
+
+
+def _score(author, person):
+    """How well an author's given names fit a person's, or None when they
+    contradict. Given names must appear in order; initials match any name
+    starting with that letter."""
+    if not author:
+        return 0
+    score, j = 0, 0
+    for a in author:
+        while j < len(person) and not _token_match(a, person[j]):
+            j += 1
+        if j == len(person):
+            return None
+        score += 2 if a == person[j] else 1
+        j += 1
+    if _token_match(author[0], person[0]):
+        score += 2
+    if len(author) == len(person):
+        score += 1
+    return score
+
+
+# -------------------------------------------------
+# INDEX
+# -------------------------------------------------
+def person_id(person):
+    """Key for a person in links() and in profile URLs."""
+    return person.id or person.name
+
+
+def _index(people):
+    index = {}
+    for person in people:
+        name = parse(person.name)
+        if not name.surname:
+            continue
+        pid = person_id(person)
+        for surname, initial in keys(name):
+            # Bare surnames ("Perez et al.") look in every initial at once.
+            for block in ((surname, initial), (surname, "")):
+                ids = index.setdefault(block, {}).setdefault(name.given, [])
+                if pid not in ids:
+                    ids.append(pid)
+    return {block: {given: tuple(ids) for given, ids in names.items()} for block, names in index.items()}
+
+
+def _match(index, author):
+    name = parse(author)
+    block = next((index[k] for k in keys(name) if k in index), {})
+    if name.given in block:
+        # Nothing outscores an exact match; a shared name is ambiguous.
+        ids = block[name.given]
+        return ids[0] if len(ids) == 1 else None
+
+    scored = []
+    for given, ids in block.items():
+        score = _score(name.given, given)
+        if score is not None:
+            scored.extend((score, person_id) for person_id in ids)
+    if not scored:
+        return None
+    scored.sort(reverse=True)
+    # A tie (two "J. Perez") is ambiguous: link neither.
+    if len(scored) > 1 and scored[0][0] == scored[1][0]:
+        return None
+    return scored[0][1]
+
+
+def _link(index, items, field):
+    linked = {}
+    # Lists repeat the same few names; match each distinct string once.
+    matches = {}
+    for item in items:
+        people = set()
+        for author in split(getattr(item, field)):
+            if author not in matches:
+                matches[author] = _match(index, author)
+            people.add(matches[author])
+        for person_id in people - {None}:
+            linked.setdefault(person_id, []).append(item)
+    return {k: tuple(v) for k, v in linked.items()}
+
+
+def _build(*frames):
+    index = _index(records.people())
+    return Links(
+        index,
+        _link(index, records.publications(), "authors"),
+        _link(index, records.projects(), "researchers"),
+    )
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+# One pass over each sheet, cached until any of the three workbooks (or
+# the asset paths, which the records embed) changes.
+def links():
+    if not all(catalog.exists(n) for n in ("people", "publications", "active_research")):
+        return Links({}, {}, {})
+    return catalog.derived(
+        ("people", "publications", "active_research"), "author_links", _build,
+        token=assets.layout(),
+    )
+
+
+def match(author):
+    """Person id for one author string, or None."""
+    return _match(links().index, author)
+
+
+def publications_of(person):
+    return links().publications.get(person_id(person), ())
+
+
+def projects_of(person):
+    return links().projects.get(person_id(person), ())
@@ -0,0 +1,275 @@
+from functools import lru_cache
+from html import escape
+
+from core import assets, images
+
+# -------------------------------------------------
+# STYLES
+# -------------------------------------------------
+PUBLICATION_CSS = """
+.pub-card {
+    background: #fff5fa;
+    padding: 18px;
+    border-radius: 16px;
+    margin-bottom: 18px;
+    box-shadow: 0 6px 18px rgba(255, 95, 158, 0.10);
+}
+
+.pub-card-body {
+    display: grid;
+    grid-template-columns: 1fr 4fr;
+    gap: 1rem;
+    align-items: start;
+}
+
+.pub-card-body.no-image {
+    grid-template-columns: 1fr;
+}
+
+.pub-image {
+    width: 100%;
+    border-radius: 10px;
+}
+
+.pub-title-row {
+    display: flex;
+    align-items: center;
+    gap: 10px;
+    flex-wrap: wrap;
+    margin-bottom: 2px;
+}
+
+.pub-title {
+    font-size: 18px;
+    font-weight: 600;
+    color: #2b2b2b;
+}
+
+.featured-tag {
+    background: rgba(255, 95, 158, 0.18);
+    color: #b4004e;
+    padding: 3px 10px;
+    border-radius: 999px;
+    font-size: 12px;
+    font-weight: 600;
+}
+
+.pub-authors {
+    font-size: 14px;
+    color: #555;
+    margin-bottom: 2px;
+}
+
+.pub-journal {
+    font-size: 13px;
+    color: #777;
+    margin-bottom: 6px;
+}
+
+.pub-tag {
+    background: rgba(255, 95, 158, 0.18);
+    color: #b4004e;
+    padding: 4px 10px;
+    border-radius: 999px;
+    font-size: 12px;
+    margin-right: 6px;
+    display: inline-block;
+    margin-top: 6px;
+}
+
+@media (max-width: 640px) {
+    .pub-card-body {
+        grid-template-columns: 1fr;
+    }
+}
+"""
+
+PROJECT_CSS = """
+.ar-card {
+    background: #fff5fa;
+    padding: 18px;
+    border-radius: 16px;
+    margin-bottom: 18px;
+    box-shadow: 0 6px 18px rgba(255, 95, 158, 0.10);
+}
+
+.ar-card-featured {
+    background: #fff0f6;
+    padding: 18px;
+    border-radius: 16px;
+    margin-bottom: 18px;
+    box-shadow: 0 10px 26px rgba(255, 95, 158, 0.20);
+}
+
+.ar-title {
+    font-size: 18px;
+    font-weight: 600;
+    color: #2b2b2b;
+    margin-bottom: 4px;
+}
+
+.ar-meta {
+    font-size: 14px;
+    color: #555;
+    margin-bottom: 2px;
+}
+
+.ar-status {
+    font-size: 13px;
+    color: #777;
+    margin-bottom: 6px;
+}
+
+.ar-tag {
+    background: rgba(255, 95, 158, 0.18);
+    color: #b4004e;
+    padding: 4px 10px;
+    border-radius: 999px;
+    font-size: 12px;
+    margin-right: 6px;
+    display: inline-block;
+    margin-top: 6px;
+}
+
+.ar-featured-badge {
+    background: linear-gradient(135deg, #ff6aa6, #ff8fbf);
+    color: white;
+    font-size: 11px;
+    font-weight: 600;
+    padding: 4px 10px;
+    border-radius: 999px;
+    display: inline-block;
+    margin-bottom: 6px;
+}
+"""
+
+# Collapsible details inside a card (replaces st.expander, which cannot
+# live inside a single HTML element).
+DETAILS_CSS = """
+.card-details {
+    margin-top: 12px;
+    border: 1px solid rgba(49, 51, 63, 0.2);
+    border-radius: 8px;
+    padding: 0 14px;
+    background: white;
+}
+
+.card-details > summary {
+    cursor: pointer;
+    padding: 10px 0;
+    font-size: 14px;
+}
+
+.card-details[open] > summary {
+    border-bottom: 1px solid rgba(49, 51, 63, 0.1);
+    margin-bottom: 8px;
+}
+"""
+
+PUBLICATION_IMAGE_WIDTH = 240
+
+# -------------------------------------------------
+# HELPERS
+# -------------------------------------------------
+# Fragments must not contain blank lines: Markdown ends an HTML block at
+# the first blank line and would render the rest as text.
+def _text(value):
+    return escape(value).replace("\r", "").replace("\n", "<br>")
+
+
+def _tags(tags, css_class):
+    return "".join(f"<span class='{css_class}'>{escape(t)}</span>" for t in tags)
+
+
+def _details(summary, sections, link, link_label):
+    parts = []
+    for heading, body in sections:
+        if body:
+            parts.append(f"<p><strong>{heading}</strong><br>{_text(body)}</p>")
+    if link:
+        parts.append(
+            f"<p><a href='{escape(link, quote=True)}' target='_blank'>{link_label}</a></p>"
+        )
+    if not parts:
+        return ""
+    return (
+        f"<details class='card-details'><summary>{summary}</summary>"
+        + "".join(parts)
+        + "</details>"
+    )
+
+
+# -------------------------------------------------
+# CARDS
+# -------------------------------------------------
+# Memoized per record (namedtuples hash by value) and asset manifest
+# version, since the image URL depends on the files on disk.
+@lru_cache(maxsize=4096)
+def _publication_card(p, show_year, asset_version, url_prefix):
+    image_url = images.url(p.image, PUBLICATION_IMAGE_WIDTH, url_prefix) if p.image else None
+    meta = " · ".join(x for x in (p.journal, str(p.year) if show_year else "") if x)
+
+    text = [
+        "<div class='pub-title-row'>",
+        f"<div class='pub-title'>{_text(p.title)}</div>",
+        "<div class='featured-tag'>Featured</div>" if p.featured else "",
+        "</div>",
+    ]
+    if p.authors:
+        text.append(f"<div class='pub-authors'>{_text(p.authors)}</div>")
+    if meta:
+        text.append(f"<div class='pub-journal'>{_text(meta)}</div>")
+    if p.tags:
+        text.append(f"<div>{_tags(p.tags, 'pub-tag')}</div>")
+    text.append(_details(
+        "Abstract &amp; links",
+        [("Abstract", p.abstract), ("Contact", p.contact)],
+        p.link, "Read full paper →",
+    ))
+
+    body_class = "pub-card-body" if image_url else "pub-card-body no-image"
+    image = (
+        f"<img class='pub-image' src='{escape(image_url, quote=True)}' alt='' loading='lazy'>"
+        if image_url else ""
+    )
+    return (
+        f"<div class='pub-card'><div class='{body_class}'>{image}"
+        f"<div class='pub-text'>{''.join(text)}</div></div></div>"
+    )
+
+
+@lru_cache(maxsize=4096)
+def _project_card(p, show_year):
+    card_class = "ar-card-featured" if p.featured else "ar-card"
+    meta = " · ".join(x for x in (
+        f"Status: {p.status}" if p.status else "",
+        str(p.year) if show_year else "",
+    ) if x)
+
+    parts = [f"<div class='{card_class}'>"]
+    if p.featured:
+        parts.append("<div class='ar-featured-badge'>FEATURED PROJECT</div>")
+    parts.append(f"<div class='ar-title'>{_text(p.title)}</div>")
+    if p.researchers:
+        parts.append(f"<div class='ar-meta'>{_text(p.researchers)}</div>")
+    if meta:
+        parts.append(f"<div class='ar-status'>{_text(meta)}</div>")
+    if p.tags:
+        parts.append(f"<div>{_tags(p.tags, 'ar-tag')}</div>")
+    parts.append(_details(
+        "Project details",
+        [("Description", p.description), ("Contact", p.contact)],
+        p.link, "Project link →",
+    ))
+    parts.append("</div>")
+    return "".join(parts)
+
+
+def publication_card(p, show_year=False, url_prefix="app/"):
+    """Complete HTML for one publication card, emitted as one element."""
+    return _publication_card(p, show_year, assets.version(), url_prefix)
+
+
+def project_card(p, show_year=False):
+    """Complete HTML for one active research card, emitted as one element."""
+    return _project_card(p, show_year)
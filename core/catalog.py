@@ -0,0 +1,273 @@
+import hashlib
+import io
+import logging
+import os
+import pickle
+import threading
+from collections import Counter
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# -------------------------------------------------
+# WORKBOOKS
+# -------------------------------------------------
+DATA_DIR = Path(os.environ.get("NANOTECH_DATA_DIR", "data"))
+
+WORKBOOKS = {
+    "people": "people.xlsx",
+    "publications": "publications.xlsx",
+    "active_research": "active_research.xlsx",
+    "research_tracks": "research_tracks.xlsx",
+}
+
+# Prebuilt frames and derived values (python -m core.snapshot). Entries are
+# matched on workbook content and code, so a stale snapshot is ignored.
+SNAPSHOT_PATH = os.environ.get("NANOTECH_SNAPSHOT", "")
+# Off while a snapshot is being built, which must start from the workbooks.
+USE_SNAPSHOT = True
+CODE_DIR = Path(__file__).resolve().parent
+
+# One entry per workbook: name -> Sheet. Shared by every session in the
+# process; frames must be treated as read-only by callers.
+_sheets = {}
+# (names, key) -> (versions, value) for artifacts built from workbooks.
+_derived = {}
+_lock = threading.RLock()
+# path -> loaded snapshot ({} when there is none)
+_snapshots = {}
+# Cache hit/miss counters, read by the profiler.
+stats = Counter()
+
+
+class Sheet:
+    """A workbook as last read from disk. The DataFrame is only produced
+    on first access to `frame`, so versions can be compared (and derived
+    values served from a snapshot) without loading pandas or openpyxl."""
+
+    __slots__ = ("name", "path", "stat", "version", "_source", "_frame")
+
+    def __init__(self, name, path, stat, version, source):
+        self.name = name
+        self.path = path
+        self.stat = stat
+        self.version = version
+        self._source = source
+        self._frame = None
+
+    @property
+    def frame(self):
+        if self._frame is None:
+            with _lock:
+                if self._frame is None:
+                    self._frame = self._source()
+                    self._source = None
+        return self._frame
+
+
+# -------------------------------------------------
+# HELPERS
+# -------------------------------------------------
+def path(name):
+    if name not in WORKBOOKS:
+        raise KeyError(f"Unknown workbook: {name}")
+    return DATA_DIR / WORKBOOKS[name]
+
+
+def exists(name):
+    return path(name).exists()
+
+
+def _stat_key(file_path):
+    st_ = os.stat(file_path)
+    return (st_.st_mtime_ns, st_.st_size)
+
+
+def _parse(raw):
+    import pandas as pd
+
+    stats["parse"] += 1
+    df = pd.read_excel(io.BytesIO(raw))
+    df.columns = df.columns.astype(str).str.strip().str.lower()
+    return df
+
+
+def _fingerprint(stat, raw):
+    digest = hashlib.sha1(raw).hexdigest()[:16]
+    return f"{stat[0]}-{digest}"
+
+
+def _digest(version):
+    """The content part of a version (or a token, unchanged)."""
+    return version.rsplit("-", 1)[-1] if isinstance(version, str) else version
+
+
+# -------------------------------------------------
+# SNAPSHOT
+# -------------------------------------------------
+def snapshot_path():
+    return Path(SNAPSHOT_PATH) if SNAPSHOT_PATH else DATA_DIR / "snapshot.pickle"
+
+
+def _code_version():
+    """Digest of the core modules, whose record types a snapshot pickles."""
+    digest = hashlib.sha1()
+    for module in sorted(CODE_DIR.glob("*.py")):
+        digest.update(module.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _snapshot():
+    if not USE_SNAPSHOT:
+        return {}
+    file_path = snapshot_path()
+    key = str(file_path)
+    if key not in _snapshots:
+        snapshot = {}
+        try:
+            with open(file_path, "rb") as fh:
+                loaded = pickle.load(fh)
+            if loaded.get("code") == _code_version():
+                snapshot = loaded
+            else:
+                logger.info("Ignoring %s: built by other code", file_path)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logger.exception("Could not read snapshot %s", file_path)
+        _snapshots[key] = snapshot
+    return _snapshots[key]
+
+
+def _frame_source(name, version, raw):
+    entry = _snapshot().get("sheets", {}).get(name)
+    if entry is not None and entry[0] == _digest(version):
+        stats["snapshot"] += 1
+        return lambda: pickle.loads(entry[1])
+    return lambda: _parse(raw)
+
+
+def _snapshot_value(slot, versions):
+    entry = _snapshot().get("derived", {}).get(slot)
+    if entry is None or entry[0] != tuple(_digest(v) for v in versions):
+        return None
+    stats["snapshot"] += 1
+    return (pickle.loads(entry[1]),)
+
+
+def save_snapshot(file_path=None):
+    """Write every frame and derived value currently cached to a snapshot
+    that later processes load instead of parsing. Values that cannot be
+    pickled are left out. Returns the number of derived values written."""
+    with _lock:
+        sheets = {
+            name: (_digest(s.version), pickle.dumps(s.frame, pickle.HIGHEST_PROTOCOL))
+            for name, s in _sheets.items()
+        }
+        derived = {}
+        for slot, (versions, value) in _derived.items():
+            try:
+                data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                logger.info("Not snapshotting %s: cannot be pickled", slot)
+                continue
+            derived[slot] = (tuple(_digest(v) for v in versions), data)
+
+    file_path = Path(file_path or snapshot_path())
+    tmp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as fh:
+        # Each entry is pickled on its own so loading the snapshot only
+        # unpickles what a process actually asks for.
+        pickle.dump({"code": _code_version(), "sheets": sheets, "derived": derived}, fh,
+                    pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, file_path)
+    _snapshots.pop(str(file_path), None)
+    return len(derived)
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+def sheet(name):
+    """Return the current Sheet for a workbook, re-parsing it only if the
+    file on disk changed since the last load."""
+    file_path = path(name)
+    stat = _stat_key(file_path)
+
+    current = _sheets.get(name)
+    if current is not None and current.stat == stat:
+        stats["hit"] += 1
+        return current
+
+    with _lock:
+        current = _sheets.get(name)
+        if current is not None and current.stat == stat:
+            stats["hit"] += 1
+            return current
+
+        stats["miss"] += 1
+        raw = file_path.read_bytes()
+        version = _fingerprint(stat, raw)
+
+        # Touched but unchanged content keeps the parsed frame.
+        if current is not None and current.version == version:
+            current.stat = stat
+            return current
+
+        current = Sheet(name, file_path, stat, version, _frame_source(name, version, raw))
+        _sheets[name] = current
+        return current
+
+
+def load(name):
+    return sheet(name).frame
+
+
+def version(name):
+    return sheet(name).version
+
+
+def derived(names, key, build, token=None):
+    """Cache `build(*frames)` per data version of the given workbooks.
+
+    `names` is a workbook name or a tuple of names; the value is rebuilt
+    only when one of those workbooks changes, or when `token` (a version
+    of some non-workbook input, such as the asset manifest) changes.
+    """
+    if isinstance(names, str):
+        names = (names,)
+
+    sheets = [sheet(n) for n in names]
+    versions = tuple(s.version for s in sheets) + (token,)
+    slot = (names, key)
+
+    entry = _derived.get(slot)
+    if entry is not None and entry[0] == versions:
+        stats["hit"] += 1
+        return entry[1]
+
+    with _lock:
+        entry = _derived.get(slot)
+        if entry is not None and entry[0] == versions:
+            stats["hit"] += 1
+            return entry[1]
+
+        stats["miss"] += 1
+        prebuilt = _snapshot_value(slot, versions)
+        value = prebuilt[0] if prebuilt else build(*(s.frame for s in sheets))
+        _derived[slot] = (versions, value)
+        return value
+
+
+def invalidate(name=None):
+    """Drop a single workbook and everything derived from it, or every
+    workbook when no name is given."""
+    with _lock:
+        if name is None:
+            _sheets.clear()
+            _derived.clear()
+            return
+
+        _sheets.pop(name, None)
+        for slot in [s for s in _derived if name in s[0]]:
+            del _derived[slot]
@@ -0,0 +1,149 @@
+import json
+import re
+from collections import namedtuple
+from string import ascii_lowercase
+
+from core import authors as author_names
+from core import catalog, listing, records, render_cache
+
+# -------------------------------------------------
+# FORMATS
+# -------------------------------------------------
+Format = namedtuple("Format", ["label", "extension", "mime", "entries"])
+
+DOI_RE = re.compile(r"\b(10\.\d{4,9}/\S+)", re.I)
+# Characters with a meaning in BibTeX field values.
+BIBTEX_ESCAPES = {
+    "\\": r"\textbackslash{}", "{": r"\{", "}": r"\}", "&": r"\&", "%": r"\%",
+    "$": r"\$", "#": r"\#", "_": r"\_", "~": r"\textasciitilde{}", "^": r"\^{}",
+}
+BIBTEX_RE = re.compile("|".join(re.escape(c) for c in BIBTEX_ESCAPES))
+
+
+# -------------------------------------------------
+# HELPERS
+# -------------------------------------------------
+def authors(p):
+    return author_names.split(p.authors)
+
+
+def doi(p):
+    match = DOI_RE.search(p.link)
+    return match.group(1).rstrip(".") if match else ""
+
+
+def _bibtex_value(text):
+    return BIBTEX_RE.sub(lambda m: BIBTEX_ESCAPES[m.group()], text)
+
+
+def _bibtex_key(p, used):
+    first = (authors(p) or ["anon"])[0]
+    surname = author_names.inverted(first).split(",")[0]
+    first_word = next(iter(re.findall(r"[A-Za-z]{4,}", p.title)), "")
+    base = re.sub(r"[^a-z0-9]", "", f"{surname}{p.year or ''}{first_word}".lower()) or "entry"
+    key, suffix = base, 0
+    while key in used:
+        key = f"{base}{ascii_lowercase[suffix]}" if suffix < 26 else f"{base}{suffix}"
+        suffix += 1
+    used.add(key)
+    return key
+
+
+# -------------------------------------------------
+# ENTRY WRITERS
+# -------------------------------------------------
+# Each yields one text chunk per record, so callers can stream them.
+def _bibtex(pubs):
+    used = set()
+    for p in pubs:
+        fields = [
+            ("title", p.title),
+            # "Surname, Given": BibTeX would otherwise take only the last
+            # word as the surname ("Cruz" of "Dela Cruz").
+            ("author", " and ".join(author_names.inverted(a) for a in authors(p))),
+            ("journal", p.journal),
+            ("year", str(p.year) if p.year else ""),
+            ("doi", doi(p)),
+            ("url", p.link),
+            ("keywords", ", ".join(p.tags)),
+        ]
+        body = ",\n".join(
+            f"  {name} = {{{_bibtex_value(value)}}}" for name, value in fields if value
+        )
+        yield f"@article{{{_bibtex_key(p, used)},\n{body}\n}}\n\n"
+
+
+def _ris(pubs):
+    for p in pubs:
+        lines = ["TY  - JOUR"]
+        lines += [f"AU  - {name}" for name in authors(p)]
+        lines += [
+            f"{tag}  - {value}" for tag, value in (
+                ("TI", p.title),
+                ("JO", p.journal),
+                ("PY", str(p.year) if p.year else ""),
+                ("DO", doi(p)),
+                ("UR", p.link),
+            ) if value
+        ]
+        lines += [f"KW  - {tag}" for tag in p.tags]
+        lines.append("ER  - ")
+        yield "\r\n".join(lines) + "\r\n\r\n"
+
+
+def _csl_item(p):
+    item = {
+        "id": p.id,
+        "type": "article-journal",
+        "title": p.title,
+        "author": [{"literal": name} for name in authors(p)],
+    }
+    if p.journal:
+        item["container-title"] = p.journal
+    if p.year:
+        item["issued"] = {"date-parts": [[p.year]]}
+    if doi(p):
+        item["DOI"] = doi(p)
+    if p.link:
+        item["URL"] = p.link
+    if p.tags:
+        item["keyword"] = ", ".join(p.tags)
+    return item
+
+
+def _csl(pubs):
+    yield "["
+    for i, p in enumerate(pubs):
+        yield ("," if i else "") + "\n  " + json.dumps(_csl_item(p), ensure_ascii=False)
+    yield "\n]\n"
+
+
+FORMATS = {
+    "bibtex": Format("BibTeX", "bib", "application/x-bibtex", _bibtex),
+    "ris": Format("RIS", "ris", "application/x-research-info-systems", _ris),
+    "csl": Format("CSL-JSON", "json", "application/vnd.citationstyles.csl+json", _csl),
+}
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+def stream(pubs, fmt):
+    """Yield the export of `pubs` in `fmt` chunk by chunk."""
+    return FORMATS[fmt].entries(pubs)
+
+
+def export(fmt, query="", tags=(), mode="any", filtered=True):
+    """Encoded export of the filtered (or every) publication, cached per
+    data version and filter state so repeat downloads are a lookup."""
+    if not filtered:
+        query, tags, mode = "", (), "any"
+    tags = tuple(tags)
+    key = ("citations", fmt, catalog.version("publications"), query, tags, mode)
+
+    def build():
+        pubs = records.publications()
+        ids = listing.select("publications", query, tags, mode).ids
+        return "".join(stream((pubs[i] for i in ids), fmt)).encode("utf-8")
+
+    return render_cache.cached(key, build, depends=("publications",))
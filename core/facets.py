@@ -0,0 +1,76 @@
+from core import catalog, records
+
+# -------------------------------------------------
+# BITMAP HELPERS
+# -------------------------------------------------
+# A result set is a Python int used as a bitmap: bit i is set when record
+# i (its position in the records tuple) is in the set. Intersection and
+# union are single & / | operations and counts are int.bit_count().
+def to_mask(ids, size):
+    bits = bytearray((size + 7) // 8)
+    for i in ids:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, "little")
+
+
+def members(mask, size):
+    """Return a membership test for `mask` usable in tight loops."""
+    bits = mask.to_bytes((size + 7) // 8, "little")
+    return lambda i: bits[i >> 3] >> (i & 7) & 1
+
+
+def to_ids(mask, size):
+    test = members(mask, size)
+    return [i for i in range(size) if test(i)]
+
+
+# -------------------------------------------------
+# FACET INDEX
+# -------------------------------------------------
+class FacetIndex:
+    """Precomputed value -> bitmap index over a tuple-valued record field."""
+
+    def __init__(self, docs, field="tags"):
+        self.size = len(docs)
+        self.all = (1 << self.size) - 1
+
+        positions = {}
+        for i, record in enumerate(docs):
+            for value in getattr(record, field):
+                positions.setdefault(value, []).append(i)
+
+        self.values = tuple(sorted(positions))
+        self.masks = {
+            value: to_mask(ids, self.size) for value, ids in positions.items()
+        }
+
+    def select(self, values, mode="any"):
+        """Bitmap of records having any (OR) or all (AND) of `values`."""
+        if not values:
+            return self.all
+
+        masks = [self.masks.get(v, 0) for v in values]
+        result = masks[0]
+        for mask in masks[1:]:
+            result = result & mask if mode == "all" else result | mask
+        return result
+
+    def counts(self, mask):
+        return {v: (self.masks[v] & mask).bit_count() for v in self.values}
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+def publication_facets():
+    return catalog.derived(
+        "publications", "facets",
+        lambda _: FacetIndex(records.publications()),
+    )
+
+
+def project_facets():
+    return catalog.derived(
+        "active_research", "facets",
+        lambda _: FacetIndex(records.projects()),
+    )
@@ -0,0 +1,142 @@
+import hashlib
+import logging
+import os
+import sys
+import threading
+from pathlib import Path
+
+from PIL import Image, features
+
+from core import assets
+
+logger = logging.getLogger(__name__)
+
+# -------------------------------------------------
+# SETTINGS
+# -------------------------------------------------
+# Derivatives live next to the app so they can also be served statically.
+DERIVED_DIR = Path("static/derived")
+WIDTHS = (320, 640, 960, 1280)
+# Cards are laid out in CSS pixels; request enough for high-DPI screens.
+DENSITY = 2
+QUALITY = 80
+
+FORMAT, EXTENSION = ("WEBP", "webp") if features.check("webp") else ("JPEG", "jpg")
+
+# (path, mtime_ns, size) -> (digest, (width, height))
+_sources = {}
+# (path, width) -> (stat, derived path)
+_variants = {}
+_lock = threading.Lock()
+
+
+# -------------------------------------------------
+# HELPERS
+# -------------------------------------------------
+def _source(path, stat):
+    key = (path, *stat)
+    info = _sources.get(key)
+    if info is None:
+        with open(path, "rb") as fh:
+            digest = hashlib.sha1(fh.read()).hexdigest()[:12]
+        with Image.open(path) as img:
+            size = img.size
+        info = (digest, size)
+        _sources[key] = info
+    return info
+
+
+def target_width(display_width):
+    wanted = display_width * DENSITY
+    for width in WIDTHS:
+        if width >= wanted:
+            return width
+    return WIDTHS[-1]
+
+
+def _render(path, width, out_path):
+    with Image.open(path) as img:
+        img.load()
+        if img.width > width:
+            height = round(img.height * width / img.width)
+            img = img.resize((width, height), Image.LANCZOS)
+
+        if FORMAT == "JPEG" and img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGBA")
+            background = Image.new("RGB", img.size, "white")
+            background.paste(img, mask=img.getchannel("A"))
+            img = background
+        elif img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = out_path.with_suffix(f".{os.getpid()}.tmp")
+        options = {"method": 4} if FORMAT == "WEBP" else {"optimize": True}
+        img.save(tmp_path, FORMAT, quality=QUALITY, **options)
+        os.replace(tmp_path, out_path)
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+def derive(path, width):
+    """Return the derivative of `path` at (at most) `width` pixels,
+    creating it on first use. Falls back to the source on any error."""
+    path = str(path)
+    stat = assets.stat(path)
+    if stat is None:
+        return path
+
+    cached = _variants.get((path, width))
+    if cached is not None and cached[0] == stat:
+        return cached[1]
+
+    with _lock:
+        try:
+            digest, (src_width, _) = _source(path, stat)
+            size = min(width, src_width)
+            stem = Path(path).stem
+            out_path = DERIVED_DIR / f"{stem}-{size}w-{digest}.{EXTENSION}"
+            if not out_path.exists():
+                _render(path, size, out_path)
+            result = str(out_path)
+        except Exception:
+            logger.exception("Could not derive %s at %spx", path, width)
+            result = path
+
+        _variants[(path, width)] = (stat, result)
+        return result
+
+
+def variant(path, display_width):
+    """Pick the derivative for an image shown `display_width` CSS px wide."""
+    return derive(path, target_width(display_width))
+
+
+def url(path, display_width, prefix="app/"):
+    """Browser URL of the variant, served from Streamlit's static folder
+    (server.enableStaticServing). None if no derivative is available.
+    The static export passes prefix="" for page-relative URLs."""
+    derived = variant(path, display_width)
+    if not derived.startswith(f"{DERIVED_DIR.as_posix()}/"):
+        return None
+    return f"{prefix}{derived}"
+
+
+def build_all(root="assets"):
+    """Pre-build every standard width for every image under `root`."""
+    built = 0
+    for path in sorted(assets.refresh().files):
+        if not path.startswith(f"{root}/"):
+            continue
+        if os.path.splitext(path)[1].lower() not in assets.IMAGE_EXTENSIONS:
+            continue
+        for width in WIDTHS:
+            derive(path, width)
+            built += 1
+    return built
+
+
+if __name__ == "__main__":
+    count = build_all(sys.argv[1] if len(sys.argv) > 1 else "assets")
+    print(f"{count} image variants up to date in {DERIVED_DIR}")
@@ -0,0 +1,373 @@
+"""Bulk import of publications from BibTeX, RIS or Crossref JSON.
+
+Entries are parsed one at a time, mapped onto the publications.xlsx
+columns and dropped when their DOI or normalized title is already in the
+workbook (or earlier in the same import).
+
+    python -m core.importer department.bib scopus.ris crossref.json
+    python -m core.importer export.bib --dry-run
+"""
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+import pandas as pd
+
+from core import catalog, search
+
+COLUMNS = [
+    "id", "year", "title", "authors", "keywords", "abstract",
+    "image", "link", "contact", "featured", "journal",
+]
+
+DOI_RE = re.compile(r"\b(10\.\d{4,9}/[^\s\"<>]+)", re.I)
+YEAR_RE = re.compile(r"\b(1[89]\d\d|2\d\d\d)\b")
+TAG_RE = re.compile(r"<[^>]+>")
+
+# -------------------------------------------------
+# BIBTEX
+# -------------------------------------------------
+# \~n -> ñ, {\'e} -> é, ... as base letter + combining mark.
+LATEX_ACCENTS = {"`": "\u0300", "'": "\u0301", "^": "\u0302", "~": "\u0303",
+                 "=": "\u0304", ".": "\u0307", "\"": "\u0308"}
+LATEX_ACCENT = re.compile(r"\\([`'^~=.\"])\s*\{?([A-Za-z])\}?")
+# Dotless i/j, as in Garc{\'\i}a; mapped to plain letters before accents.
+LATEX_DOTLESS = re.compile(r"\\([ij])(?![A-Za-z])")
+LATEX_ESCAPES = re.compile(r"\\([&%$#_{}])")
+LATEX_COMMANDS = re.compile(r"\\[a-zA-Z]+\s*|\\.")
+BIBTEX_FIELD = re.compile(r"\s*,?\s*([\w-]+)\s*=\s*")
+
+
+def _latex(text):
+    text = LATEX_DOTLESS.sub(r"\1", text)
+    text = LATEX_ACCENT.sub(lambda m: m.group(2) + LATEX_ACCENTS[m.group(1)], text)
+    text = unicodedata.normalize("NFC", text)
+    text = LATEX_ESCAPES.sub(r"\1", text)
+    text = LATEX_COMMANDS.sub("", text)
+    return " ".join(text.replace("{", "").replace("}", "").split())
+
+
+def _bibtex_fields(body, macros=None):
+    """Parse `key = {value}, key = "value", key = 123` into a dict. Bare
+    values are looked up in `macros` (from @string), joined on "#"."""
+    fields = {}
+    i, n = 0, len(body)
+    while i < n:
+        match = BIBTEX_FIELD.match(body, i)
+        if not match:
+            break
+        name, i = match.group(1).lower(), match.end()
+        if i < n and body[i] in "{\"":
+            quote, depth, start = body[i], 0, i
+            while i < n:
+                c = body[i]
+                depth += (c == "{") - (c == "}")
+                i += 1
+                if depth == 0 and (quote == "{" or (c == "\"" and i - 1 > start)):
+                    break
+            fields[name] = body[start + 1:i - 1]
+        else:
+            end = body.find(",", i)
+            end = n if end == -1 else end
+            parts = [p.strip().strip("{}\"") for p in body[i:end].split("#")]
+            fields[name] = "".join((macros or {}).get(p.lower(), p) for p in parts)
+            i = end
+    return fields
+
+
+def parse_bibtex(lines):
+    """Yield one dict of raw fields per @entry, reading line by line."""
+    buffer, depth = [], 0
+    macros = {}
+    for line in lines:
+        if not buffer:
+            start = line.find("@")
+            if start == -1:
+                continue
+            line = line[start:]
+        buffer.append(line)
+        depth += line.count("{") - line.count("}")
+        if depth <= 0 and "{" in "".join(buffer):
+            entry = "".join(buffer)
+            buffer, depth = [], 0
+            head, _, body = entry.partition("{")
+            kind = head.strip("@ \t\r\n").lower()
+            if kind in ("comment", "preamble"):
+                continue
+            if kind != "string":
+                _, _, body = body.partition(",")
+            # Only the brace closing the entry; the last field may end in one too.
+            body = body.rstrip()
+            body = body[:-1] if body.endswith("}") else body
+            fields = _bibtex_fields(body, macros)
+            if kind == "string":
+                macros.update(fields)
+                continue
+            yield {k: _latex(v) for k, v in fields.items()}
+
+
+def _from_bibtex(fields):
+    authors = [a.strip() for a in re.split(r"\s+and\s+", fields.get("author", "")) if a.strip()]
+    return {
+        "title": fields.get("title", ""),
+        "authors": authors,
+        "journal": fields.get("journal") or fields.get("booktitle", ""),
+        "year": fields.get("year", ""),
+        "keywords": re.split(r"[;,]", fields.get("keywords", "")),
+        "abstract": fields.get("abstract", ""),
+        "doi": fields.get("doi", ""),
+        "link": fields.get("url", ""),
+    }
+
+
+# -------------------------------------------------
+# RIS
+# -------------------------------------------------
+RIS_LINE = re.compile(r"^([A-Z][A-Z0-9])  -\s?(.*)$")
+RIS_FIELDS = {
+    "TI": "title", "T1": "title",
+    "AU": "authors", "A1": "authors",
+    "JO": "journal", "JF": "journal", "T2": "journal", "JA": "journal",
+    "PY": "year", "Y1": "year", "DA": "year",
+    "KW": "keywords",
+    "AB": "abstract", "N2": "abstract",
+    "DO": "doi",
+    "UR": "link",
+}
+RIS_LISTS = ("authors", "keywords")
+
+
+def parse_ris(lines):
+    """Yield one dict per TY ... ER record, reading line by line."""
+    record = None
+    for line in lines:
+        match = RIS_LINE.match(line.rstrip("\r\n"))
+        if not match:
+            continue
+        tag, value = match.group(1), match.group(2).strip()
+        if tag == "TY":
+            record = {"authors": [], "keywords": []}
+        elif tag == "ER":
+            if record is not None:
+                yield record
+            record = None
+        elif record is not None and tag in RIS_FIELDS:
+            field = RIS_FIELDS[tag]
+            if field in RIS_LISTS:
+                record[field].append(value)
+            else:
+                record.setdefault(field, value)
+
+
+# -------------------------------------------------
+# CROSSREF JSON
+# -------------------------------------------------
+def parse_crossref(text):
+    """Works from a Crossref API response (single work or item list), a
+    JSON array of works, or JSON lines with one work per line."""
+    text = text.strip()
+    if not text:
+        return
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        for line in text.splitlines():
+            if line.strip():
+                yield from parse_crossref(line)
+        return
+
+    message = data.get("message", data) if isinstance(data, dict) else data
+    if isinstance(message, dict) and "items" in message:
+        message = message["items"]
+    yield from (message if isinstance(message, list) else [message])
+
+
+def _from_crossref(work):
+    # Crossref titles carry JATS/HTML markup (<i>, <sub>, <jats:p>).
+    def first(key):
+        value = work.get(key) or [""]
+        return TAG_RE.sub("", value[0] if isinstance(value, list) else value)
+
+    authors = []
+    for author in work.get("author", []):
+        name = " ".join(p for p in (author.get("given", ""), author.get("family", "")) if p)
+        authors.append(name or author.get("name", ""))
+
+    year = ""
+    for key in ("published-print", "published-online", "issued", "created"):
+        parts = (work.get(key) or {}).get("date-parts") or [[None]]
+        if parts[0] and parts[0][0]:
+            year = str(parts[0][0])
+            break
+
+    return {
+        "title": first("title"),
+        "authors": authors,
+        "journal": first("container-title"),
+        "year": year,
+        "keywords": work.get("subject", []),
+        "abstract": TAG_RE.sub("", work.get("abstract", "")),
+        "doi": work.get("DOI", ""),
+        "link": work.get("URL", ""),
+    }
+
+
+# -------------------------------------------------
+# DEDUPLICATION
+# -------------------------------------------------
+def _digest(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+
+
+def _doi(value):
+    match = DOI_RE.search(value or "")
+    return match.group(1).rstrip(".") if match else ""
+
+
+def normalize_doi(value):
+    return _doi(value).lower()
+
+
+def normalize_title(title):
+    return " ".join(search.tokenize(title))
+
+
+def dedupe_keys(doi, title):
+    """Hashed keys an entry is known by: its DOI and normalized title."""
+    keys = []
+    if doi:
+        keys.append(b"d" + _digest(doi))
+    if title:
+        keys.append(b"t" + _digest(normalize_title(title)))
+    return keys
+
+
+# -------------------------------------------------
+# IMPORT
+# -------------------------------------------------
+FORMATS = {
+    ".bib": "bibtex", ".bibtex": "bibtex",
+    ".ris": "ris", ".txt": "ris",
+    ".json": "crossref", ".jsonl": "crossref",
+}
+
+
+def entries(path, fmt=None):
+    """Yield entries from one file as dicts in a common shape."""
+    fmt = fmt or FORMATS.get(Path(path).suffix.lower(), "bibtex")
+    with open(path, encoding="utf-8-sig") as fh:
+        if fmt == "bibtex":
+            yield from map(_from_bibtex, parse_bibtex(fh))
+        elif fmt == "ris":
+            yield from parse_ris(fh)
+        elif Path(path).suffix.lower() == ".jsonl":
+            for line in fh:
+                yield from map(_from_crossref, parse_crossref(line))
+        else:
+            yield from map(_from_crossref, parse_crossref(fh.read()))
+
+
+def _name(author):
+    """"Surname, Given" -> "Given Surname", as the authors column is a
+    comma-separated list."""
+    surname, comma, given = author.partition(",")
+    return f"{given.strip()} {surname.strip()}" if comma else author.strip()
+
+
+def _row(entry, ids):
+    year_match = YEAR_RE.search(str(entry.get("year", "")))
+    year = int(year_match.group(1)) if year_match else None
+
+    # Same scheme as the hand-written ids: pub_<year>_<nn>.
+    prefix = f"pub_{year or 'nd'}_"
+    n = ids.get(prefix, 0) + 1
+    ids[prefix] = n
+
+    doi = _doi(entry.get("doi") or entry.get("link", ""))
+    link = entry.get("link") or (f"https://doi.org/{doi}" if doi else "")
+    keywords = [k.strip() for k in entry.get("keywords", []) if k and k.strip()]
+    return {
+        "id": f"{prefix}{n:02d}",
+        "year": year,
+        "title": html.unescape(" ".join(entry.get("title", "").split())),
+        "authors": ", ".join(_name(a) for a in entry.get("authors", []) if a.strip()),
+        "keywords": "; ".join(dict.fromkeys(keywords)),
+        "abstract": html.unescape(" ".join(entry.get("abstract", "").split())),
+        "image": None,
+        "link": link,
+        "contact": None,
+        "featured": False,
+        "journal": html.unescape(entry.get("journal", "")),
+    }
+
+
+def _existing_ids(df):
+    ids = {}
+    for value in df.get("id", pd.Series(dtype=str)).dropna().astype(str):
+        match = re.match(r"^(pub_\w+?_)(\d+)$", value)
+        if match:
+            prefix, n = match.group(1), int(match.group(2))
+            ids[prefix] = max(ids.get(prefix, 0), n)
+    return ids
+
+
+def run(paths, fmt=None, target=None, dry_run=False):
+    """Import every file into the publications workbook. Returns
+    (added, duplicates, skipped) counts."""
+    target = Path(target or catalog.path("publications"))
+    existing = pd.read_excel(target) if target.exists() else pd.DataFrame(columns=COLUMNS)
+
+    seen = set()
+    for link, title in zip(
+        existing.get("link", pd.Series(dtype=str)).fillna("").astype(str),
+        existing.get("title", pd.Series(dtype=str)).fillna("").astype(str),
+    ):
+        seen.update(dedupe_keys(normalize_doi(link), title))
+
+    ids = _existing_ids(existing)
+    rows, duplicates, skipped = [], 0, 0
+    for path in paths:
+        for entry in entries(path, fmt):
+            if not entry.get("title"):
+                skipped += 1
+                continue
+            keys = dedupe_keys(normalize_doi(entry.get("doi") or entry.get("link", "")), entry["title"])
+            if any(key in seen for key in keys):
+                duplicates += 1
+                continue
+            seen.update(keys)
+            rows.append(_row(entry, ids))
+
+    if rows and not dry_run:
+        combined = pd.concat([existing, pd.DataFrame(rows, columns=COLUMNS)], ignore_index=True)
+        # Written beside the target and swapped in, so the app (and the
+        # file watcher) never sees a half-written workbook.
+        tmp_path = target.with_name(f".{target.stem}.{os.getpid()}.tmp.xlsx")
+        combined.to_excel(tmp_path, index=False)
+        os.replace(tmp_path, target)
+
+    return len(rows), duplicates, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="+", type=Path)
+    parser.add_argument("--format", choices=["bibtex", "ris", "crossref"],
+                        help="default: from each file's extension")
+    parser.add_argument("--target", type=Path, help="workbook to extend (default: data/publications.xlsx)")
+    parser.add_argument("--dry-run", action="store_true", help="count, but do not write")
+    args = parser.parse_args(argv)
+
+    added, duplicates, skipped = run(args.files, args.format, args.target, args.dry_run)
+    verb = "Would add" if args.dry_run else "Added"
+    print(f"{verb} {added} publication(s); {duplicates} duplicate(s), {skipped} without a title")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+from collections import namedtuple
+from functools import lru_cache
+from html import escape
+from itertools import groupby
+
+import streamlit as st
+
+from core import assets, cards, facets, records, render_cache, search, store
+
+# -------------------------------------------------
+# SOURCES
+# -------------------------------------------------
+Source = namedtuple("Source", ["sheet", "records", "index", "facets", "card"])
+
+SOURCES = {
+    "publications": Source(
+        "publications", records.publications,
+        search.publication_index, facets.publication_facets,
+        cards.publication_card,
+    ),
+    "projects": Source(
+        "active_research", records.projects,
+        search.project_index, facets.project_facets,
+        cards.project_card,
+    ),
+}
+
+PAGE_SIZE = 20
+
+# ids: record positions in display order (relevance when searching,
+# otherwise newest first). counts: live facet counts for the tag filter.
+Selection = namedtuple("Selection", ["ids", "counts", "ranked"])
+
+
+# -------------------------------------------------
+# SELECTION
+# -------------------------------------------------
+@lru_cache(maxsize=256)
+def _select(kind, version, query, tags, mode):
+    source = SOURCES[kind]
+    if store.ENABLED:
+        return Selection(*store.select(source.sheet, query, tags, mode))
+
+    tag_index = source.facets()
+    size = tag_index.size
+
+    ranked = source.index().search(query)
+    base = tag_index.all if ranked is None else facets.to_mask(ranked, size)
+    result = base & tag_index.select(tags, mode)
+    counts = tag_index.counts(result if mode == "all" else base)
+
+    if ranked is not None:
+        keep = facets.members(result, size)
+        ids = tuple(i for i in ranked if keep(i))
+    elif tags:
+        ids = tuple(facets.to_ids(result, size))
+    else:
+        ids = tuple(range(size))
+
+    return Selection(ids, counts, ranked is not None)
+
+
+def select(kind, query="", tags=(), mode="any"):
+    """Filtered, ordered record ids for a list view, cached per data
+    version and filter state."""
+    version = store.version(SOURCES[kind].sheet)
+    return _select(kind, version, query, tuple(tags), mode)
+
+
+# -------------------------------------------------
+# RESULTS
+# -------------------------------------------------
+def _results_html(kind, query, tags, mode, limit):
+    source = SOURCES[kind]
+    selection = select(kind, query, tags, mode)
+    if store.ENABLED:
+        visible = store.rows(source.sheet, selection.ids[:limit])
+    else:
+        items = source.records()
+        visible = [items[i] for i in selection.ids[:limit]]
+
+    if selection.ranked:
+        # Search results stay in relevance order.
+        return "".join(source.card(item, show_year=True) for item in visible)
+
+    # Records are already ordered newest first.
+    parts = []
+    for year, group in groupby(visible, key=lambda item: item.year):
+        parts.append(f"<h2>{escape(str(year))}</h2>")
+        parts.extend(source.card(item) for item in group)
+    return "".join(parts)
+
+
+def results_html(kind, query="", tags=(), mode="any", limit=PAGE_SIZE):
+    """The first `limit` cards of a list view as one HTML block, shared
+    across sessions per data/asset version and filter state, so the
+    default view is a single lookup for every visitor after the first."""
+    key = (
+        "results", kind, store.version(SOURCES[kind].sheet), assets.version(),
+        query, tuple(tags), mode, limit,
+    )
+    return render_cache.cached(
+        key, lambda: _results_html(kind, query, tags, mode, limit),
+        depends=(SOURCES[kind].sheet, "assets"),
+    )
+
+
+# -------------------------------------------------
+# LOAD MORE
+# -------------------------------------------------
+def page_limit(key, signature):
+    """Number of rows to show; starts at one page and resets whenever the
+    filter `signature` changes."""
+    state = st.session_state
+    if state.get(f"{key}_signature") != signature:
+        state[f"{key}_signature"] = signature
+        state[key] = PAGE_SIZE
+    return state[key]
+
+
+def _grow(key):
+    st.session_state[key] += PAGE_SIZE
+
+
+def load_more(key, shown, total):
+    if shown >= total:
+        return
+
+    st.caption(f"Showing {shown} of {total}")
+    st.button(
+        f"Load {min(PAGE_SIZE, total - shown)} more",
+        key=f"{key}_more",
+        on_click=_grow,
+        args=(key,),
+    )
@@ -0,0 +1,158 @@
+from collections import namedtuple
+
+from core import catalog
+
+# pandas is imported inside the builders: a process whose metrics all
+# come from the snapshot (python -m core.snapshot) never loads it.
+
+# -------------------------------------------------
+# METRIC TYPES
+# -------------------------------------------------
+# people: (role, level, status) -> count
+PeopleMetrics = namedtuple("PeopleMetrics", ["total", "people"])
+# per_year: year -> count; keywords: keyword -> count (most common first)
+PublicationMetrics = namedtuple("PublicationMetrics", ["total", "per_year", "keywords"])
+# by_status: status -> count
+ProjectMetrics = namedtuple("ProjectMetrics", ["total", "per_year", "by_status", "keywords"])
+# pandas objects for charts: per_year (Series over every year in range),
+# keyword_year (keyword x year counts, most used first), pairs (keyword,
+# with, count), breakdown (venues for publications, status for projects).
+Trends = namedtuple("Trends", ["per_year", "keyword_year", "pairs", "breakdown"])
+
+
+# -------------------------------------------------
+# COLUMN HELPERS
+# -------------------------------------------------
+def _strings(df, column):
+    import pandas as pd
+
+    if column not in df.columns:
+        return pd.Series("", index=df.index)
+    return df[column].fillna("").astype(str).str.strip()
+
+
+def _years(df):
+    import pandas as pd
+
+    if "year" not in df.columns:
+        return pd.Series(0, index=df.index)
+    return pd.to_numeric(df["year"], errors="coerce").fillna(0).astype(int)
+
+
+def _keyword_counts(df):
+    # One vectorized split/explode over the whole column.
+    keywords = _strings(df, "keywords").str.split(";").explode().str.strip()
+    return keywords[keywords != ""].value_counts().to_dict()
+
+
+def _per_year(df):
+    return _years(df).value_counts().sort_index().to_dict()
+
+
+def _keyword_rows(df):
+    """One row per (record, keyword) with the record's year."""
+    import pandas as pd
+
+    keywords = _strings(df, "keywords").str.split(";").explode().str.strip()
+    rows = pd.DataFrame({
+        "doc": keywords.index,
+        "keyword": keywords.values,
+        "year": _years(df).loc[keywords.index].values,
+    })
+    return rows[rows["keyword"] != ""].drop_duplicates(["doc", "keyword"])
+
+
+# -------------------------------------------------
+# BUILDERS
+# -------------------------------------------------
+def _people(df):
+    import pandas as pd
+
+    columns = pd.DataFrame({
+        "role": _strings(df, "role"),
+        "level": _strings(df, "level"),
+        "status": _strings(df, "status"),
+    })
+    counts = columns.groupby(["role", "level", "status"]).size()
+    return PeopleMetrics(len(df), counts.to_dict())
+
+
+def _publications(df):
+    return PublicationMetrics(len(df), _per_year(df), _keyword_counts(df))
+
+
+def _projects(df):
+    by_status = _strings(df, "status").value_counts().to_dict()
+    return ProjectMetrics(len(df), _per_year(df), by_status, _keyword_counts(df))
+
+
+def _trends(df, breakdown_column):
+    import pandas as pd
+
+    years = _years(df)
+    known = years[years > 0]
+    if known.empty:
+        per_year = pd.Series(dtype=int)
+    else:
+        span = range(known.min(), known.max() + 1)
+        per_year = known.value_counts().reindex(span, fill_value=0)
+
+    rows = _keyword_rows(df)
+    dated = rows[rows["year"] > 0]
+    keyword_year = pd.crosstab(dated["keyword"], dated["year"])
+    keyword_year = keyword_year.loc[keyword_year.sum(axis=1).sort_values(ascending=False).index]
+
+    # Self-join on the record to get every keyword pair once per record.
+    joined = rows[["doc", "keyword"]].merge(rows[["doc", "keyword"]], on="doc")
+    joined = joined[joined["keyword_x"] < joined["keyword_y"]]
+    pairs = (
+        joined.groupby(["keyword_x", "keyword_y"]).size()
+        .sort_values(ascending=False, kind="stable")
+        .rename("count").reset_index()
+        .rename(columns={"keyword_x": "keyword", "keyword_y": "with"})
+    )
+
+    breakdown = _strings(df, breakdown_column)
+    breakdown = breakdown[breakdown != ""].value_counts()
+    return Trends(per_year, keyword_year, pairs, breakdown)
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+# Each is one pass over its workbook, cached per data version. Missing
+# workbooks count as empty so the Home tab never fails on them.
+def people_metrics():
+    if not catalog.exists("people"):
+        return PeopleMetrics(0, {})
+    return catalog.derived("people", "metrics", _people)
+
+
+def publication_metrics():
+    if not catalog.exists("publications"):
+        return PublicationMetrics(0, {}, {})
+    return catalog.derived("publications", "metrics", _publications)
+
+
+def project_metrics():
+    if not catalog.exists("active_research"):
+        return ProjectMetrics(0, {}, {}, {})
+    return catalog.derived("active_research", "metrics", _projects)
+
+
+def publication_trends():
+    """Per-year, keyword-by-year, keyword pair and venue aggregates."""
+    return catalog.derived("publications", "trends", lambda df: _trends(df, "journal"))
+
+
+def project_trends():
+    """As publication_trends, with projects by status as the breakdown."""
+    return catalog.derived("active_research", "trends", lambda df: _trends(df, "status"))
+
+
+def count_people(role=None, level=None, status=None):
+    """People matching every given role/level/status (None matches any)."""
+    return sum(
+        n for (r, l, s), n in people_metrics().people.items()
+        if role in (None, r) and level in (None, l) and status in (None, s)
+    )
@@ -0,0 +1,149 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from core import catalog, render_cache
+
+# -------------------------------------------------
+# SETTINGS
+# -------------------------------------------------
+# Opt-in: NANOTECH_PROFILE=1 streamlit run app.py
+# The panel is then shown in the sidebar for ?debug=profile.
+ENABLED = os.environ.get("NANOTECH_PROFILE", "") not in ("", "0", "false")
+LOG_PATH = Path(os.environ.get("NANOTECH_PROFILE_LOG", "logs/profile.jsonl"))
+HISTORY = 500
+
+# Most recent measurements across all sessions in this process.
+entries = deque(maxlen=HISTORY)
+_log_lock = threading.Lock()
+
+
+# -------------------------------------------------
+# HELPERS
+# -------------------------------------------------
+class _ElementCounter:
+    """Counts delta messages sent to the browser while installed."""
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.count = 0
+        self._original = None
+
+    def _enqueue(self, msg):
+        if msg.HasField("delta"):
+            self.count += 1
+        self._original(msg)
+
+    def __enter__(self):
+        if self.ctx is not None:
+            self._original = self.ctx._enqueue
+            self.ctx._enqueue = self._enqueue
+        return self
+
+    def __exit__(self, *exc):
+        if self.ctx is not None:
+            self.ctx._enqueue = self._original
+
+
+def _rows(result):
+    """len() of a list-like result. Records such as Selection or Trends
+    are namedtuples, whose len() is their field count, not a row count."""
+    if hasattr(result, "_fields"):
+        return None
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+
+def _write(entry):
+    entries.append(entry)
+    with _log_lock:
+        LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with LOG_PATH.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(entry) + "\n")
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+def profiled(name, rows=_rows):
+    """Record wall time, elements emitted, catalog and render cache
+    hits/misses and rows returned for each call. `rows(result)` counts
+    the rows for results that are not plain sequences. Names are
+    "<stage>:<what>": loader:publications, fragment:people, tab:home.
+    A no-op unless profiling is enabled."""
+
+    def decorate(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            ctx = get_script_run_ctx(suppress_warning=True)
+            hits, misses = catalog.stats["hit"], catalog.stats["miss"]
+            render_hits, render_misses = render_cache.stats["hit"], render_cache.stats["miss"]
+            start = time.perf_counter()
+
+            with _ElementCounter(ctx) as counter:
+                result = func(*args, **kwargs)
+
+            new_misses = catalog.stats["miss"] - misses
+            entry = {
+                "ts": round(time.time(), 3),
+                "session": ctx.session_id[:8] if ctx else None,
+                "name": name,
+                "ms": round((time.perf_counter() - start) * 1000, 2),
+                "elements": counter.count,
+                "cache": "miss" if new_misses else "hit",
+                "cache_hits": catalog.stats["hit"] - hits,
+                "cache_misses": new_misses,
+                "render_hits": render_cache.stats["hit"] - render_hits,
+                "render_misses": render_cache.stats["miss"] - render_misses,
+            }
+            # Counted after the cache deltas, which a counter may touch.
+            entry["rows"] = rows(result)
+            _write(entry)
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+def render_panel():
+    """Sidebar table of recent measurements, for ?debug=profile."""
+    if not ENABLED or st.query_params.get("debug") != "profile":
+        return
+
+    with st.sidebar.expander("Render profile", expanded=True):
+        recent = list(entries)[-100:][::-1]
+        if not recent:
+            st.caption("No measurements yet.")
+            return
+
+        summary = {}
+        for entry in entries:
+            stats = summary.setdefault(entry["name"], [])
+            stats.append(entry["ms"])
+        st.dataframe(
+            [
+                {
+                    "name": name,
+                    "calls": len(times),
+                    "mean ms": round(sum(times) / len(times), 2),
+                    "max ms": max(times),
+                }
+                for name, times in sorted(summary.items())
+            ],
+            hide_index=True,
+        )
+        st.dataframe(recent, hide_index=True)
+        st.caption(f"Appending to {LOG_PATH}")
@@ -0,0 +1,312 @@
+"""Particle size distribution (PSD) analysis.
+
+Reads either a list of particle sizes (one row per particle) or a binned
+distribution (size class, amount per class) from CSV, TXT or Excel, and
+computes number- and volume-weighted distributions, D10/D50/D90, span
+and mean diameters. Everything past the file read is vectorized NumPy,
+so a sample of millions of particles takes well under a second:
+
+    python -m core.psd sizes.csv
+    python -m core.psd laser.xlsx --size "Size (um)" --amount "Volume %" --basis volume
+"""
+import argparse
+import csv
+import hashlib
+import io
+import re
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+
+import numpy as np
+
+# -------------------------------------------------
+# SETTINGS
+# -------------------------------------------------
+# Geometric bins for the distribution of a size list.
+BINS = 60
+PERCENTILES = (10, 50, 90)
+BASES = {"number": "Number", "volume": "Volume"}
+EXCEL_SUFFIXES = (".xlsx", ".xls")
+# Rows read to list the columns and detect delimiter and header.
+HEAD_BYTES = 64 * 1024
+# Analyzed uploads kept per process (least recently used dropped first);
+# kept apart from render_cache so large uploads never evict list views.
+MAX_RESULTS = 8
+
+_results = OrderedDict()
+_lock = threading.Lock()
+
+NUMBER_RE = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+SIZE_NAMES = ("size", "diameter", "length", "d")
+AMOUNT_NAMES = ("count", "number", "freq", "volume", "amount", "%", "fraction", "q")
+
+# d10, d50, d90: size below which that share of the sample lies; span:
+# (d90 - d10) / d50; mean, std: weighted arithmetic; geo_mean, geo_std:
+# weighted geometric mean and (dimensionless) geometric std.
+Stats = namedtuple("Stats", ["d10", "d50", "d90", "span", "mean", "std", "geo_mean", "geo_std", "mode"])
+# kind: "list" or "binned"; particles: particles (list) or size classes
+# (binned) used; dropped: rows skipped as blank, non-numeric or <= 0;
+# stats: basis -> Stats; moments: "D[1,0]", "D[3,2]", "D[4,3]";
+# table: DataFrame of size, number %, volume % and both cumulative curves.
+PSD = namedtuple("PSD", ["kind", "particles", "dropped", "stats", "moments", "table"])
+
+
+# -------------------------------------------------
+# READING
+# -------------------------------------------------
+def _delimiter(lines):
+    for sep in ("\t", ";", ","):
+        if lines and all(sep in l for l in lines):
+            return sep
+    return r"\s+"
+
+
+def _fields(line, sep):
+    if sep == r"\s+":
+        return line.split()
+    return [c.strip() for c in next(csv.reader([line], delimiter=sep))]
+
+
+def _has_header(line, sep):
+    return not all(NUMBER_RE.match(c) for c in _fields(line, sep) if c)
+
+
+def _read(raw, filename, nrows=None, usecols=None):
+    """DataFrame of an uploaded file. Files without a header row get
+    "Column 1", "Column 2", ... names."""
+    import pandas as pd
+
+    if filename.lower().endswith(EXCEL_SUFFIXES):
+        df = pd.read_excel(io.BytesIO(raw), nrows=nrows)
+        df.columns = [str(c) for c in df.columns]
+        return df[usecols] if usecols else df
+
+    lines = [l for l in raw[:HEAD_BYTES].decode("utf-8-sig", "replace").splitlines() if l.strip()]
+    # The separator comes from the data rows: a header such as "Particle
+    # size (um)" has spaces (or commas) that separate nothing.
+    sep = _delimiter(lines[1:21] or lines[:1])
+    header = bool(lines) and _has_header(lines[0], sep)
+    rows = lines[1:21] if header else lines[:20]
+    width = max((len(_fields(l, sep)) for l in rows), default=1)
+    if not header:
+        names = [f"Column {i + 1}" for i in range(width)]
+    elif width == 1:
+        names = [lines[0].strip().strip('"')]
+    else:
+        names = _fields(lines[0], sep)
+        if len(names) != width:
+            # e.g. several columns with multi-word headers split on spaces
+            names = [f"Column {i + 1}" for i in range(width)]
+    return pd.read_csv(io.BytesIO(raw), sep=sep, header=0 if header else None, names=names,
+                       nrows=nrows, usecols=usecols, encoding="utf-8-sig", skip_blank_lines=True)
+
+
+def _guess(columns, hints, skip=()):
+    """First column whose name matches one of `hints`, in hint order."""
+    candidates = [c for c in columns if c not in skip]
+    for hint in hints:
+        for column in candidates:
+            words = re.findall(r"[a-z%]+", column.lower())
+            if hint in words or (len(hint) > 1 and hint in column.lower()):
+                return column
+    return None
+
+
+def columns(raw, filename):
+    """(columns, size column guess, amount column guess) from the first
+    rows of an uploaded file. The size guess falls back to the first
+    column; the amount guess is None unless a column is named like one."""
+    names = list(_read(raw, filename, nrows=5).columns)
+    size = _guess(names, SIZE_NAMES) or names[0]
+    return names, size, _guess(names, AMOUNT_NAMES, skip=[size])
+
+
+def _numbers(series):
+    import pandas as pd
+
+    return pd.to_numeric(series, errors="coerce").to_numpy(dtype=float)
+
+
+# -------------------------------------------------
+# ENGINE
+# -------------------------------------------------
+def _percentiles(sizes, cum):
+    """D10/D50/D90 by linear interpolation on the cumulative curve `cum`
+    (running weight totals). Each size (particle or class) sits at the
+    midpoint of its own step, so a single particle or class is not pushed
+    to either end. Empty classes are no interpolation points."""
+    weights = np.diff(cum, prepend=0)
+    used = weights > 0
+    mid = (cum[used] - weights[used] / 2) / cum[-1]
+    return np.interp(np.asarray(PERCENTILES) / 100, mid, sizes[used])
+
+
+def _stats(sizes, logs, weights):
+    """(Stats without the mode, cumulative weights)."""
+    cum = np.cumsum(weights)
+    d10, d50, d90 = _percentiles(sizes, cum)
+    total = cum[-1]
+    mean = weights @ sizes / total
+    log_mean = weights @ logs / total
+    std = np.sqrt(weights @ np.square(sizes - mean) / total)
+    log_std = np.sqrt(weights @ np.square(logs - log_mean) / total)
+    return Stats(
+        float(d10), float(d50), float(d90), float((d90 - d10) / d50),
+        float(mean), float(std), float(np.exp(log_mean)), float(np.exp(log_std)), None,
+    ), cum
+
+
+def _table(centers, number, volume):
+    import pandas as pd
+
+    number = number / number.sum() * 100
+    volume = volume / volume.sum() * 100
+    return pd.DataFrame({
+        "size": centers,
+        "number %": number,
+        "volume %": volume,
+        "cumulative number %": np.cumsum(number),
+        "cumulative volume %": np.cumsum(volume),
+    })
+
+
+def _histogram(sizes, bins):
+    """(bin centers, bin index bounds) of geometric bins over sorted
+    `sizes`; bin i holds sizes[bounds[i]:bounds[i + 1]]."""
+    low, high = sizes[0], sizes[-1]
+    if high <= low:
+        low, high = low * 0.9, high * 1.1
+    edges = np.geomspace(low, high, bins + 1)
+    bounds = np.searchsorted(sizes, edges, side="right")
+    bounds[0] = 0
+    bounds[-1] = sizes.size
+    return np.sqrt(edges[:-1] * edges[1:]), bounds
+
+
+def _binned(cum, bounds):
+    return np.diff(np.concatenate(([0.0], cum))[bounds])
+
+
+def analyze(sizes, amounts=None, basis="number", bins=BINS):
+    """PSD for particle `sizes`, or for size classes with `amounts` of
+    the given basis ("number": counts or number %; "volume": volume or
+    mass %). Rows with a missing, non-numeric or non-positive size (or a
+    missing or negative amount) are dropped."""
+    sizes = np.asarray(sizes, dtype=float)
+    valid = np.isfinite(sizes) & (sizes > 0)
+    if amounts is not None:
+        amounts = np.asarray(amounts, dtype=float)
+        valid &= np.isfinite(amounts) & (amounts >= 0)
+    dropped = int(sizes.size - valid.sum())
+
+    if amounts is None:
+        kind = "list"
+        sizes = np.sort(sizes[valid])
+        if not sizes.size:
+            raise ValueError("No positive particle sizes found.")
+        number = np.ones_like(sizes)
+    else:
+        kind = "binned"
+        order = np.argsort(sizes[valid], kind="stable")
+        sizes, amounts = sizes[valid][order], amounts[valid][order]
+        if not sizes.size or not amounts.sum():
+            raise ValueError("No size classes with a positive amount found.")
+        number = amounts
+    cubes = sizes * sizes * sizes
+    if kind == "binned" and basis == "volume":
+        # Volume per class ~ particles x size^3.
+        number = amounts / cubes
+    volume = number * cubes
+    logs = np.log(sizes)
+    number_stats, number_cum = _stats(sizes, logs, number)
+    volume_stats, volume_cum = _stats(sizes, logs, volume)
+
+    if kind == "list":
+        # Sizes are sorted, so each bin is a slice: its share is a
+        # difference of the cumulative sums at the bin bounds.
+        centers, bounds = _histogram(sizes, bins)
+        binned_number = _binned(number_cum, bounds)
+        binned_volume = _binned(volume_cum, bounds)
+    else:
+        centers, binned_number, binned_volume = sizes, number, volume
+
+    m0, m1, m2 = number_cum[-1], number @ sizes, number @ (sizes * sizes)
+    m3, m4 = volume_cum[-1], volume @ sizes
+    return PSD(
+        kind,
+        int(sizes.size),
+        dropped,
+        {
+            "number": number_stats._replace(mode=float(centers[np.argmax(binned_number)])),
+            "volume": volume_stats._replace(mode=float(centers[np.argmax(binned_volume)])),
+        },
+        {"D[1,0]": float(m1 / m0), "D[3,2]": float(m3 / m2), "D[4,3]": float(m4 / m3)},
+        _table(centers, binned_number, binned_volume),
+    )
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+def digest(raw):
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def analyze_file(raw, filename, size, amount=None, basis="number", bins=BINS):
+    """analyze() for an uploaded file's `size` (and `amount`) column."""
+    usecols = [size] + ([amount] if amount else [])
+    df = _read(raw, filename, usecols=usecols)
+    return analyze(
+        _numbers(df[size]),
+        _numbers(df[amount]) if amount else None,
+        basis, bins,
+    )
+
+
+def summarize(raw, filename, size, amount=None, basis="number", bins=BINS):
+    """analyze_file(), cached by the file's content hash and the options,
+    so reruns and repeated uploads of the same file reuse the result."""
+    key = (digest(raw), Path(filename).suffix.lower(), size, amount, basis, bins)
+    with _lock:
+        if key in _results:
+            _results.move_to_end(key)
+            return _results[key]
+
+    result = analyze_file(raw, filename, size, amount, basis, bins)
+
+    with _lock:
+        _results[key] = result
+        while len(_results) > MAX_RESULTS:
+            _results.popitem(last=False)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file", type=Path)
+    parser.add_argument("--size", help="size column (default: guessed)")
+    parser.add_argument("--amount", help="amount column of a binned distribution")
+    parser.add_argument("--basis", choices=list(BASES), default="number", help="basis of --amount")
+    parser.add_argument("--bins", type=int, default=BINS)
+    args = parser.parse_args(argv)
+
+    raw = args.file.read_bytes()
+    names, size, _ = columns(raw, args.file.name)
+    size = args.size or size
+    for column in (size, args.amount):
+        if column and column not in names:
+            parser.error(f"no column {column!r} in {args.file} (columns: {', '.join(names)})")
+
+    result = analyze_file(raw, args.file.name, size, args.amount, args.basis, args.bins)
+    print(f"{result.particles} {'particles' if result.kind == 'list' else 'size classes'}"
+          f", {result.dropped} rows dropped")
+    print(f"{'':<8}" + "".join(f"{f:>11}" for f in Stats._fields))
+    for basis, stats in result.stats.items():
+        print(f"{basis:<8}" + "".join(f"{v:>11.4g}" for v in stats))
+    print("  ".join(f"{name} = {value:.4g}" for name, value in result.moments.items()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+from collections import namedtuple
+
+from core import assets, catalog
+
+# -------------------------------------------------
+# RECORD TYPES
+# -------------------------------------------------
+# namedtuples are immutable, carry no per-instance __dict__ and hash by
+# value, so parsed rows can be shared across sessions and used as keys.
+Publication = namedtuple("Publication", [
+    "id", "year", "title", "authors", "tags", "abstract",
+    "image", "link", "contact", "journal", "featured",
+])
+
+Project = namedtuple("Project", [
+    "id", "year", "title", "researchers", "status", "tags",
+    "description", "link", "contact", "featured",
+])
+
+Person = namedtuple("Person", [
+    "id", "name", "role", "level", "status", "image",
+    "bio", "research", "email", "link",
+])
+
+ResearchTrack = namedtuple("ResearchTrack", ["title", "image", "description"])
+
+TRACK_PLACEHOLDER = "assets/placeholders/square_placeholder.png"
+
+# -------------------------------------------------
+# COLUMN HELPERS
+# -------------------------------------------------
+def _text(df, column):
+    if column not in df.columns:
+        return [""] * len(df)
+    values = df[column]
+    return values.where(values.notna(), "").astype(str).str.strip().tolist()
+
+
+def _split(texts, sort=False):
+    out = []
+    for text in texts:
+        items = [t.strip() for t in text.split(";")] if text else []
+        items = [t for t in items if t]
+        out.append(tuple(sorted(items) if sort else items))
+    return out
+
+
+def _years(df):
+    import pandas as pd
+
+    if "year" not in df.columns:
+        return [0] * len(df)
+    return pd.to_numeric(df["year"], errors="coerce").fillna(0).astype(int).tolist()
+
+
+def _flags(df, column):
+    if column not in df.columns:
+        return [False] * len(df)
+    return df[column].fillna(False).astype(bool).tolist()
+
+
+def resolve_image(folder, image_value):
+    placeholder = assets.resolve(folder, "placeholder", "")
+    return assets.resolve(folder, image_value, placeholder)
+
+
+def _images(folder, values):
+    # Many rows share an image (or the placeholder); resolve each name once.
+    resolved = {v: resolve_image(folder, v) for v in set(values)}
+    return [resolved[v] for v in values]
+
+
+# -------------------------------------------------
+# PARSERS
+# -------------------------------------------------
+def _parse_publications(df):
+    rows = zip(
+        _text(df, "id"),
+        _years(df),
+        _text(df, "title"),
+        _text(df, "authors"),
+        _split(_text(df, "keywords"), sort=True),
+        _text(df, "abstract"),
+        _images("publications", _text(df, "image")),
+        _text(df, "link"),
+        _text(df, "contact"),
+        _text(df, "journal"),
+        _flags(df, "featured"),
+    )
+    records = [Publication(*row) for row in rows]
+    records.sort(key=lambda r: r.year, reverse=True)
+    return tuple(records)
+
+
+def _parse_projects(df):
+    rows = zip(
+        _text(df, "id"),
+        _years(df),
+        _text(df, "title"),
+        _text(df, "researchers"),
+        _text(df, "status"),
+        _split(_text(df, "keywords"), sort=True),
+        _text(df, "description"),
+        _text(df, "link"),
+        _text(df, "contact"),
+        _flags(df, "featured"),
+    )
+    records = [Project(*row) for row in rows]
+    records.sort(key=lambda r: r.year, reverse=True)
+    return tuple(records)
+
+
+def _parse_people(df):
+    rows = zip(
+        _text(df, "id"),
+        _text(df, "name"),
+        _text(df, "role"),
+        _text(df, "level"),
+        _text(df, "status"),
+        _images("people", _text(df, "image")),
+        _text(df, "bio"),
+        _split(_text(df, "research")),
+        _text(df, "email"),
+        _text(df, "links"),
+    )
+    return tuple(Person(*row) for row in rows)
+
+
+def _parse_research_tracks(df):
+    paths = _text(df, "image_path")
+    placeholder = TRACK_PLACEHOLDER if assets.exists(TRACK_PLACEHOLDER) else ""
+    images = [p if assets.exists(p) else placeholder for p in paths]
+    rows = zip(_text(df, "title"), images, _text(df, "description"))
+    return tuple(ResearchTrack(*row) for row in rows)
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+# Records that embed resolved image paths are also keyed on the asset
+# paths (assets.layout()), so adding a photo refreshes them without a data
+# edit, while touching or re-copying a file does not.
+def publications():
+    return catalog.derived(
+        "publications", "records", _parse_publications, token=assets.layout()
+    )
+
+
+def projects():
+    return catalog.derived("active_research", "records", _parse_projects)
+
+
+def people():
+    return catalog.derived(
+        "people", "records", _parse_people, token=assets.layout()
+    )
+
+
+def research_tracks():
+    return catalog.derived(
+        "research_tracks", "records", _parse_research_tracks, token=assets.layout()
+    )
+
+
+def _image_references(people_df, publications_df, tracks_df):
+    refs = []
+    for name, folder, df in [
+        ("people", "people", people_df),
+        ("publications", "publications", publications_df),
+    ]:
+        source = catalog.WORKBOOKS[name]
+        for value in dict.fromkeys(_text(df, "image")):
+            if value:
+                stem = value.rsplit(".", 1)[0]
+                refs.append((source, assets.resolve(folder, value, f"assets/{folder}/{stem}.png")))
+        refs.append((source, f"assets/{folder}/placeholder.png"))
+
+    source = catalog.WORKBOOKS["research_tracks"]
+    for value in dict.fromkeys(_text(tracks_df, "image_path")):
+        if value:
+            refs.append((source, value))
+    refs.append((source, TRACK_PLACEHOLDER))
+    return tuple(refs)
+
+
+def image_references():
+    """(source, asset path) pairs for every image the workbooks point at.
+
+    Names that resolve to no file are reported under their expected .png
+    path, which is what an editor would add.
+    """
+    return catalog.derived(
+        ("people", "publications", "research_tracks"), "image_references",
+        _image_references, token=assets.layout(),
+    )
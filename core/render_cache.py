@@ -0,0 +1,60 @@
+import threading
+from collections import Counter, OrderedDict
+
+# -------------------------------------------------
+# SETTINGS
+# -------------------------------------------------
+# Rendered output shared by every session in the process. Keys carry the
+# data and asset versions, so entries for old data are never hit again
+# and simply age out.
+MAX_ENTRIES = 512
+
+_entries = OrderedDict()
+# key -> names of the inputs it was rendered from ("people", "assets", ...)
+_depends = {}
+_lock = threading.Lock()
+# Hit/miss counters, read by the profiler.
+stats = Counter()
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+def cached(key, render, depends=()):
+    """Return the cached value for `key`, calling `render()` on a miss.
+    Least recently used entries are evicted past MAX_ENTRIES. `depends`
+    names the workbooks (and "assets") the value was rendered from, for
+    invalidate()."""
+    with _lock:
+        if key in _entries:
+            _entries.move_to_end(key)
+            stats["hit"] += 1
+            return _entries[key]
+
+    # Rendered outside the lock; two sessions missing the same key at
+    # once both render, and the second result wins.
+    value = render()
+
+    with _lock:
+        stats["miss"] += 1
+        _entries[key] = value
+        _entries.move_to_end(key)
+        _depends[key] = frozenset(depends)
+        while len(_entries) > MAX_ENTRIES:
+            old, _ = _entries.popitem(last=False)
+            _depends.pop(old, None)
+    return value
+
+
+def invalidate(name):
+    """Drop every entry rendered from workbook `name` (or "assets")."""
+    with _lock:
+        for key in [k for k, names in _depends.items() if name in names]:
+            _entries.pop(key, None)
+            del _depends[key]
+
+
+def clear():
+    with _lock:
+        _entries.clear()
+        _depends.clear()
@@ -0,0 +1,178 @@
+import math
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+
+from core import catalog, records
+
+# -------------------------------------------------
+# FIELD WEIGHTS
+# -------------------------------------------------
+PUBLICATION_FIELDS = {
+    "title": 3.0,
+    "tags": 2.5,
+    "authors": 2.0,
+    "journal": 1.0,
+    "abstract": 1.0,
+}
+
+PROJECT_FIELDS = {
+    "title": 3.0,
+    "tags": 2.5,
+    "researchers": 2.0,
+    "status": 1.5,
+    "description": 1.0,
+}
+
+# Prefix expansions ("cryst" -> "crystallization") score slightly below
+# an exact term match.
+PREFIX_WEIGHT = 0.8
+QUERY_CACHE_SIZE = 256
+
+TOKEN_RE = re.compile(r"\w+")
+
+# -------------------------------------------------
+# TOKENIZER
+# -------------------------------------------------
+def fold(text):
+    """Lowercase and strip diacritics so "Ordoña" matches "ordona"."""
+    text = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(fold(text))
+
+
+def _field_text(record, field):
+    value = getattr(record, field)
+    return " ".join(value) if isinstance(value, tuple) else value
+
+
+# -------------------------------------------------
+# INDEX
+# -------------------------------------------------
+class SearchIndex:
+    """BM25F inverted index over a tuple of records.
+
+    Document ids are positions in the records tuple, so results can be
+    mapped back with `records[i]`.
+    """
+
+    def __init__(self, docs, fields, k1=1.2, b=0.75):
+        self.size = len(docs)
+        self._queries = OrderedDict()
+        self._lock = threading.Lock()
+
+        # term -> doc -> weighted, length-normalised term frequency
+        weighted = {}
+        lengths = {f: [] for f in fields}
+        field_terms = {f: [] for f in fields}
+
+        for field in fields:
+            for record in docs:
+                tokens = tokenize(_field_text(record, field))
+                lengths[field].append(len(tokens))
+                field_terms[field].append(Counter(tokens))
+
+        for field, weight in fields.items():
+            avg = (sum(lengths[field]) / self.size) if self.size else 0.0
+            for doc, counts in enumerate(field_terms[field]):
+                if not counts:
+                    continue
+                norm = 1 - b + b * (lengths[field][doc] / avg if avg else 0.0)
+                for term, tf in counts.items():
+                    per_doc = weighted.setdefault(term, {})
+                    per_doc[doc] = per_doc.get(doc, 0.0) + weight * tf / norm
+
+        self._postings = {}
+        for term, per_doc in weighted.items():
+            df = len(per_doc)
+            idf = math.log(1 + (self.size - df + 0.5) / (df + 0.5))
+            self._postings[term] = {
+                doc: idf * tf / (k1 + tf) for doc, tf in per_doc.items()
+            }
+
+        self._terms = sorted(self._postings)
+
+    # Pickled into snapshots without the lock and the per-process query cache.
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["_lock"], state["_queries"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._queries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expand(self, token):
+        terms = self._terms
+        i = bisect_left(terms, token)
+        # Walk the sorted vocabulary in place; slicing would copy its tail.
+        while i < len(terms) and terms[i].startswith(token):
+            yield terms[i]
+            i += 1
+
+    def _match(self, token):
+        scores = {}
+        for term in self._expand(token):
+            factor = 1.0 if term == token else PREFIX_WEIGHT
+            for doc, score in self._postings[term].items():
+                score *= factor
+                if score > scores.get(doc, 0.0):
+                    scores[doc] = score
+        return scores
+
+    def search(self, query):
+        """Return document ids matching every query term, best first.
+
+        Each term matches as a prefix. Returns None for an empty query so
+        callers can tell "no search" apart from "no results".
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return None
+
+        key = " ".join(tokens)
+        with self._lock:
+            if key in self._queries:
+                self._queries.move_to_end(key)
+                return self._queries[key]
+
+        scores = None
+        for token in tokens:
+            matched = self._match(token)
+            if scores is None:
+                scores = matched
+            else:
+                scores = {d: s + matched[d] for d, s in scores.items() if d in matched}
+            if not scores:
+                break
+
+        ranked = tuple(sorted(scores, key=lambda d: (-scores[d], d)))
+
+        with self._lock:
+            self._queries[key] = ranked
+            if len(self._queries) > QUERY_CACHE_SIZE:
+                self._queries.popitem(last=False)
+        return ranked
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+def publication_index():
+    return catalog.derived(
+        "publications", "search",
+        lambda _: SearchIndex(records.publications(), PUBLICATION_FIELDS),
+    )
+
+
+def project_index():
+    return catalog.derived(
+        "active_research", "search",
+        lambda _: SearchIndex(records.projects(), PROJECT_FIELDS),
+    )
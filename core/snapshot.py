@@ -0,0 +1,59 @@
+"""Prebuild a snapshot of parsed workbooks and derived indexes.
+
+A process that finds the snapshot (data/snapshot.pickle, or
+NANOTECH_SNAPSHOT) serves records, search and facet indexes, statistics
+and author links from it instead of parsing the workbooks with pandas and
+openpyxl. Entries are only used while the workbook contents and the core
+modules are unchanged, so a stale snapshot costs a re-parse, not wrong
+data. Build it after deploying new data or code:
+
+    python -m core.snapshot
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from core import authors, catalog, facets, metrics, records, search
+
+# Everything the tabs build on first use.
+BUILDERS = [
+    records.publications, records.projects, records.people,
+    records.research_tracks, records.image_references,
+    search.publication_index, search.project_index,
+    facets.publication_facets, facets.project_facets,
+    metrics.people_metrics, metrics.publication_metrics, metrics.project_metrics,
+    metrics.publication_trends, metrics.project_trends,
+    authors.links,
+]
+
+
+def build(out=None):
+    """Build every derived value from the workbooks (never from an older
+    snapshot) and write the snapshot. Returns the number written."""
+    catalog.USE_SNAPSHOT = False
+    try:
+        catalog.invalidate()
+        for builder in BUILDERS:
+            try:
+                builder()
+            except FileNotFoundError as exc:
+                print(f"Skipping {builder.__module__}.{builder.__name__}: {exc}")
+        return catalog.save_snapshot(out)
+    finally:
+        catalog.USE_SNAPSHOT = True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, help="default: data/snapshot.pickle")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    written = build(args.out)
+    out = args.out or catalog.snapshot_path()
+    print(f"Wrote {written} derived values to {out} in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,356 @@
+"""Optional SQLite backend for the list views.
+
+With NANOTECH_BACKEND=sqlite each workbook is imported into one table of
+a local database (re-imported when the .xlsx changes). Search runs on
+FTS5, keyword filters on an indexed tag table, and only the visible rows
+are read back. The Excel files stay the editing and exchange format:
+
+    python -m core.store sync             import every changed workbook
+    python -m core.store export --out dir write the tables back to .xlsx
+
+Only the list views (Publications, Active Research, People) and the
+research tracks read through this module. Home statistics, Analytics
+and the author links on People profiles still parse the workbooks
+through core.catalog (or the snapshot, see core.snapshot).
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+from core import assets, catalog, records, search
+
+# -------------------------------------------------
+# SETTINGS
+# -------------------------------------------------
+BACKEND = os.environ.get("NANOTECH_BACKEND", "excel")
+ENABLED = BACKEND == "sqlite"
+# Defaults to data/nanotech.sqlite, beside the workbooks.
+DB_PATH = os.environ.get("NANOTECH_DB", "")
+
+# -------------------------------------------------
+# TABLES
+# -------------------------------------------------
+# columns: sheet columns, stored as the records module normalizes them;
+# tags: the "; "-separated column indexed for filtering; fts: searchable
+# columns and their bm25 weights; indexes: columns with a B-tree index.
+Table = namedtuple("Table", ["columns", "tags", "fts", "indexes", "record"])
+
+
+def _tags(text, sort=False):
+    return records._split([text], sort=sort)[0]
+
+
+def _publication(row):
+    _, id_, year, title, authors, keywords, abstract, image, link, contact, featured, journal = row
+    return records.Publication(
+        id_, year, title, authors, _tags(keywords, sort=True), abstract,
+        records.resolve_image("publications", image), link, contact, journal, bool(featured),
+    )
+
+
+def _project(row):
+    _, id_, year, title, researchers, status, keywords, description, link, contact, featured = row
+    return records.Project(
+        id_, year, title, researchers, status, _tags(keywords, sort=True),
+        description, link, contact, bool(featured),
+    )
+
+
+def _person(row):
+    _, id_, name, role, level, status, image, bio, research, email, links = row
+    return records.Person(
+        id_, name, role, level, status, records.resolve_image("people", image),
+        bio, _tags(research), email, links,
+    )
+
+
+def _track(row):
+    _, title, image_path, description = row
+    if not assets.exists(image_path):
+        placeholder = records.TRACK_PLACEHOLDER
+        image_path = placeholder if assets.exists(placeholder) else ""
+    return records.ResearchTrack(title, image_path, description)
+
+
+def _weights(fields, rename):
+    return {rename.get(field, field): weight for field, weight in fields.items()}
+
+
+TABLES = {
+    "publications": Table(
+        ["id", "year", "title", "authors", "keywords", "abstract",
+         "image", "link", "contact", "featured", "journal"],
+        "keywords",
+        _weights(search.PUBLICATION_FIELDS, {"tags": "keywords"}),
+        ["year"], _publication,
+    ),
+    "active_research": Table(
+        ["id", "year", "title", "researchers", "status", "keywords",
+         "description", "link", "contact", "featured"],
+        "keywords",
+        _weights(search.PROJECT_FIELDS, {"tags": "keywords"}),
+        ["year", "status"], _project,
+    ),
+    "people": Table(
+        ["id", "name", "role", "level", "status", "image",
+         "bio", "research", "email", "links"],
+        None, None, ["role", "status"], _person,
+    ),
+    "research_tracks": Table(
+        ["title", "image_path", "description"], None, None, [], _track,
+    ),
+}
+
+# (database, name) -> (file stat, data version) of the last import seen
+# by this process
+_meta = {}
+# (database, name) -> (version, records) for load()
+_loaded = {}
+# database path -> connection, shared by every thread; _lock guards it.
+_connections = {}
+_lock = threading.RLock()
+
+
+# -------------------------------------------------
+# CONNECTION
+# -------------------------------------------------
+def path():
+    return Path(DB_PATH) if DB_PATH else catalog.DATA_DIR / "nanotech.sqlite"
+
+
+def _connection():
+    """One connection per process (and database path). Streamlit runs
+    every rerun on a new thread, so per-thread connections would be
+    reopened on almost every rerun. Callers hold _lock while using it."""
+    db = str(path())
+    with _lock:
+        conn = _connections.get(db)
+        if conn is None:
+            conn = sqlite3.connect(db, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, stat TEXT, version TEXT)")
+            _connections[db] = conn
+        return conn
+
+
+# -------------------------------------------------
+# IMPORT
+# -------------------------------------------------
+def _file_stat(name):
+    try:
+        st_ = os.stat(catalog.path(name))
+    except FileNotFoundError:
+        return None
+    return f"{st_.st_mtime_ns}-{st_.st_size}"
+
+
+def _values(df, column):
+    if column == "year":
+        return records._years(df)
+    if column == "featured":
+        return records._flags(df, column)
+    return records._text(df, column)
+
+
+def _import(conn, name, stat, version):
+    table = TABLES[name]
+    df = catalog.load(name)
+    rows = list(zip(*(_values(df, c) for c in table.columns)))
+    if "year" in table.columns:
+        # Same (stable) newest-first order as records.*(), so positions
+        # are interchangeable with record ids from the Excel backend.
+        year = table.columns.index("year")
+        rows.sort(key=lambda r: r[year], reverse=True)
+
+    columns = ", ".join(table.columns)
+    marks = ", ".join("?" * (len(table.columns) + 1))
+    with conn:
+        for suffix in ("_fts", "_tags", ""):
+            conn.execute(f"DROP TABLE IF EXISTS {name}{suffix}")
+        conn.execute(f"CREATE TABLE {name} (pos INTEGER PRIMARY KEY, {columns})")
+        conn.executemany(f"INSERT INTO {name} VALUES ({marks})", ((i, *r) for i, r in enumerate(rows)))
+        for column in table.indexes:
+            conn.execute(f"CREATE INDEX {name}_{column} ON {name} ({column}, pos)")
+
+        if table.tags:
+            tags = table.columns.index(table.tags)
+            conn.execute(f"CREATE TABLE {name}_tags (tag TEXT, pos INTEGER)")
+            conn.executemany(
+                f"INSERT INTO {name}_tags VALUES (?, ?)",
+                ((tag, i) for i, r in enumerate(rows) for tag in dict.fromkeys(_tags(r[tags]))),
+            )
+            conn.execute(f"CREATE INDEX {name}_tags_tag ON {name}_tags (tag, pos)")
+            conn.execute(f"CREATE INDEX {name}_tags_pos ON {name}_tags (pos)")
+
+        if table.fts:
+            conn.execute(
+                f"CREATE VIRTUAL TABLE {name}_fts USING fts5({', '.join(table.fts)}, "
+                f"content='{name}', content_rowid='pos', tokenize='unicode61 remove_diacritics 2')"
+            )
+            conn.execute(f"INSERT INTO {name}_fts ({name}_fts) VALUES ('rebuild')")
+
+        conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?, ?)", (name, stat, version))
+
+
+def sync(name):
+    """Import workbook `name` if its file changed since the last import
+    and return the data version the table holds. Without the .xlsx, the
+    last import is kept."""
+    stat = _file_stat(name)
+    slot = (str(path()), name)
+    known = _meta.get(slot)
+    if known is not None and (stat is None or known[0] == stat):
+        return known[1]
+
+    with _lock:
+        conn = _connection()
+        row = conn.execute("SELECT stat, version FROM meta WHERE name = ?", (name,)).fetchone()
+        if row is None or (stat is not None and row[0] != stat):
+            if stat is None:
+                catalog.sheet(name)  # raises the usual FileNotFoundError
+            version = catalog.version(name)
+            _import(conn, name, stat, version)
+            row = (stat, version)
+        _meta[slot] = row
+        return row[1]
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+def version(name):
+    """Data version of workbook `name` under the active backend."""
+    return sync(name) if ENABLED else catalog.version(name)
+
+
+def load(name):
+    """Every record of a workbook, in records.*() order."""
+    if not ENABLED:
+        return {
+            "publications": records.publications,
+            "active_research": records.projects,
+            "people": records.people,
+            "research_tracks": records.research_tracks,
+        }[name]()
+
+    key = (sync(name), assets.version())
+    slot = (str(path()), name)
+    cached = _loaded.get(slot)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with _lock:
+        value = tuple(map(TABLES[name].record, _connection().execute(f"SELECT * FROM {name} ORDER BY pos")))
+    _loaded[slot] = (key, value)
+    return value
+
+
+def rows(name, ids):
+    """Records at positions `ids`, in that order; only these rows are read."""
+    sync(name)
+    ids = list(ids)
+    if not ids:
+        return []
+    marks = ", ".join("?" * len(ids))
+    with _lock:
+        found = {
+            row[0]: row for row in
+            _connection().execute(f"SELECT * FROM {name} WHERE pos IN ({marks})", ids)
+        }
+    record = TABLES[name].record
+    return [record(found[i]) for i in ids if i in found]
+
+
+def select(name, query="", tags=(), mode="any"):
+    """(ids, counts, ranked) for a list view, as listing.Selection: the
+    search, keyword filter, facet counts and ordering all run in SQL."""
+    sync(name)
+    conn = _connection()
+    table = TABLES[name]
+    tags = list(dict.fromkeys(tags))
+
+    # Both inputs are materialized once per statement; joined inline,
+    # SQLite would re-run the FTS match for every tagged row.
+    ctes, args = [], []
+    tokens = list(dict.fromkeys(search.tokenize(query)))
+    ranked = bool(tokens)
+    if ranked:
+        # Every term must match, each as a prefix (as in search.SearchIndex).
+        weights = ", ".join(str(w) for w in table.fts.values())
+        ctes.append(
+            f"hits(pos, score) AS MATERIALIZED (SELECT rowid, bm25({name}_fts, {weights}) "
+            f"FROM {name}_fts WHERE {name}_fts MATCH ?)"
+        )
+        args.append(" ".join(f'"{t}"*' for t in tokens))
+    if tags:
+        marks = ", ".join("?" * len(tags))
+        having = f" GROUP BY pos HAVING COUNT(*) = {len(tags)}" if mode == "all" else ""
+        ctes.append(
+            f"tagged(pos) AS MATERIALIZED (SELECT DISTINCT pos FROM {name}_tags "
+            f"WHERE tag IN ({marks}){having})"
+        )
+        args.extend(tags)
+    with_sql = f"WITH {', '.join(ctes)} " if ctes else ""
+
+    source = "hits" if ranked else name
+    where = " WHERE pos IN tagged" if tags else ""
+    order = "score, pos" if ranked else "pos"
+    # Counts over the results in AND mode, else over the unfiltered base,
+    # matching facets.FacetIndex.
+    scope = f"SELECT pos FROM {source}" + (where if mode == "all" else "")
+    count_sql = f"{with_sql}SELECT tag, COUNT(*) FROM {name}_tags"
+    if ranked or (tags and mode == "all"):
+        count_sql += f" WHERE pos IN ({scope})"
+
+    with _lock:
+        ids = tuple(r[0] for r in conn.execute(
+            f"{with_sql}SELECT pos FROM {source}{where} ORDER BY {order}", args
+        ))
+        counts = {tag: 0 for (tag,) in conn.execute(f"SELECT DISTINCT tag FROM {name}_tags ORDER BY tag")}
+        counts.update(conn.execute(count_sql + " GROUP BY tag", args))
+    return ids, counts, ranked
+
+
+def export(out_dir):
+    """Write every table back to a workbook in `out_dir`."""
+    import pandas as pd
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    conn = _connection()
+    for name, table in TABLES.items():
+        if catalog.exists(name):
+            sync(name)
+        with _lock:
+            if conn.execute("SELECT 1 FROM meta WHERE name = ?", (name,)).fetchone() is None:
+                continue
+            df = pd.read_sql_query(f"SELECT {', '.join(table.columns)} FROM {name} ORDER BY pos", conn)
+        if "year" in df.columns:
+            df["year"] = df["year"].where(df["year"] != 0)
+        if "featured" in df.columns:
+            df["featured"] = df["featured"].astype(bool)
+        df.to_excel(out_dir / catalog.WORKBOOKS[name], index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["sync", "export"])
+    parser.add_argument("--out", type=Path, default=Path("export"), help="export directory")
+    args = parser.parse_args(argv)
+
+    if args.command == "sync":
+        for name in TABLES:
+            if catalog.exists(name):
+                print(f"{name}: {sync(name)}")
+        print(f"Database: {path()}")
+    else:
+        export(args.out)
+        print(f"Wrote workbooks to {args.out}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
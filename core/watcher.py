@@ -0,0 +1,167 @@
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from core import assets, catalog, render_cache, store
+
+logger = logging.getLogger(__name__)
+
+# -------------------------------------------------
+# SETTINGS
+# -------------------------------------------------
+# NANOTECH_WATCH=1 turns live reload on, for editing the workbooks while
+# the app runs. It is off by default: every open session would otherwise
+# rerun a fragment each CHECK_INTERVAL. Without it, changes are still
+# picked up lazily, on the next access after the file's mtime changes.
+ENABLED = os.environ.get("NANOTECH_WATCH", "0") not in ("", "0", "false")
+# Editors save through temp files and several events; wait for quiet.
+DEBOUNCE = 0.5
+# Used when watchdog is not installed.
+POLL_INTERVAL = 1.0
+# How often open sessions check for a new generation (seconds).
+CHECK_INTERVAL = 2.0
+
+ASSETS = "assets"
+
+# Bumped after every applied change; sessions rerun when it moves.
+generation = 0
+
+_pending = set()
+_timer = None
+_mode = None
+_lock = threading.Lock()
+
+
+# -------------------------------------------------
+# CHANGE HANDLING
+# -------------------------------------------------
+def _target(path):
+    """Workbook name, ASSETS, or None for files nobody reads."""
+    path = Path(path).resolve()
+    if path.parent == catalog.DATA_DIR.resolve():
+        for name, filename in catalog.WORKBOOKS.items():
+            if path.name == filename:
+                return name
+        return None
+    if assets.ASSETS_DIR.resolve() in path.parents:
+        return ASSETS
+    return None
+
+
+def _apply():
+    global generation, _timer
+    with _lock:
+        changed = set(_pending)
+        _pending.clear()
+        _timer = None
+
+    for name in sorted(changed - {ASSETS}):
+        catalog.invalidate(name)
+        render_cache.invalidate(name)
+        if not catalog.exists(name):
+            continue
+        # Re-parse now so the next visitor does not pay for it. Records,
+        # indexes and cards are rebuilt from it on first use.
+        try:
+            if store.ENABLED:
+                store.sync(name)
+            else:
+                catalog.sheet(name).frame
+        except Exception:
+            logger.exception("Could not reload %s", catalog.path(name))
+
+    if ASSETS in changed:
+        assets.refresh()
+        render_cache.invalidate(ASSETS)
+
+    generation += 1
+    logger.info("Reloaded %s (generation %s)", ", ".join(sorted(changed)), generation)
+
+
+def notify(path):
+    """Record a changed file; dependent caches are dropped once changes
+    have been quiet for DEBOUNCE seconds."""
+    global _timer
+    target = _target(path)
+    if target is None:
+        return
+
+    with _lock:
+        _pending.add(target)
+        if _timer is not None:
+            _timer.cancel()
+        _timer = threading.Timer(DEBOUNCE, _apply)
+        _timer.daemon = True
+        _timer.start()
+
+
+# -------------------------------------------------
+# WATCHERS
+# -------------------------------------------------
+def _start_watchdog():
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory or event.event_type in ("opened", "closed_no_write"):
+                return
+            notify(event.src_path)
+            if getattr(event, "dest_path", ""):
+                notify(event.dest_path)
+
+    observer = Observer()
+    for directory in (catalog.DATA_DIR, assets.ASSETS_DIR):
+        if directory.is_dir():
+            observer.schedule(Handler(), str(directory), recursive=True)
+    observer.daemon = True
+    observer.start()
+
+
+def _snapshot():
+    files = {}
+    for directory in (catalog.DATA_DIR, assets.ASSETS_DIR):
+        for root, _, names in os.walk(directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    st_ = os.stat(path)
+                except OSError:
+                    continue
+                files[path] = (st_.st_mtime_ns, st_.st_size)
+    return files
+
+
+def _poll():
+    seen = _snapshot()
+    while True:
+        time.sleep(POLL_INTERVAL)
+        current = _snapshot()
+        for path in seen.keys() | current.keys():
+            if seen.get(path) != current.get(path):
+                notify(path)
+        seen = current
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+def start():
+    """Start watching data/ and assets/ once per process. Returns
+    "watchdog", "polling", or None when disabled."""
+    global _mode
+    with _lock:
+        if _mode is not None or not ENABLED:
+            return _mode
+
+        try:
+            _start_watchdog()
+            _mode = "watchdog"
+        except (ImportError, OSError):
+            # No watchdog, or no inotify watches left.
+            threading.Thread(target=_poll, name="data-watcher", daemon=True).start()
+            _mode = "polling"
+        logger.info("Watching %s and %s (%s)", catalog.DATA_DIR, assets.ASSETS_DIR, _mode)
+        return _mode
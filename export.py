@@ -0,0 +1,465 @@
+"""Static HTML export of the public pages.
+
+Renders Home, Research Areas, Publications, Active Research and People
+from the same workbooks, assets, page text and card markup as the app,
+into plain HTML files that any web server can host. Search and keyword
+filters run in the browser; the Streamlit app is only needed for the
+interactive tools.
+
+    python export.py --out site
+    python export.py --out site --app-url https://lab.example.org/
+"""
+import argparse
+import html
+import json
+import os
+import shutil
+import sys
+from itertools import groupby
+from pathlib import Path
+
+from core import assets, cards, catalog, images, records, search
+from tabs import about, active_research, people, publications, research
+
+ROOT = Path(__file__).resolve().parent
+
+# -------------------------------------------------
+# PAGES
+# -------------------------------------------------
+# (file, title) in navigation order; the renderer for each is in PAGES.
+NAV = [
+    ("index.html", "Home"),
+    ("research.html", "Research Areas"),
+    ("publications.html", "Publications"),
+    ("active-research.html", "Active Research"),
+    ("people.html", "People"),
+]
+# Sections that stay in the live app, linked when --app-url is given.
+LIVE_SECTIONS = [("tools", "Tools"), ("contact", "Contact")]
+
+SITE_CSS = """
+body {
+    margin: 0;
+    font-family: "Source Sans Pro", system-ui, -apple-system, sans-serif;
+    color: #31333f;
+    background: #ffffff;
+}
+
+.page {
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 2rem 1.5rem 4rem;
+}
+
+.site-header h2 {
+    margin: 0 0 0.2rem;
+}
+
+.site-header p {
+    margin: 0;
+    color: #6b7280;
+    font-size: 0.95rem;
+}
+
+.site-nav {
+    display: flex;
+    flex-wrap: wrap;
+    margin: 1rem 0 1.5rem;
+    border-bottom: 1px solid rgba(49, 51, 63, 0.2);
+}
+
+.site-nav a {
+    padding: 0.45rem 0.9rem 0.55rem;
+    border-bottom: 2px solid transparent;
+    color: inherit;
+    text-decoration: none;
+}
+
+.site-nav a.active {
+    border-bottom-color: #ff4b4b;
+    color: #ff4b4b;
+}
+
+.grid {
+    display: grid;
+    gap: 2rem;
+    margin-bottom: 2rem;
+}
+
+.grid-2 { grid-template-columns: repeat(2, 1fr); }
+.grid-3 { grid-template-columns: repeat(3, 1fr); }
+.grid-4 { grid-template-columns: repeat(4, 1fr); }
+.grid-1-2 { grid-template-columns: 1fr 2fr; }
+
+.grid img {
+    width: 100%;
+}
+
+.filters {
+    display: grid;
+    grid-template-columns: 2fr 3fr;
+    gap: 1rem;
+    margin-bottom: 1rem;
+}
+
+.filters input[type="search"] {
+    width: 100%;
+    padding: 0.5rem 0.75rem;
+    border: 1px solid rgba(49, 51, 63, 0.2);
+    border-radius: 8px;
+    font-size: 1rem;
+    box-sizing: border-box;
+}
+
+.filter-tags label {
+    display: inline-block;
+    margin: 4px 10px 4px 0;
+    font-size: 14px;
+}
+
+.filter-status {
+    color: #6b7280;
+    font-size: 14px;
+}
+
+.load-more {
+    padding: 0.4rem 1rem;
+    border: 1px solid rgba(49, 51, 63, 0.2);
+    border-radius: 8px;
+    background: white;
+    cursor: pointer;
+}
+
+@media (max-width: 800px) {
+    .grid-2, .grid-3, .grid-4, .grid-1-2, .filters {
+        grid-template-columns: 1fr;
+    }
+}
+"""
+
+# Mirrors listing.select: every query term matches a word prefix (AND),
+# keywords combine with OR/AND, facet counts follow the selection, and
+# results are shown one page at a time. Order stays newest first, as
+# there is no relevance ranking in the browser.
+SITE_JS = """
+const PAGE_SIZE = 20;
+
+function tokens(text) {
+    const folded = text.normalize("NFKD").replace(/[\\u0300-\\u036f]/g, "").toLowerCase();
+    return folded.match(/[\\p{L}\\p{N}_]+/gu) || [];
+}
+
+function setup(root) {
+    const items = [...root.querySelectorAll(".item")].map(el => ({
+        el,
+        year: el.dataset.year,
+        tags: JSON.parse(el.dataset.tags),
+        text: " " + el.dataset.text,
+    }));
+    const years = [...root.querySelectorAll(".year")];
+    const search = root.querySelector(".filter-search");
+    const boxes = [...root.querySelectorAll(".filter-tags input")];
+    const modes = [...root.querySelectorAll(".filter-mode input")];
+    const status = root.querySelector(".filter-status");
+    const more = root.querySelector(".load-more");
+    let limit = PAGE_SIZE;
+
+    function apply() {
+        const terms = [...new Set(tokens(search.value))];
+        const mode = modes.find(m => m.checked).value;
+        const chosen = boxes.filter(b => b.checked).map(b => b.value);
+
+        const base = items.filter(it => terms.every(t => it.text.includes(" " + t)));
+        const result = chosen.length === 0 ? base : base.filter(it =>
+            mode === "all"
+                ? chosen.every(t => it.tags.includes(t))
+                : chosen.some(t => it.tags.includes(t)));
+
+        const counts = {};
+        for (const it of (mode === "all" ? result : base)) {
+            for (const t of it.tags) counts[t] = (counts[t] || 0) + 1;
+        }
+        for (const box of boxes) {
+            box.parentElement.querySelector(".count").textContent = counts[box.value] || 0;
+        }
+
+        const shown = new Set(result.slice(0, limit));
+        const visibleYears = new Set();
+        for (const it of items) {
+            it.el.hidden = !shown.has(it);
+            if (!it.el.hidden) visibleYears.add(it.year);
+        }
+        for (const heading of years) {
+            heading.hidden = !visibleYears.has(heading.dataset.year);
+        }
+
+        status.textContent = `Showing ${shown.size} of ${result.length}`;
+        more.hidden = result.length <= limit;
+    }
+
+    function reset() {
+        limit = PAGE_SIZE;
+        apply();
+    }
+
+    search.addEventListener("input", reset);
+    for (const input of [...boxes, ...modes]) input.addEventListener("change", reset);
+    more.addEventListener("click", () => { limit += PAGE_SIZE; apply(); });
+    apply();
+}
+
+document.querySelectorAll(".listing-page").forEach(setup);
+"""
+
+
+# -------------------------------------------------
+# HELPERS
+# -------------------------------------------------
+class Site:
+    """Output directory plus the set of images copied into it."""
+
+    def __init__(self, out_dir):
+        self.out_dir = Path(out_dir)
+        self.copied = set()
+
+    def image(self, path, display_width):
+        """Copy the image variant into the site; return its relative URL."""
+        variant = Path(images.variant(path, display_width)).as_posix()
+        if variant not in self.copied and Path(variant).exists():
+            target = self.out_dir / variant
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(variant, target)
+            self.copied.add(variant)
+        return variant
+
+    def write(self, name, text):
+        target = self.out_dir / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(text, encoding="utf-8")
+
+
+def _text(value):
+    return html.escape(value).replace("\n", "<br>")
+
+
+def _search_text(record, fields):
+    words = []
+    for field in fields:
+        value = getattr(record, field)
+        words.extend(search.tokenize(" ".join(value) if isinstance(value, tuple) else value))
+    return " ".join(dict.fromkeys(words))
+
+
+def _layout(current, body, app_url):
+    nav = [
+        f"<a href='{href}' class='active'>{title}</a>" if href == current
+        else f"<a href='{href}'>{title}</a>"
+        for href, title in NAV
+    ]
+    if app_url:
+        nav += [
+            f"<a href='{html.escape(app_url, quote=True)}?section={key}'>{title}</a>"
+            for key, title in LIVE_SECTIONS
+        ]
+    title = dict(NAV)[current]
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} · Nanotechnology Research Laboratory</title>
+<link rel="stylesheet" href="site.css">
+</head>
+<body>
+<div class="page">
+<header class="site-header">
+<h2>Nanotechnology Research Laboratory</h2>
+<p>Department of Chemical Engineering | UP Diliman</p>
+</header>
+<nav class="site-nav">{''.join(nav)}</nav>
+<main>
+{body}
+</main>
+</div>
+<script src="site.js"></script>
+</body>
+</html>
+"""
+
+
+# -------------------------------------------------
+# PAGE RENDERERS
+# -------------------------------------------------
+def render_home(site):
+    parts = [
+        about.HERO,
+        f"<div class='grid grid-2' style='margin-top: 2rem;'>{about.MISSION}{about.VISION}</div>",
+    ]
+
+    logo = ""
+    if assets.exists(about.LAB_LOGO):
+        logo = f"<img src='{site.image(about.LAB_LOGO, 400)}' alt='Laboratory logo'>"
+    parts.append(f"<div class='grid grid-1-2'><div>{logo}</div>{about.ABOUT_LAB}</div>")
+
+    stats = "".join(
+        about.STAT.format(value=value, label=label)
+        for value, label in about.stats()
+    )
+    parts.append(f"<h3>Through the Years</h3><div class='grid grid-3'>{stats}</div>")
+    return "\n".join(parts)
+
+
+def render_research(site):
+    parts = [research.HERO]
+    if not catalog.exists("research_tracks"):
+        return parts[0]
+
+    cells = []
+    for track in records.research_tracks():
+        image = f"<img src='{site.image(track.image, 400)}' alt=''>" if track.image else ""
+        cells.append(
+            f"<div>{image}{research.TRACK_TITLE.format(title=html.escape(track.title))}"
+            f"<details class='card-details'><summary>Learn more</summary>"
+            f"<p>{_text(track.description)}</p></details></div>"
+        )
+    parts.append(f"<div class='grid grid-3'>{''.join(cells)}</div>")
+    return "\n".join(parts)
+
+
+def _listing(items, card, fields, placeholder):
+    tag_counts = {}
+    for item in items:
+        for tag in item.tags:
+            tag_counts[tag] = tag_counts.get(tag, 0) + 1
+    boxes = "".join(
+        f"<label><input type='checkbox' value='{html.escape(tag, quote=True)}'> "
+        f"{html.escape(tag)} (<span class='count'>{count}</span>)</label>"
+        for tag, count in sorted(tag_counts.items())
+    )
+
+    rows = []
+    for year, group in groupby(items, key=lambda item: item.year):
+        rows.append(f"<h2 class='year' data-year='{year}'>{year}</h2>")
+        for item in group:
+            rows.append(
+                f"<div class='item' data-year='{year}'"
+                f" data-tags='{html.escape(json.dumps(item.tags), quote=True)}'"
+                f" data-text='{html.escape(_search_text(item, fields), quote=True)}'>"
+                f"{card(item)}</div>"
+            )
+
+    return f"""<div class="listing-page">
+<div class="filters">
+<div>
+<details class="filter-tags"><summary>Filter by keywords</summary>{boxes}</details>
+<div class="filter-mode">
+<label><input type="radio" name="mode" value="any" checked> Any keyword (OR)</label>
+<label><input type="radio" name="mode" value="all"> All keywords (AND)</label>
+</div>
+</div>
+<input type="search" class="filter-search" placeholder="{placeholder}" aria-label="Search">
+</div>
+<p class="filter-status"></p>
+{''.join(rows)}
+<button class="load-more" hidden>Load more</button>
+</div>"""
+
+
+def render_publications(site):
+    pubs = records.publications()
+    # Cards only show derived variants (see images.url); copy those.
+    for p in pubs:
+        if p.image and images.url(p.image, cards.PUBLICATION_IMAGE_WIDTH):
+            site.image(p.image, cards.PUBLICATION_IMAGE_WIDTH)
+    body = _listing(
+        pubs,
+        lambda p: cards.publication_card(p, url_prefix=""),
+        search.PUBLICATION_FIELDS, "Title, author, keyword, journal…",
+    )
+    return (
+        f"{publications.HERO}<style>{cards.PUBLICATION_CSS}{cards.DETAILS_CSS}</style>\n{body}"
+    )
+
+
+def render_active_research(site):
+    body = _listing(
+        records.projects(), cards.project_card,
+        search.PROJECT_FIELDS, "Title, researcher, keyword, status…",
+    )
+    return (
+        f"{active_research.HERO}<style>{cards.PROJECT_CSS}{cards.DETAILS_CSS}</style>\n{body}"
+    )
+
+
+def render_people(site):
+    parts = [people.HERO, f"<style>{people.PEOPLE_CSS}{cards.DETAILS_CSS}</style>"]
+
+    for section_title, section_people in people.group_people(records.people()):
+        cells = []
+        for p in section_people:
+            image = f"<img src='{site.image(p.image, 300)}' alt=''>" if p.image else ""
+            details = [f"<h3 class='popover-name'>{html.escape(p.name)}</h3>"]
+            details.append(f"<p>{html.escape(people.subtitle_text(p))}</p>")
+            if p.bio:
+                details.append(f"<p>{_text(p.bio)}</p>")
+            if p.research:
+                items = "".join(f"<li>{html.escape(r)}</li>" for r in p.research)
+                details.append(f"<p><strong>Research Interests</strong></p><ul>{items}</ul>")
+            if p.link:
+                url = html.escape(people.normalize_link(p.link), quote=True)
+                details.append(
+                    f"<p><strong>Profile / Website</strong><br>"
+                    f"🔗 <a href='{url}' target='_blank'>Visit profile</a></p>"
+                )
+            cells.append(
+                f"<div>{image}<div style='height:10px'></div>"
+                f"<div class='name-box'><div class='name-box-name'>{html.escape(p.name)}</div>"
+                f"<div class='name-box-role'>{html.escape(people.subtitle_text(p))}</div></div>"
+                f"<details class='card-details'><summary>View details</summary>"
+                f"{''.join(details)}</details></div>"
+            )
+        parts.append(f"<h3>{section_title}</h3><div class='grid grid-4'>{''.join(cells)}</div>")
+    return "\n".join(parts)
+
+
+PAGES = {
+    "index.html": render_home,
+    "research.html": render_research,
+    "publications.html": render_publications,
+    "active-research.html": render_active_research,
+    "people.html": render_people,
+}
+
+
+# -------------------------------------------------
+# EXPORT
+# -------------------------------------------------
+def export(out_dir, app_url=None):
+    """Write every page plus site.css and site.js; return the page names."""
+    site = Site(out_dir)
+    for name, render in PAGES.items():
+        site.write(name, _layout(name, render(site), app_url))
+    site.write("site.css", SITE_CSS + about.ABOUT_CSS)
+    site.write("site.js", SITE_JS)
+    return list(PAGES)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, default=Path("site"))
+    parser.add_argument("--data-dir", help="workbook directory (default: data/)")
+    parser.add_argument("--app-url", help="live app URL, linked for Tools and Contact")
+    args = parser.parse_args(argv)
+
+    out_dir = args.out.resolve()
+    if args.data_dir:
+        catalog.DATA_DIR = Path(args.data_dir).resolve()
+    # Asset and image paths are relative to the project root.
+    os.chdir(ROOT)
+
+    pages = export(out_dir, args.app_url)
+    print(f"Wrote {len(pages)} pages to {out_dir}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
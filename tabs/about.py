@@ -1,116 +1,167 @@
 import streamlit as st
-import pandas as pd
-from pathlib import Path
+
+from core import assets, images, metrics, profiler
 
 # -------------------------------------------------
-# PAGE DATA
+# PAGE TEXT
 # -------------------------------------------------
-@st.cache_data
-def load_people():
-    df = pd.read_excel("data/people.xlsx")
-    df.columns = df.columns.str.strip().str.lower()
-    return df
+# Shared with the static export (export.py).
+ABOUT_CSS = """
+.hero {
+    padding: 3rem 3rem;
+    background: linear-gradient(135deg, #ff5f9e, #ff87b2, #ffc1d9);
+    border-radius: 26px;
+    color: white;
+}
+
+.hero h1 {
+    font-size: 2.8rem;
+    margin-bottom: 0.6rem;
+}
+
+.hero p {
+    font-size: 1.1rem;
+    max-width: 820px;
+    opacity: 0.95;
+}
+
+.content-card {
+    background: #ffffff;
+    padding: 2.2rem;
+    border-radius: 22px;
+    box-shadow: 0 10px 26px rgba(0,0,0,0.08);
+}
+
+.section-hero {
+    padding: 2rem;
+    border-radius: 20px;
+    background: linear-gradient(135deg, #ff9acb, #ffd1e6);
+    box-shadow: 0 8px 22px rgba(0,0,0,0.08);
+}
+
+.stat {
+    padding: 2.2rem;
+    border-radius: 20px;
+    background: linear-gradient(135deg, #ff7eb3, #ffb3d9);
+    text-align: center;
+    color: white;
+    box-shadow: 0 10px 24px rgba(0,0,0,0.12);
+}
+
+.stat h1 {
+    font-size: 3rem;
+    margin-bottom: 0.3rem;
+}
+
+.stat p {
+    margin: 0;
+    font-weight: 500;
+    font-size: 0.95rem;
+}
+"""
+
+HERO = """
+<div class="hero">
+    <h1>Nanotechnology Research Laboratory</h1>
+    <p>
+    A multidisciplinary research group advancing nanotechnology,
+    materials science, and chemical engineering through rigorous
+    experimentation, collaboration, and innovation.
+    </p>
+</div>
+"""
+
+MISSION = """
+<div class="section-hero">
+    <h3>Mission</h3>
+    <p>
+    To conduct high-impact research in nanotechnology and materials science,
+    train students through hands-on scientific inquiry, and develop
+    knowledge-driven solutions that address national and global challenges.
+    </p>
+</div>
+"""
+
+VISION = """
+<div class="section-hero">
+    <h3>Vision</h3>
+    <p>
+    To be a leading academic research laboratory recognized for excellence
+    in nanotechnology research, interdisciplinary collaboration, and the
+    formation of future scientists and engineers.
+    </p>
+</div>
+"""
+
+ABOUT_LAB = """
+<div class="content-card">
+    <h3>About the Laboratory</h3>
+    <p>
+    The Nanotechnology Research Laboratory focuses on the synthesis,
+    characterization, and application of nanoscale materials. The group
+    supports undergraduate, graduate, and faculty-led research across
+    chemical engineering, materials science, and related disciplines.
+    </p>
+    <p>
+    Through mentorship and collaborative research, the laboratory has trained
+    students who pursue careers in academia, industry, and public service,
+    while contributing to the advancement of nanoscience and engineering.
+    </p>
+</div>
+"""
+
+STAT = """
+<div class="stat">
+    <h1>{value}</h1>
+    <p>{label}</p>
+</div>
+"""
+
+STATS_PER_ROW = 3
+
+LAB_LOGO = "assets/logos/lab_logo.png"
 
 # -------------------------------------------------
 # HELPERS
 # -------------------------------------------------
-def count_people(df, role=None, level=None, status=None):
-    temp = df.copy()
-
-    if role and "role" in temp.columns:
-        temp = temp[temp["role"] == role]
-
-    if level and "level" in temp.columns:
-        temp = temp[temp["level"] == level]
-
-    if status and "status" in temp.columns:
-        temp = temp[temp["status"] == status]
-
-    return len(temp)
-
-def count_alumni(df):
-    ms = count_people(df, role="Student", level="MS", status="Graduated")
-    ug = count_people(df, role="Student", level="Undergraduate", status="Graduated")
+def count_alumni():
+    ms = metrics.count_people(role="Student", level="MS", status="Graduated")
+    ug = metrics.count_people(role="Student", level="Undergraduate", status="Graduated")
     return ms + ug
 
+def records_summarized(_):
+    """Profiler row count for stats(): every record it summarizes."""
+    return (
+        metrics.people_metrics().total
+        + metrics.publication_metrics().total
+        + metrics.project_metrics().total
+    )
+
+@profiler.profiled("loader:stats", rows=records_summarized)
+def stats():
+    """(value, label) pairs for the Through the Years cards."""
+    return [
+        (count_alumni(), "Alumni"),
+        (metrics.count_people(role="Student", level="MS", status="Current"), "Current Graduate Students"),
+        (metrics.count_people(role="Student", level="Undergraduate", status="Current"), "Current Undergraduates"),
+        (metrics.count_people(role="Faculty", status="Current"), "Current Faculty"),
+        (metrics.publication_metrics().total, "Publications"),
+        (metrics.project_metrics().total, "Active Research Projects"),
+    ]
+
 # -------------------------------------------------
 # RENDER TAB
 # -------------------------------------------------
 def render():
-    df = load_people()
-
     # -------------------------------------------------
     # STYLES
     # -------------------------------------------------
-    st.markdown("""
-    <style>
-    .hero {
-        padding: 3rem 3rem;
-        background: linear-gradient(135deg, #ff5f9e, #ff87b2, #ffc1d9);
-        border-radius: 26px;
-        color: white;
-    }
-
-    .hero h1 {
-        font-size: 2.8rem;
-        margin-bottom: 0.6rem;
-    }
-
-    .hero p {
-        font-size: 1.1rem;
-        max-width: 820px;
-        opacity: 0.95;
-    }
-
-    .content-card {
-        background: #ffffff;
-        padding: 2.2rem;
-        border-radius: 22px;
-        box-shadow: 0 10px 26px rgba(0,0,0,0.08);
-    }
-
-    .section-hero {
-        padding: 2rem;
-        border-radius: 20px;
-        background: linear-gradient(135deg, #ff9acb, #ffd1e6);
-        box-shadow: 0 8px 22px rgba(0,0,0,0.08);
-    }
-
-    .stat {
-        padding: 2.2rem;
-        border-radius: 20px;
-        background: linear-gradient(135deg, #ff7eb3, #ffb3d9);
-        text-align: center;
-        color: white;
-        box-shadow: 0 10px 24px rgba(0,0,0,0.12);
-    }
-
-    .stat h1 {
-        font-size: 3rem;
-        margin-bottom: 0.3rem;
-    }
-
-    .stat p {
-        margin: 0;
-        font-weight: 500;
-        font-size: 0.95rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(f"<style>{ABOUT_CSS}</style>", unsafe_allow_html=True)
 
     # -------------------------------------------------
     # HERO (TEXT ONLY — CLEAN)
     # -------------------------------------------------
-    st.markdown("""
-    <div class="hero">
-        <h1>Nanotechnology Research Laboratory</h1>
-        <p>
-        A multidisciplinary research group advancing nanotechnology,
-        materials science, and chemical engineering through rigorous
-        experimentation, collaboration, and innovation.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HERO, unsafe_allow_html=True)
 
     st.write("")
     st.write("")
@@ -121,28 +172,10 @@ def render():
     col1, col2 = st.columns(2, gap="large")
 
     with col1:
-        st.markdown("""
-        <div class="section-hero">
-            <h3>Mission</h3>
-            <p>
-            To conduct high-impact research in nanotechnology and materials science,
-            train students through hands-on scientific inquiry, and develop
-            knowledge-driven solutions that address national and global challenges.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(MISSION, unsafe_allow_html=True)
 
     with col2:
-        st.markdown("""
-        <div class="section-hero">
-            <h3>Vision</h3>
-            <p>
-            To be a leading academic research laboratory recognized for excellence
-            in nanotechnology research, interdisciplinary collaboration, and the
-            formation of future scientists and engineers.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(VISION, unsafe_allow_html=True)
 
     st.write("")
     st.write("")
@@ -153,28 +186,11 @@ def render():
     col_img, col_txt = st.columns([1, 2], gap="large")
 
     with col_img:
-        img_path = Path("assets/logos/lab_logo.png")
-        if img_path.exists():
-            st.image(img_path, use_container_width=True)
-
+        if assets.exists(LAB_LOGO):
+            st.image(images.variant(LAB_LOGO, 400), use_container_width=True)
 
     with col_txt:
-        st.markdown("""
-        <div class="content-card">
-            <h3>About the Laboratory</h3>
-            <p>
-            The Nanotechnology Research Laboratory focuses on the synthesis,
-            characterization, and application of nanoscale materials. The group
-            supports undergraduate, graduate, and faculty-led research across
-            chemical engineering, materials science, and related disciplines.
-            </p>
-            <p>
-            Through mentorship and collaborative research, the laboratory has trained
-            students who pursue careers in academia, industry, and public service,
-            while contributing to the advancement of nanoscience and engineering.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(ABOUT_LAB, unsafe_allow_html=True)
 
     st.write("")
     st.write("")
@@ -183,38 +199,10 @@ def render():
     # THROUGH THE YEARS
     # -------------------------------------------------
     st.subheader("Through the Years")
-    
-    c1, c2, c3, c4 = st.columns(4, gap="large")
-    
-    with c1:
-        st.markdown(f"""
-        <div class="stat">
-            <h1>{count_alumni(df)}</h1>
-            <p>Alumni</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with c2:
-        st.markdown(f"""
-        <div class="stat">
-            <h1>{count_people(df, role="Student", level="MS", status="Current")}</h1>
-            <p>Current Graduate Students</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with c3:
-        st.markdown(f"""
-        <div class="stat">
-            <h1>{count_people(df, role="Student", level="Undergraduate", status="Current")}</h1>
-            <p>Current Undergraduates</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with c4:
-        st.markdown(f"""
-        <div class="stat">
-            <h1>{count_people(df, role="Faculty", status="Current")}</h1>
-            <p>Current Faculty</p>
-        </div>
-        """, unsafe_allow_html=True)
 
+    stat_cards = stats()
+    for row in range(0, len(stat_cards), STATS_PER_ROW):
+        cols = st.columns(STATS_PER_ROW, gap="large")
+        for col, (value, label) in zip(cols, stat_cards[row:row + STATS_PER_ROW]):
+            with col:
+                st.markdown(STAT.format(value=value, label=label), unsafe_allow_html=True)
@@ -0,0 +1,105 @@
+import streamlit as st
+
+from core import catalog, metrics, profiler
+
+# -------------------------------------------------
+# PAGE TEXT
+# -------------------------------------------------
+HERO = """
+<div style="
+    background: linear-gradient(135deg, #ff5f9e, #ff87b2, #ffc1d9);
+    padding: 48px 40px;
+    border-radius: 24px;
+    margin-bottom: 40px;
+    color: white;
+">
+    <h1 style="margin-bottom: 12px;">Analytics</h1>
+    <p style="font-size: 16px; max-width: 760px;">
+        Research output over time: publications per year, how keywords
+        rise and fade, where the work is published and which topics are
+        studied together.
+    </p>
+</div>
+"""
+
+# dataset -> (label, workbook, trends, breakdown title)
+DATASETS = {
+    "publications": ("Publications", "publications", metrics.publication_trends, "Top venues"),
+    "projects": ("Active Research", "active_research", metrics.project_trends, "Projects by status"),
+}
+TOP_KEYWORDS = 8
+TOP_ROWS = 15
+
+# -------------------------------------------------
+# LOAD DATA
+# -------------------------------------------------
+# Rows: dated records behind the pivots.
+@profiler.profiled("loader:trends", rows=lambda trends: int(trends.per_year.sum()))
+def load_trends(dataset):
+    return DATASETS[dataset][2]()
+
+# -------------------------------------------------
+# RENDER TAB
+# -------------------------------------------------
+def render():
+    st.markdown(HERO, unsafe_allow_html=True)
+
+    dataset = st.radio(
+        "Dataset",
+        list(DATASETS),
+        format_func=lambda key: DATASETS[key][0],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="analytics_dataset",
+    )
+    label, workbook, _, breakdown_title = DATASETS[dataset]
+
+    if not catalog.exists(workbook):
+        st.error(f"{label} data file not found.")
+        return
+
+    trends = load_trends(dataset)
+    if trends.per_year.empty:
+        st.info(f"No dated {label.lower()} yet.")
+        return
+
+    # -------------------------------------------------
+    # PER YEAR
+    # -------------------------------------------------
+    st.subheader(f"{label} per year")
+    per_year = trends.per_year.rename(label)
+    per_year.index = per_year.index.astype(str)
+    st.bar_chart(per_year, color="#ff5f9e")
+
+    # -------------------------------------------------
+    # KEYWORDS OVER TIME
+    # -------------------------------------------------
+    st.subheader("Keyword frequency over time")
+    if trends.keyword_year.empty:
+        st.caption("No keywords recorded.")
+    else:
+        top = trends.keyword_year.head(TOP_KEYWORDS).T
+        top.index = top.index.astype(str)
+        st.line_chart(top)
+
+        with st.expander("All keywords by year"):
+            st.dataframe(trends.keyword_year, width="stretch")
+
+    # -------------------------------------------------
+    # VENUES / STATUS & KEYWORD PAIRS
+    # -------------------------------------------------
+    col1, col2 = st.columns(2, gap="large")
+
+    with col1:
+        st.subheader(breakdown_title)
+        if trends.breakdown.empty:
+            st.caption("Nothing recorded.")
+        else:
+            st.bar_chart(trends.breakdown.head(TOP_ROWS), horizontal=True, color="#ff87b2")
+
+    with col2:
+        st.subheader("Keywords studied together")
+        if trends.pairs.empty:
+            st.caption("No records with more than one keyword.")
+        else:
+            st.dataframe(trends.pairs.head(TOP_ROWS), hide_index=True, width="stretch")
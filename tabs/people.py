@@ -1,41 +1,115 @@
+from itertools import groupby
+
 import streamlit as st
-import pandas as pd
-import os
-from pathlib import Path
+
+from core import assets, authors, cards, images, profiler, render_cache, store
+
+# -------------------------------------------------
+# PAGE TEXT
+# -------------------------------------------------
+# Shared with the static export (export.py).
+HERO = """
+<div style="
+    background: linear-gradient(135deg, #ff5f9e, #ff87b2, #ffc1d9);
+    padding: 48px 40px;
+    border-radius: 24px;
+    margin-bottom: 40px;
+    color: white;
+">
+    <h1 style="margin-bottom: 12px;">People</h1>
+    <p style="font-size: 16px; max-width: 760px;">
+        Get to know the people behind the Nanotechnology Research Laboratory —
+        faculty, researchers, and students working across crystallization,
+        sustainable processes, and materials science.
+    </p>
+</div>
+"""
+
+PEOPLE_CSS = """
+.name-box {
+    background: linear-gradient(135deg, #ff5f9e, #ff87b2, #ffc1d9);
+    border-radius: 16px;
+    padding: 12px 14px;
+    text-align: center;
+    box-shadow: 0 8px 20px rgba(255, 95, 158, 0.35);
+    cursor: pointer;
+}
+
+.name-box-name {
+    color: white;
+    font-weight: 700;
+    font-size: 1rem;
+    line-height: 1.2;
+}
+
+.name-box-role {
+    color: rgba(255,255,255,0.85);
+    font-size: 0.85rem;
+    margin-top: 4px;
+}
+
+.popover-name {
+    background: linear-gradient(135deg, #ff5f9e, #ff87b2);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    font-weight: 700;
+}
+"""
 
 # -------------------------------------------------
 # LOAD DATA
 # -------------------------------------------------
-@st.cache_data
+@profiler.profiled("loader:people")
 def load_people():
-    df = pd.read_excel("data/people.xlsx")
-    df.columns = df.columns.str.strip().str.lower()
-    return df
+    return store.load("people")
 
 # -------------------------------------------------
 # HELPERS
 # -------------------------------------------------
-def clean_text(value):
-    return "" if pd.isna(value) else str(value).strip()
+def subtitle_text(p):
+    if p.status == "Graduated":
+        return "Alumni"
+    if p.role == "Student":
+        return f"{p.level} · {p.status}".strip(" ·")
+    return p.role
 
-def resolve_image(image_value):
-    if pd.isna(image_value) or not image_value:
-        return "assets/people/placeholder.png"
+# -------------------------------------------------
+# GROUP DEFINITIONS
+# -------------------------------------------------
+GROUPS = [
+    ("Faculty", lambda p: p.role == "Faculty" and p.status == "Current"),
+    ("Graduate Students", lambda p: p.role == "Student" and p.level in ["MS", "PhD"] and p.status == "Current"),
+    ("Undergraduate Students", lambda p: p.role == "Student" and p.level == "Undergraduate" and p.status == "Current"),
+    ("Alumni", lambda p: p.status == "Graduated"),
+]
 
-    base = os.path.splitext(str(image_value))[0]
-    for ext in [".png", ".jpg", ".jpeg"]:
-        path = f"assets/people/{base}{ext}"
-        if os.path.exists(path):
-            return path
+def group_people(people):
+    """Non-empty (title, people) sections in GROUPS order."""
+    sections = []
+    for section_title, rule in GROUPS:
+        section_people = [p for p in people if rule(p)]
+        if section_people:
+            sections.append((section_title, section_people))
+    return sections
 
-    return "assets/people/placeholder.png"
+def people_sections():
+    """group_people() with each photo resolved to its variant, shared by
+    all sessions per data and asset version."""
+    key = ("people", store.version("people"), assets.version())
+    return render_cache.cached(key, lambda: [
+        (section_title, [
+            (p, images.variant(p.image, 300) if p.image else None)
+            for p in section_people
+        ])
+        for section_title, section_people in group_people(load_people())
+    ], depends=("people", "assets"))
 
-def subtitle_text(p):
-    if p["status"] == "Graduated":
-        return "Alumni"
-    if p["role"] == "Student":
-        return f"{p['level']} · {p['status']}".strip(" ·")
-    return p["role"]
+def people_by_id():
+    key = ("people_by_id", store.version("people"), assets.version())
+    return render_cache.cached(
+        key, lambda: {authors.person_id(p): p for p in load_people()},
+        depends=("people", "assets"),
+    )
 
 def normalize_link(url):
     """Ensure links are clickable even if http(s) is missing"""
@@ -45,123 +119,117 @@ def normalize_link(url):
         return url
     return f"https://{url}"
 
+# -------------------------------------------------
+# PROFILES
+# -------------------------------------------------
+# Opened as ?section=people&person=<id>, so profiles can be linked.
+def open_profile(person_id):
+    st.query_params["person"] = person_id
+
+def close_profile():
+    del st.query_params["person"]
+
+def year_span(items):
+    years = sorted({item.year for item in items if item.year})
+    if not years:
+        return ""
+    return str(years[0]) if years[0] == years[-1] else f"{years[0]}–{years[-1]}"
+
+def _profile_html(pubs, projects):
+    parts = []
+    if pubs:
+        parts.append(f"<h3>Publications ({len(pubs)})</h3>")
+        for year, group in groupby(pubs, key=lambda p: p.year):
+            parts.append(f"<h4>{year or 'Undated'}</h4>")
+            parts.extend(cards.publication_card(p) for p in group)
+    if projects:
+        parts.append(f"<h3>Active Research ({len(projects)})</h3>")
+        parts.extend(cards.project_card(p, show_year=True) for p in projects)
+    return "".join(parts)
+
+def profile_html(p):
+    """Publication and project cards for one person, from the precomputed
+    author links and shared by all sessions per data version."""
+    key = (
+        "profile", authors.person_id(p),
+        store.version("people"), store.version("publications"),
+        store.version("active_research"), assets.version(),
+    )
+    return render_cache.cached(
+        key, lambda: _profile_html(authors.publications_of(p), authors.projects_of(p)),
+        depends=("people", "publications", "active_research", "assets"),
+    )
+
+def render_profile(p):
+    st.button("← All people", on_click=close_profile)
+    st.markdown(f"<style>{PEOPLE_CSS}{cards.PUBLICATION_CSS}{cards.PROJECT_CSS}{cards.DETAILS_CSS}</style>", unsafe_allow_html=True)
+
+    pubs = authors.publications_of(p)
+    projects = authors.projects_of(p)
+
+    left, right = st.columns([1, 3])
+    with left:
+        if p.image:
+            st.image(images.variant(p.image, 300), width="stretch")
+    with right:
+        st.markdown(f"<h2 class='popover-name'>{p.name}</h2>", unsafe_allow_html=True)
+        st.caption(subtitle_text(p))
+        if p.bio:
+            st.write(p.bio)
+        if p.research:
+            st.markdown("**Research Interests:** " + " · ".join(p.research))
+        if p.link:
+            st.markdown(f"🔗 [Visit profile]({normalize_link(p.link)})")
+
+        counts = st.columns(3)
+        counts[0].metric("Publications", len(pubs))
+        counts[1].metric("Projects", len(projects))
+        counts[2].metric("Years active", year_span(pubs + projects) or "—")
+
+    if pubs or projects:
+        st.markdown(profile_html(p), unsafe_allow_html=True)
+    else:
+        st.info("No publications or projects are linked to this person yet.")
+
 # -------------------------------------------------
 # RENDER TAB
 # -------------------------------------------------
 def render():
-    df = load_people()
+    person = people_by_id().get(st.query_params.get("person"))
+    if person is not None:
+        render_profile(person)
+        return
 
     # -------------------------------------------------
     # HERO SECTION
     # -------------------------------------------------
-    st.markdown(
-        """
-        <div style="
-            background: linear-gradient(135deg, #ff5f9e, #ff87b2, #ffc1d9);
-            padding: 48px 40px;
-            border-radius: 24px;
-            margin-bottom: 40px;
-            color: white;
-        ">
-            <h1 style="margin-bottom: 12px;">People</h1>
-            <p style="font-size: 16px; max-width: 760px;">
-                Get to know the people behind the Nanotechnology Research Laboratory —
-                faculty, researchers, and students working across crystallization,
-                sustainable processes, and materials science.
-            </p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(HERO, unsafe_allow_html=True)
 
     # -------------------------------------------------
     # STYLES
     # -------------------------------------------------
-    st.markdown("""
-    <style>
-    .name-box {
-        background: linear-gradient(135deg, #ff5f9e, #ff87b2, #ffc1d9);
-        border-radius: 16px;
-        padding: 12px 14px;
-        text-align: center;
-        box-shadow: 0 8px 20px rgba(255, 95, 158, 0.35);
-        cursor: pointer;
-    }
-
-    .name-box-name {
-        color: white;
-        font-weight: 700;
-        font-size: 1rem;
-        line-height: 1.2;
-    }
-
-    .name-box-role {
-        color: rgba(255,255,255,0.85);
-        font-size: 0.85rem;
-        margin-top: 4px;
-    }
-
-    .popover-name {
-        background: linear-gradient(135deg, #ff5f9e, #ff87b2);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        font-weight: 700;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
-    # -------------------------------------------------
-    # PARSE PEOPLE
-    # -------------------------------------------------
-    people = []
-    for _, row in df.iterrows():
-        people.append({
-            "name": clean_text(row.get("name")),
-            "role": clean_text(row.get("role")),
-            "level": clean_text(row.get("level")),
-            "status": clean_text(row.get("status")),
-            "image": resolve_image(row.get("image")),
-            "bio": clean_text(row.get("bio")),
-            "research": (
-                [r.strip() for r in str(row.get("research")).split(";")]
-                if pd.notna(row.get("research"))
-                else []
-            ),
-            "link": clean_text(row.get("links")),
-        })
-
-    # -------------------------------------------------
-    # GROUP DEFINITIONS
-    # -------------------------------------------------
-    groups = [
-        ("Faculty", lambda p: p["role"] == "Faculty" and p["status"] == "Current"),
-        ("Graduate Students", lambda p: p["role"] == "Student" and p["level"] in ["MS", "PhD"] and p["status"] == "Current"),
-        ("Undergraduate Students", lambda p: p["role"] == "Student" and p["level"] == "Undergraduate" and p["status"] == "Current"),
-        ("Alumni", lambda p: p["status"] == "Graduated"),
-    ]
+    st.markdown(f"<style>{PEOPLE_CSS}</style>", unsafe_allow_html=True)
 
     # -------------------------------------------------
     # RENDER GROUPS
     # -------------------------------------------------
-    for section_title, rule in groups:
-        section_people = [p for p in people if rule(p)]
-        if not section_people:
-            continue
+    for s, (section_title, section_people) in enumerate(people_sections()):
 
         st.markdown(f"### {section_title}")
         cols = st.columns(4)
 
-        for i, p in enumerate(section_people):
+        for i, (p, image) in enumerate(section_people):
             with cols[i % 4]:
 
-                st.image(p["image"], use_container_width=True)
+                if image:
+                    st.image(image, use_container_width=True)
                 st.markdown("<div style='height:10px'></div>", unsafe_allow_html=True)
 
                 # ---- NAME BOX ----
                 st.markdown(
                     f"""
                     <div class="name-box">
-                        <div class="name-box-name">{p['name']}</div>
+                        <div class="name-box-name">{p.name}</div>
                         <div class="name-box-role">{subtitle_text(p)}</div>
                     </div>
                     <div style="height:12px;"></div>
@@ -173,22 +241,31 @@ def render():
                 with st.popover("View details", use_container_width=True):
 
                     st.markdown(
-                        f"<h3 class='popover-name'>{p['name']}</h3>",
+                        f"<h3 class='popover-name'>{p.name}</h3>",
                         unsafe_allow_html=True
                     )
 
                     st.caption(subtitle_text(p))
 
-                    if p["bio"]:
-                        st.write(p["bio"])
+                    if p.bio:
+                        st.write(p.bio)
 
-                    if p["research"]:
+                    if p.research:
                         st.markdown("**Research Interests**")
-                        for r in p["research"]:
+                        for r in p.research:
                             st.markdown(f"- {r}")
 
-                    if p["link"]:
+                    if p.link:
                         st.markdown("**Profile / Website**")
-                        url = normalize_link(p["link"])
+                        url = normalize_link(p.link)
                         st.markdown(f"- 🔗 [Visit profile]({url})")
 
+                    # Keyed by position: two people may share a person_id
+                    # (same name, no id), and widget keys must be unique.
+                    st.button(
+                        "View profile",
+                        key=f"profile_{s}_{i}",
+                        on_click=open_profile,
+                        args=(authors.person_id(p),),
+                    )
+
@@ -1,245 +1,138 @@
 import streamlit as st
-import pandas as pd
-import os
+
+from core import cards, citations, listing, profiler
 
 # -------------------------------------------------
-# LOAD DATA
+# PAGE TEXT
 # -------------------------------------------------
-@st.cache_data
-def load_publications():
-    df = pd.read_excel("data/publications.xlsx")
-    df.columns = df.columns.str.strip().str.lower()
-    return df
+# Shared with the static export (export.py).
+HERO = """
+<div style="
+    background: linear-gradient(135deg, #ff5f9e, #ff87b2, #ffc1d9);
+    padding: 48px 40px;
+    border-radius: 24px;
+    margin-bottom: 40px;
+    color: white;
+">
+    <h1 style="margin-bottom: 12px;">Publications</h1>
+    <p style="font-size: 16px; max-width: 760px;">
+        Peer-reviewed journal articles, conference papers, and scholarly
+        outputs produced by the Nanotechnology Research Laboratory.
+    </p>
+</div>
+"""
 
 # -------------------------------------------------
-# HELPERS
+# LOAD DATA
 # -------------------------------------------------
-def clean_text(value):
-    return "" if pd.isna(value) else str(value).strip()
-
-def resolve_image(image_value):
-    if pd.isna(image_value):
-        return "assets/publications/placeholder.png"
-
-    base = os.path.splitext(str(image_value))[0]
-    for ext in [".png", ".jpg", ".jpeg"]:
-        path = f"assets/publications/{base}{ext}"
-        if os.path.exists(path):
-            return path
-
-    return "assets/publications/placeholder.png"
+# Builds (or fetches) the records, search index and facets behind the
+# list, so the first call after a data change shows the load cost.
+@profiler.profiled("loader:publications", rows=lambda selection: len(selection.ids))
+def load_publications(query, selected, mode):
+    return listing.select("publications", query, selected, mode)
 
 # -------------------------------------------------
-# RENDER TAB
+# FILTERS & RESULTS
 # -------------------------------------------------
-def render():
-
-    pubs_df = load_publications()
-
-    # -------------------------------------------------
-    # HERO SECTION
-    # -------------------------------------------------
-    st.markdown(
-        """
-        <div style="
-            background: linear-gradient(135deg, #ff5f9e, #ff87b2, #ffc1d9);
-            padding: 48px 40px;
-            border-radius: 24px;
-            margin-bottom: 40px;
-            color: white;
-        ">
-            <h1 style="margin-bottom: 12px;">Publications</h1>
-            <p style="font-size: 16px; max-width: 760px;">
-                Peer-reviewed journal articles, conference papers, and scholarly
-                outputs produced by the Nanotechnology Research Laboratory.
-            </p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
-
-    # -------------------------------------------------
-    # STYLES
-    # -------------------------------------------------
-    st.markdown("""
-    <style>
-    .pub-card {
-        background: #fff5fa;
-        padding: 18px;
-        border-radius: 16px;
-        margin-bottom: 18px;
-        box-shadow: 0 6px 18px rgba(255, 95, 158, 0.10);
-    }
-
-    .pub-title-row {
-        display: flex;
-        align-items: center;
-        gap: 10px;
-        flex-wrap: wrap;
-        margin-bottom: 2px;
-    }
-
-    .pub-title {
-        font-size: 18px;
-        font-weight: 600;
-        color: #2b2b2b;
-    }
-
-    .featured-tag {
-        background: rgba(255, 95, 158, 0.18);
-        color: #b4004e;
-        padding: 3px 10px;
-        border-radius: 999px;
-        font-size: 12px;
-        font-weight: 600;
-    }
-
-    .pub-authors {
-        font-size: 14px;
-        color: #555;
-        margin-bottom: 2px;
-    }
-
-    .pub-journal {
-        font-size: 13px;
-        color: #777;
-        margin-bottom: 6px;
-    }
-
-    .pub-tag {
-        background: rgba(255, 95, 158, 0.18);
-        color: #b4004e;
-        padding: 4px 10px;
-        border-radius: 999px;
-        font-size: 12px;
-        margin-right: 6px;
-        display: inline-block;
-        margin-top: 6px;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+# Runs as a fragment: typing in the search box, changing keywords or
+# loading more reruns only this function, not the whole app.
+@st.fragment
+@profiler.profiled("fragment:publications")
+def render_results():
+    # Facet counts depend on the query and the current selection, so the
+    # widget values are read from session state before drawing them.
+    query = st.session_state.get("pub_search", "")
+    selected = st.session_state.get("pub_tag_filter", [])
+    mode = st.session_state.get("pub_tag_mode", "any")
+    selection = load_publications(query, selected, mode)
 
-    # -------------------------------------------------
-    # PARSE PUBLICATIONS
-    # -------------------------------------------------
-    publications = []
-    all_tags = set()
-
-    for _, row in pubs_df.iterrows():
-        tags = (
-            [t.strip() for t in str(row.get("keywords")).split(";")]
-            if pd.notna(row.get("keywords"))
-            else []
-        )
-
-        all_tags.update(tags)
-
-        publications.append({
-            "id": clean_text(row.get("id")),
-            "year": int(row.get("year")),
-            "title": clean_text(row.get("title")),
-            "authors": clean_text(row.get("authors")),
-            "tags": sorted(tags),
-            "abstract": clean_text(row.get("abstract")),
-            "image": resolve_image(row.get("image")),
-            "link": clean_text(row.get("link")),
-            "contact": clean_text(row.get("contact")),
-            "journal": clean_text(row.get("journal")),
-            "featured": bool(row.get("featured", False)),
-        })
-
-    publications.sort(key=lambda x: x["year"], reverse=True)
-
-    # -------------------------------------------------
-    # FILTERS
-    # -------------------------------------------------
     col1, col2 = st.columns([2, 3])
 
     with col1:
-        tag_filter = st.multiselect(
+        st.multiselect(
             "Filter by keywords",
-            sorted(all_tags),
+            list(selection.counts),
+            format_func=lambda t: f"{t} ({selection.counts[t]})",
             key="pub_tag_filter"
         )
+        st.radio(
+            "Keyword match",
+            ["any", "all"],
+            format_func=lambda m: "Any keyword (OR)" if m == "any" else "All keywords (AND)",
+            horizontal=True,
+            label_visibility="collapsed",
+            key="pub_tag_mode"
+        )
 
     with col2:
-        search_query = st.text_input(
+        st.text_input(
             "Search publications",
             placeholder="Title, author, keyword, journal…",
             key="pub_search"
         )
 
-    if tag_filter:
-        publications = [
-            p for p in publications
-            if any(t in p["tags"] for t in tag_filter)
-        ]
-
-    if search_query:
-        q = search_query.lower()
-        publications = [
-            p for p in publications
-            if q in p["title"].lower()
-            or q in p["authors"].lower()
-            or q in p["abstract"].lower()
-            or q in p["journal"].lower()
-            or any(q in t.lower() for t in p["tags"])
-        ]
-
     # -------------------------------------------------
-    # GROUP BY YEAR
+    # CITATION EXPORT
     # -------------------------------------------------
-    years = sorted({p["year"] for p in publications}, reverse=True)
-
-    for year in years:
-        year_pubs = [p for p in publications if p["year"] == year]
-        if not year_pubs:
-            continue
-
-        st.markdown(f"## {year}")
-
-        for p in year_pubs:
-
-            st.markdown("<div class='pub-card'>", unsafe_allow_html=True)
-
-            col_img, col_txt = st.columns([1, 4])
-
-            with col_img:
-                st.image(p["image"], use_container_width=True)
-
-            with col_txt:
-                st.markdown(
-                    f"""
-                    <div class="pub-title-row">
-                        <div class="pub-title">{p['title']}</div>
-                        {("<div class='featured-tag'>Featured</div>" if p["featured"] else "")}
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
+    with st.popover("Export citations"):
+        fmt = st.selectbox(
+            "Format",
+            list(citations.FORMATS),
+            format_func=lambda f: citations.FORMATS[f].label,
+            key="pub_cite_format"
+        )
+        filtered = st.radio(
+            "Entries",
+            [True, False],
+            format_func=lambda f: "Current results" if f else "All publications",
+            horizontal=True,
+            key="pub_cite_filtered"
+        )
+        total = len(selection.ids) if filtered else len(listing.select("publications").ids)
+
+        # Built on click, off the script thread, and cached per data
+        # version and filter state.
+        st.download_button(
+            f"Download {total} entries",
+            data=lambda: citations.export(fmt, query, tuple(selected), mode, filtered),
+            file_name=f"publications.{citations.FORMATS[fmt].extension}",
+            mime=citations.FORMATS[fmt].mime,
+            on_click="ignore",
+            disabled=not total,
+            key="pub_cite_download"
+        )
 
-                if p["authors"]:
-                    st.markdown(f"<div class='pub-authors'>{p['authors']}</div>", unsafe_allow_html=True)
+    # -------------------------------------------------
+    # VISIBLE SLICE
+    # -------------------------------------------------
+    limit = listing.page_limit("pub_visible", (query, tuple(selected), mode))
+    if selection.ranked:
+        st.caption(f"{len(selection.ids)} result(s), best matches first")
 
-                if p["journal"]:
-                    st.markdown(f"<div class='pub-journal'>{p['journal']}</div>", unsafe_allow_html=True)
+    # One HTML block per visible slice, shared across sessions.
+    st.markdown(
+        listing.results_html("publications", query, selected, mode, limit),
+        unsafe_allow_html=True
+    )
 
-                if p["tags"]:
-                    st.markdown(
-                        "".join(f"<span class='pub-tag'>{t}</span>" for t in p["tags"]),
-                        unsafe_allow_html=True
-                    )
+    listing.load_more("pub_visible", min(limit, len(selection.ids)), len(selection.ids))
 
-                with st.expander("Abstract & links"):
-                    if p["abstract"]:
-                        st.markdown("**Abstract**")
-                        st.write(p["abstract"])
+# -------------------------------------------------
+# RENDER TAB
+# -------------------------------------------------
+def render():
 
-                    if p["link"]:
-                        st.markdown(f"[Read full paper →]({p['link']})")
+    # -------------------------------------------------
+    # HERO SECTION
+    # -------------------------------------------------
+    st.markdown(HERO, unsafe_allow_html=True)
 
-                    if p["contact"]:
-                        st.markdown("**Contact**")
-                        st.write(p["contact"])
+    # -------------------------------------------------
+    # STYLES
+    # -------------------------------------------------
+    st.markdown(
+        f"<style>{cards.PUBLICATION_CSS}{cards.DETAILS_CSS}</style>",
+        unsafe_allow_html=True
+    )
 
-            st.markdown("</div>", unsafe_allow_html=True)
+    render_results()
@@ -1,5 +1,158 @@
 import streamlit as st
 
+from core import profiler, psd
+
+# -------------------------------------------------
+# PARTICLE SIZE ANALYSIS
+# -------------------------------------------------
+PSD_FORMATS = (
+    "CSV, TXT or Excel. Either one size per particle (e.g. from image "
+    "analysis) or a binned distribution: one row per size class with the "
+    "amount in it (counts, number % or volume %, e.g. from laser diffraction)."
+)
+PSD_INPUTS = {"list": "Particle sizes", "binned": "Binned distribution"}
+PSD_UNITS = ["µm", "nm", "mm"]
+PSD_STATS = {
+    "d10": "D10", "d50": "D50", "d90": "D90", "span": "Span",
+    "mean": "Mean", "std": "Std. deviation", "geo_mean": "Geometric mean",
+    "geo_std": "Geometric std.", "mode": "Mode",
+}
+
+
+def _psd_chart(table, basis, unit):
+    import altair as alt
+
+    label = psd.BASES[basis]
+    data = table.rename(columns={
+        f"{basis} %": "share", f"cumulative {basis} %": "cumulative",
+    })
+    x = alt.X("size:Q", scale=alt.Scale(type="log"), title=f"Size ({unit})")
+    share = alt.Chart(data).mark_area(
+        color="#ff87b2", opacity=0.6, interpolate="step-after"
+    ).encode(x, alt.Y("share:Q", title=f"{label} %"))
+    cumulative = alt.Chart(data).mark_line(color="#ff5f9e").encode(
+        x, alt.Y("cumulative:Q", title=f"Cumulative {label.lower()} %", scale=alt.Scale(domain=[0, 100]))
+    )
+    return alt.layer(share, cumulative).resolve_scale(y="independent")
+
+
+def render_psd():
+    st.subheader("Particle Size Analysis")
+    st.caption(PSD_FORMATS)
+
+    upload = st.file_uploader(
+        "Particle size data",
+        type=["csv", "txt", "xlsx", "xls"],
+        key="psd_upload"
+    )
+    if upload is None:
+        return
+
+    raw = upload.getvalue()
+    try:
+        names, size_guess, amount_guess = psd.columns(raw, upload.name)
+    except Exception as exc:
+        st.error(f"Could not read {upload.name}: {exc}")
+        return
+
+    # ---- INPUT OPTIONS ----
+    col_a, col_b, col_c, col_d = st.columns(4)
+    with col_a:
+        kind = st.radio(
+            "Data",
+            list(PSD_INPUTS),
+            index=1 if amount_guess else 0,
+            format_func=PSD_INPUTS.get,
+            key="psd_kind"
+        )
+        unit = st.selectbox("Unit", PSD_UNITS, key="psd_unit")
+    with col_b:
+        size = st.selectbox("Size column", names, index=names.index(size_guess), key="psd_size")
+    amount, basis = None, "number"
+    if kind == "binned":
+        others = [n for n in names if n != size]
+        if not others:
+            st.warning("A binned distribution needs a second column with the amount per size class.")
+            return
+        with col_c:
+            amount = st.selectbox(
+                "Amount column",
+                others,
+                index=others.index(amount_guess) if amount_guess in others else 0,
+                key="psd_amount"
+            )
+        with col_d:
+            basis = st.radio(
+                "Amount is",
+                list(psd.BASES),
+                index=1 if "vol" in amount.lower() else 0,
+                format_func=lambda b: f"{psd.BASES[b]} based",
+                key="psd_basis"
+            )
+
+    # Cached by the file's content hash and these options.
+    try:
+        result = profiler.profiled("loader:psd", rows=lambda r: r.particles)(psd.summarize)(raw, upload.name, size, amount, basis)
+    except ValueError as exc:
+        st.error(str(exc))
+        return
+
+    counted = "particles" if result.kind == "list" else "size classes"
+    note = f"{result.particles:,} {counted}"
+    if result.dropped:
+        note += f"; {result.dropped:,} rows without a positive size were skipped"
+    st.caption(note)
+
+    # ---- KEY METRICS ----
+    weighting = st.radio(
+        "Weighting",
+        list(psd.BASES),
+        index=1 if basis == "volume" else 0,
+        format_func=lambda b: f"{psd.BASES[b]} weighted",
+        horizontal=True,
+        key="psd_weighting"
+    )
+    stats = result.stats[weighting]
+    for col, field in zip(st.columns(4), ("d10", "d50", "d90", "span")):
+        value = getattr(stats, field)
+        col.metric(PSD_STATS[field], f"{value:.3g}" if field == "span" else f"{value:.3g} {unit}")
+
+    st.altair_chart(_psd_chart(result.table, weighting, unit), width="stretch")
+
+    # ---- SUMMARY STATISTICS ----
+    col_a, col_b = st.columns([2, 1])
+    with col_a:
+        st.dataframe(
+            {
+                "Statistic": list(PSD_STATS.values()),
+                **{
+                    label: [f"{v:.4g}" for v in result.stats[b]]
+                    for b, label in psd.BASES.items()
+                },
+            },
+            hide_index=True,
+            width="stretch"
+        )
+    with col_b:
+        st.dataframe(
+            {
+                "Mean diameter": list(result.moments),
+                f"Value ({unit})": [f"{v:.4g}" for v in result.moments.values()],
+            },
+            hide_index=True,
+            width="stretch"
+        )
+
+    st.download_button(
+        "Download distribution (CSV)",
+        data=result.table.to_csv(index=False),
+        file_name=f"{upload.name.rsplit('.', 1)[0]}_psd.csv",
+        mime="text/csv",
+        on_click="ignore",
+        key="psd_download"
+    )
+
+
 # -------------------------------------------------
 # RENDER TAB
 # -------------------------------------------------
@@ -41,8 +194,8 @@ def render():
             border-left: 6px solid #ff5f9e;
             font-weight: 500;
         ">
-            Tools are currently under development.<br>
-            Previews shown below.
+            The Particle Size Analysis Tool is available below.<br>
+            The other tools are under development; previews shown.
         </div>
         """,
         unsafe_allow_html=True
@@ -59,8 +212,8 @@ def render():
                 "image-based data. Generates PSD plots, D10/D50/D90 metrics, "
                 "and summary statistics."
             ),
-            "status": "Work in progress",
-            "access": "Free (planned)",
+            "status": "Available",
+            "access": "Free",
         },
         {
             "name": "Crystallization Imaging Tool",
@@ -122,7 +275,7 @@ def render():
             with col_a:
                 st.caption("Status")
                 st.markdown(
-                    """
+                    f"""
                     <div style="
                         background: #eaf8ec;
                         padding: 8px 12px;
@@ -132,7 +285,7 @@ def render():
                         color: #1b7f3b;
                         font-weight: 500;
                     ">
-                        Work in progress
+                        {tool['status']}
                     </div>
                     """,
                     unsafe_allow_html=True
@@ -159,10 +312,17 @@ def render():
 
             st.markdown(
                 "<div style='margin-top:16px; font-size:13px; color:#777;'>"
-                "More details coming soon</div>",
+                + ("Try it below" if tool["status"] == "Available" else "More details coming soon")
+                + "</div>",
                 unsafe_allow_html=True
             )
 
+    # -------------------------------------------------
+    # PARTICLE SIZE ANALYSIS
+    # -------------------------------------------------
+    st.divider()
+    render_psd()
+
     # -------------------------------------------------
     # FOOTER / CTA
     # -------------------------------------------------
@@ -0,0 +1,40 @@
+from core import authors, records
+
+
+def _person(id_, name):
+    return records.Person(id_, name, "", "", "", "", "", (), "", "")
+
+
+INDEX = authors._index([
+    _person("delacruz", "Isaac Jerome C. Dela Cruz"),
+    _person("perez", "Juan Vicente Perez"),
+    _person("santos", "Maria Santos"),
+])
+
+
+def test_parse_forms():
+    assert authors.parse("Dela Cruz et al.") == authors.Name((), ("dela", "cruz"))
+    assert authors.parse("Perez JV") == authors.Name(("j", "v"), ("perez",))
+    assert authors.parse("I. J. Cruz") == authors.Name(("i", "j"), ("cruz",))
+    assert authors.parse("Delacruz, Isaac") == authors.Name(("isaac",), ("delacruz",))
+    assert authors.parse("Juan dela Cruz") == authors.Name(("juan",), ("dela", "cruz"))
+
+
+def test_match_forms():
+    for author in ("Dela Cruz", "Dela Cruz et al.", "I. J. Cruz", "Delacruz, Isaac", "IJC Dela Cruz"):
+        assert authors._match(INDEX, author) == "delacruz", author
+    assert authors._match(INDEX, "Perez JV") == "perez"
+    assert authors._match(INDEX, "M. Santos") == "santos"
+
+
+def test_no_match():
+    assert authors._match(INDEX, "R. Santos") is None
+    assert authors._match(INDEX, "A. Reyes") is None
+
+
+def test_inverted():
+    assert authors.inverted("Isaac Jerome C. Dela Cruz") == "Dela Cruz, Isaac Jerome C."
+    assert authors.inverted("Juan de los Santos") == "de los Santos, Juan"
+    assert authors.inverted("Dr. Juan Perez Jr.") == "Perez, Jr., Juan"
+    assert authors.inverted("Perez JV") == "Perez, JV"
+    assert authors.inverted("Delacruz, Isaac") == "Delacruz, Isaac"
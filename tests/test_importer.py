@@ -0,0 +1,55 @@
+from core import importer
+
+
+def _parse(text):
+    return list(importer.parse_bibtex(text.splitlines(keepends=True)))
+
+
+def test_bibtex_last_field_in_braces():
+    (entry,) = _parse("@article{k, title={Some Title}, year={2023}}\n")
+    assert entry["title"] == "Some Title"
+    assert entry["year"] == "2023"
+
+
+def test_bibtex_multiline_last_field_in_braces():
+    (entry,) = _parse(
+        "@article{k,\n"
+        "  year = 2021,\n"
+        "  title = {Some {DNA} Title}}\n"
+    )
+    assert entry["year"] == "2021"
+    assert entry["title"] == "Some DNA Title"
+
+
+def test_bibtex_trailing_comma():
+    (entry,) = _parse('@article{k, title = "Quoted", year = {2020},\n}\n')
+    assert entry["title"] == "Quoted"
+    assert entry["year"] == "2020"
+
+
+def test_crossref_markup_stripped():
+    fields = importer._from_crossref({
+        "title": ["Crossref <i>paper</i> on TiO<sub>2</sub>"],
+        "container-title": ["<i>Journal</i> of Growth"],
+    })
+    assert fields["title"] == "Crossref paper on TiO2"
+    assert fields["journal"] == "Journal of Growth"
+
+
+def test_bibtex_dotless_i():
+    (entry,) = _parse("@article{k, author = {Garc{\\'\\i}a, Ana}, title = {X}}\n")
+    assert entry["author"] == "García, Ana"
+
+
+def test_bibtex_string_macros():
+    (entry,) = _parse(
+        '@string{jcg = "Journal of Crystal Growth"}\n'
+        "@article{k,\n"
+        "  journal = jcg,\n"
+        "  note = jcg # { Letters},\n"
+        "  year = 2022\n"
+        "}\n"
+    )
+    assert entry["journal"] == "Journal of Crystal Growth"
+    assert entry["note"] == "Journal of Crystal Growth Letters"
+    assert entry["year"] == "2022"
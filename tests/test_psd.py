@@ -0,0 +1,19 @@
+from core import psd
+
+
+def test_empty_classes_are_not_interpolation_points():
+    result = psd.analyze([1, 2, 3], [0, 100, 0])
+    assert result.stats["number"][:3] == (2.0, 2.0, 2.0)
+
+
+def test_single_column_header_with_spaces():
+    raw = b"Particle size (um)\n1.5\n2.0\n2.5\n"
+    names, size, amount = psd.columns(raw, "sizes.txt")
+    assert names == ["Particle size (um)"]
+    assert (size, amount) == ("Particle size (um)", None)
+    assert psd.summarize(raw, "sizes.txt", size).stats["number"].d50 == 2.0
+
+
+def test_delimited_header_with_spaces():
+    raw = b"Size (um);Volume %\n1;20\n2;50\n4;30\n"
+    assert psd.columns(raw, "laser.csv") == (["Size (um)", "Volume %"], "Size (um)", "Volume %")